@@ -0,0 +1,3 @@
+"""
+Benchmark suite of the Rocket Forge hot paths, see `benchmarks.run`.
+"""
@@ -0,0 +1,287 @@
+"""
+Benchmark suite of the Rocket Forge hot paths.
+
+Every benchmark runs on the reference designs of `benchmarks/designs` (or on
+the project files given on the command line), which are loaded headlessly
+through `rocketforge.batch`. Timings are written as JSON so that two
+versions can be compared.
+
+Usage (from the repository root):
+    python -m benchmarks.run --output after.json
+    python -m benchmarks.run --only regen --repeat 10
+    python -m benchmarks.run --compare before.json after.json
+"""
+import os
+import sys
+import glob
+import json
+import time
+import platform
+import argparse
+import statistics
+import subprocess
+from dataclasses import dataclass
+from typing import Callable
+import numpy as np
+from tabulate import tabulate
+import rocketforge.batch as batch
+import rocketforge.performance.config as pconf
+import rocketforge.thermal.config as tconf
+import rocketforge.geometry.conical as conical
+import rocketforge.geometry.convergent as convergent
+import rocketforge.geometry.top as top
+import rocketforge.performance.cea as cea
+import rocketforge.performance.stations as stations
+from rocketforge.performance.cea import cache
+from rocketforge.performance.theoreticalperf import theoretical
+from rocketforge.utils.conversions import pressure_uom
+
+
+DESIGNS_DIR = os.path.join(os.path.dirname(__file__), "designs")
+# Nozzle stations of the theoretical performance benchmarks
+THEORETICAL_STATIONS = (1, 5, 20)
+# Axial stations of the regenerative cooling benchmarks
+REGEN_STATIONS = (100, 200, 1000)
+# Number of channels of the cooling jacket mesh benchmarks
+MESH_CHANNELS = (100, 400)
+# Points per axis of the nested sweep benchmark (mr, pc, epsc, eps)
+SWEEP_POINTS = (4, 4, 1, 4)
+# Relative change above which a comparison is reported as a regression/improvement
+COMPARE_THRESHOLD = 0.05
+
+
+@dataclass
+class Benchmark:
+    """
+    A timed case. `setup` runs before every repetition (untimed) and returns
+    the arguments of `run`.
+    """
+    group: str
+    name: str
+    run: Callable
+    setup: Callable[[], tuple] = tuple
+
+
+def load_design(path: str) -> None:
+    """Loads a project file into the config modules, up to the delivered performance."""
+    batch.reset_config()
+    project = batch.read_project(path)
+    batch.load_film(project)
+    batch.run_initial(project)
+    batch.run_performance(project)
+    if project.has_section("Thermal"):
+        batch.load_thermal(project)
+
+
+def clear_memos() -> None:
+    """
+    Empties the in-process memos of the CEA path (station solves and CEA
+    objects), so that every repetition pays for its CEA solves rather than
+    for memo hits left by the warmup run.
+    """
+    stations._solve.cache_clear()
+    cea._get_cea.cache_clear()
+
+
+def theoretical_cases(path: str) -> list:
+    def setup(n: int) -> tuple:
+        clear_memos()
+        return (n + 1, 0, 0)
+
+    return [
+        Benchmark("theoretical", f"stations={n}", theoretical, lambda n=n: setup(n))
+        for n in THEORETICAL_STATIONS
+    ]
+
+
+def regen_cases(path: str) -> list:
+    from rocketforge.thermal.regenerative import Regen
+    project = batch.read_project(path)
+    s = project["Thermal"]
+    p_ci = float(s["coolant_pi"]) * pressure_uom(s["coolant_pi_uom"])
+
+    def setup(n: int, dp: bool) -> tuple:
+        tconf.n_stations = n
+        tconf.enable_dp = dp
+        tconf.p_ci = pconf.pc * tconf.pcoOvpc if dp else p_ci
+        return (Regen(),)
+
+    return [
+        Benchmark("regen", f"stations={n},dp={dp}", lambda regen: regen.run(), lambda n=n, dp=dp: setup(n, dp))
+        for n in REGEN_STATIONS for dp in (False, True)
+    ]
+
+
+def mesh_cases(path: str) -> list:
+    from rocketforge.thermal.regenerative import Regen
+    import rocketforge.thermal.channels as channels
+    regen = Regen()
+    regen.run()
+
+    def mesh(NC: int) -> None:
+        # Channels and ribs are narrowed so that the jacket keeps its circumference
+        scale = tconf.NC / NC
+        channels.build_meshes(regen.x, regen.R, regen.a * scale, regen.b, regen.delta * scale, NC, tconf.t_w, tconf.t_eOvt_w)
+
+    return [Benchmark("mesh", f"NC={NC}", mesh, lambda NC=NC: (NC,)) for NC in MESH_CHANNELS]
+
+
+def geometry_cases(path: str) -> list:
+    from rocketforge.thermal.regenerative import get_geometry
+    At, eps, epsc = pconf.At, pconf.eps, pconf.epsc
+    b = np.radians(tconf.b)
+    if tconf.shape == 1:
+        divergent = Benchmark("geometry", "top",
+                              lambda: top.get(At, tconf.RnOvRt, tconf.L_e, np.radians(tconf.thetan), np.radians(tconf.thetae), eps))
+    else:
+        divergent = Benchmark("geometry", "conical",
+                              lambda: conical.get(At, tconf.RnOvRt, eps, tconf.L_e, np.radians(tconf.thetae)))
+    return [
+        Benchmark("geometry", "convergent",
+                  lambda: convergent.get(At, tconf.R1OvRt, tconf.L_c, b, tconf.R2OvR2max, epsc)),
+        divergent,
+        Benchmark("geometry", "chamber", get_geometry),
+    ]
+
+
+def sweep_cases(path: str) -> list:
+    from rocketforge.nested.sweep import run_sweep
+    context = {"ox": pconf.ox, "fuel": pconf.fuel, "pe": pconf.pe, "exit_mode": "eps", "exit_factor": 1.0}
+    n_mr, n_pc, n_epsc, n_eps = SWEEP_POINTS
+    grid = np.meshgrid(
+        np.linspace(0.8, 1.2, n_mr) * pconf.mr,
+        np.linspace(0.5, 1.5, n_pc) * pconf.pc,
+        np.full(n_epsc, pconf.epsc),
+        np.linspace(0.5, 1.5, n_eps) * pconf.eps,
+        indexing="ij",
+    )
+    def setup() -> tuple:
+        clear_memos()
+        return ()
+
+    return [Benchmark("sweep", f"cells={grid[0].size}", lambda: run_sweep(context, grid, workers=1), setup)]
+
+
+# Benchmark groups, in execution order
+GROUPS = {
+    "theoretical": theoretical_cases,
+    "regen": regen_cases,
+    "mesh": mesh_cases,
+    "geometry": geometry_cases,
+    "sweep": sweep_cases,
+}
+
+
+def measure(benchmark: Benchmark, repeat: int, warmup: int = 1) -> dict:
+    """Times `repeat` runs of a benchmark after `warmup` untimed runs."""
+    times = []
+    for i in range(warmup + repeat):
+        args = benchmark.setup()
+        start = time.perf_counter()
+        benchmark.run(*args)
+        elapsed = time.perf_counter() - start
+        if i >= warmup:
+            times.append(elapsed)
+    return {
+        "repeat": repeat,
+        "min": min(times),
+        "median": statistics.median(times),
+        "mean": statistics.mean(times),
+        "stdev": statistics.stdev(times) if len(times) > 1 else 0.0,
+    }
+
+
+def metadata(args) -> dict:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(DESIGNS_DIR)
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "repeat": args.repeat,
+        "cea_cache": args.cea_cache,
+    }
+
+
+def run_suite(args) -> dict:
+    designs = args.designs or sorted(glob.glob(os.path.join(DESIGNS_DIR, "*.rf")))
+    groups = args.only or list(GROUPS)
+    cache.enabled = args.cea_cache
+    results = []
+    for path in designs:
+        design = os.path.splitext(os.path.basename(path))[0]
+        for group in groups:
+            try:
+                load_design(path)
+                benchmarks = GROUPS[group](path)
+            except Exception as err:
+                print(f"{design}/{group}: setup failed ({type(err).__name__}: {err})", file=sys.stderr)
+                continue
+            for benchmark in benchmarks:
+                try:
+                    stats = measure(benchmark, args.repeat)
+                except Exception as err:
+                    print(f"{design}/{group}/{benchmark.name}: failed ({type(err).__name__}: {err})", file=sys.stderr)
+                    continue
+                results.append({"design": design, "group": group, "name": benchmark.name, **stats})
+                print(f"{design}/{group}/{benchmark.name}: {stats['median'] * 1e3:.2f} ms", file=sys.stderr)
+    return {"meta": metadata(args), "results": results}
+
+
+def compare(baseline: dict, current: dict) -> str:
+    """Tabulates the median times of two runs of the suite."""
+    def key(result):
+        return result["design"], result["group"], result["name"]
+
+    before = {key(r): r for r in baseline["results"]}
+    rows = []
+    for result in current["results"]:
+        old = before.get(key(result))
+        if old is None:
+            continue
+        ratio = result["median"] / old["median"]
+        if ratio > 1 + COMPARE_THRESHOLD:
+            verdict = "slower"
+        elif ratio < 1 - COMPARE_THRESHOLD:
+            verdict = "faster"
+        else:
+            verdict = ""
+        rows.append(["/".join(key(result)), old["median"] * 1e3, result["median"] * 1e3, ratio, verdict])
+    headers = [
+        "Benchmark", f"{baseline['meta'].get('commit')} [ms]", f"{current['meta'].get('commit')} [ms]", "Ratio", ""
+    ]
+    return tabulate(rows, headers, floatfmt=".3f")
+
+
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run", description="Rocket Forge benchmark suite.")
+    parser.add_argument("designs", nargs="*", help=".rf project files (default: the reference designs)")
+    parser.add_argument("--only", nargs="+", choices=list(GROUPS), help="benchmark groups to run")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per benchmark (default: 5)")
+    parser.add_argument("--cea-cache", action="store_true", help="answer CEA queries from the persistent cache")
+    parser.add_argument("-o", "--output", default="benchmarks.json", help="JSON output file (default: benchmarks.json)")
+    parser.add_argument("--compare", nargs=2, metavar=("BASELINE", "CURRENT"), help="compare two JSON outputs and exit")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        with open(args.compare[0]) as f, open(args.compare[1]) as g:
+            print(compare(json.load(f), json.load(g)))
+        return 0
+
+    report = run_suite(args)
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"{len(report['results'])} benchmarks written to {args.output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,14 @@
+import multiprocessing
 import tkinter as tk
 import customtkinter as ctk
 import rocketforge.performance.config as conf
 import rocketforge.utils.config as config
+from rocketforge.performance.cea import profiler as cea_profiler
+from rocketforge.performance.design import DesignState
+from rocketforge.performance.sizing import size_throat
+from rocketforge.utils.pipeline import Pipeline, Stage, widget_state
+from rocketforge.utils.tracing import tracer
+from rocketforge.utils.logger import logger
 from rocketforge.gui.initialframe   import InitialFrame
 from rocketforge.gui.performance    import PerformanceFrame
 from rocketforge.gui.geometry       import GeometryFrame
@@ -17,8 +24,32 @@ from PIL                            import Image
 version = "1.0.0"
 copyright = "(C) 2023-2024 Polito Rocket Team"
 
+# Tab frames, in sidebar order
+TABS = {
+    "initialframe": InitialFrame,
+    "performanceframe": PerformanceFrame,
+    "geometryframe": GeometryFrame,
+    "nestedframe": NestedFrame,
+    "thermalframe": ThermalFrame,
+    "tanksframe": TanksFrame,
+    "missionframe": MissionFrame,
+}
+
+
+def _tab(name):
+    """Attribute building the tab frame `name` on its first access."""
+    return property(lambda self: self.get_frame(name))
+
 
 class RocketForge(CTk):
+    initialframe = _tab("initialframe")
+    performanceframe = _tab("performanceframe")
+    geometryframe = _tab("geometryframe")
+    nestedframe = _tab("nestedframe")
+    thermalframe = _tab("thermalframe")
+    tanksframe = _tab("tanksframe")
+    missionframe = _tab("missionframe")
+
     def __init__(self, *args, **kwargs):
         ctk.set_appearance_mode("system")
         ctk.set_default_color_theme(resource_path("theme.json"))
@@ -36,33 +67,11 @@ class RocketForge(CTk):
             ),
         )
 
-        # Initial data frame
-        self.initialframe = InitialFrame(self)
-        self.initialframe.grid(column=1, row=0)
-
-        # Performance frame
-        self.performanceframe = PerformanceFrame(self)
-        self.performanceframe.grid(column=1, row=0)
-
-        # Geometry frame
-        self.geometryframe = GeometryFrame(self)
-        self.geometryframe.grid(column=1, row=0)
-
-        # Nested analysis frame
-        self.nestedframe = NestedFrame(self)
-        self.nestedframe.grid(column=1, row=0)
-
-        # Thermal analysis frame
-        self.thermalframe = ThermalFrame(self)
-        self.thermalframe.grid(column=1, row=0)
-
-        # Tanks design frame
-        self.tanksframe = TanksFrame(self)
-        self.tanksframe.grid(column=1, row=0)
-
-        # Mission analysis frame
-        self.missionframe = MissionFrame(self)
-        self.missionframe.grid(column=1, row=0)
+        # Tab frames are built on their first access (see `get_frame`). Until
+        # then their state is the one of the config modules, plus the project
+        # file sections waiting in `pending_state`.
+        self.tabs = {}
+        self.pending_state = {}
 
         # Sidebar
         self.sidebar = CTkFrame(self)
@@ -172,6 +181,13 @@ class RocketForge(CTk):
         # Raise initial frame
         self.initialframe.tkraise()
 
+        # Analysis stages
+        self.pipeline = self.build_pipeline()
+
+        # CEA profiler report (F9) and reset (Shift+F9)
+        self.bind("<F9>", lambda _: self.cea_report())
+        self.bind("<Shift-F9>", lambda _: cea_profiler.reset())
+
         # Top level windows
         self.about = None
         self.preferences = None
@@ -181,103 +197,217 @@ class RocketForge(CTk):
         self.deiconify()
 
     def run(self):
+        """
+        Runs the analysis pipeline. Only the stages whose inputs changed since
+        the last run, and the stages depending on them, are recomputed.
+        """
         self.statuslabel.configure(text="Status: starting...")
         self.statuslabel.update()
 
-        try:
-            self.statuslabel.configure(text="Status: running...")
-            self.statuslabel.update()
-            self.initialframe.run()
-        except Exception:
-            pass
+        with tracer.run("Run"):
+            self.pipeline.run()
 
-        try:
-            self.statuslabel.configure(text="Status: loading regenerative cooling...")
-            self.statuslabel.update()
-            self.thermalframe.load_regen_cooling()
-        except Exception:
-            self.thermalframe.regenvar.set(False)
-            self.thermalframe.toggle_regen_cooling()
+        self.statuslabel.configure(text="Status: idle")
+        self.statuslabel.update()
 
-        try:
-            self.statuslabel.configure(text="Status: loading radiation cooling...")
-            self.statuslabel.update()
-            self.thermalframe.load_rad_cooling()
-        except Exception:
-            self.thermalframe.radvar.set(False)
-            self.thermalframe.toggle_rad_cooling()
+    def cea_report(self):
+        if not cea_profiler.enabled:
+            logger.info("CEA profiler disabled, set RF_CEA_PROFILE=1 to enable it.")
+            return
+        logger.info(f"CEA calls since the last reset:\n{cea_profiler.report()}")
+
+    def get_frame(self, name):
+        """Returns the tab frame `name`, building it below the visible tab on first access."""
+        frame = self.tabs.get(name)
+        if frame is None:
+            frame = self.tabs[name] = TABS[name](self)
+            frame.grid(column=1, row=0)
+            frame.lower()
+            for apply in self.pending_state.pop(name, []):
+                self.restore_state(name, apply)
+        return frame
+
+    def when_built(self, name, apply):
+        """Calls `apply` with the tab frame `name` now if it exists, otherwise when it is built."""
+        if name in self.tabs:
+            self.restore_state(name, apply)
+        else:
+            self.pending_state.setdefault(name, []).append(apply)
 
+    def restore_state(self, name, apply):
         try:
-            self.statuslabel.configure(text="Status: loading film cooling...")
-            self.statuslabel.update()
-            self.thermalframe.load_film_cooling()
+            apply(self.tabs[name])
         except Exception:
-            self.thermalframe.filmvar.set(False)
-            self.thermalframe.toggle_film_cooling()
+            logger.warning(f"Cannot restore the saved state of {name}.")
 
-        try:
-            self.statuslabel.configure(text="Status: computing geometry...")
-            self.statuslabel.update()
+    def in_use(self, name):
+        """Whether the tab `name` was opened or has state loaded from a project file."""
+        return name in self.tabs or name in self.pending_state
+
+    def set_status(self, text):
+        self.statuslabel.configure(text=text)
+        self.statuslabel.update()
+
+    def build_pipeline(self):
+        """Declares the analysis stages, with the config fields they read and write."""
+        thermal_geometry = (
+            "thermal.shape", "thermal.L_cyl", "thermal.L_c", "thermal.L_e", "thermal.RnOvRt", "thermal.R1OvRt",
+            "thermal.R2OvR2max", "thermal.b", "thermal.theta", "thermal.thetan", "thermal.thetae",
+        )
+        transport = (
+            "thermal.gamma", "thermal.gamma_e", "thermal.M_e", "thermal.Pr_0", "thermal.Pr_t", "thermal.Pr_e",
+            "thermal.mu_0", "thermal.cp_0", "thermal.T_c",
+        )
+        theoretical = (
+            "performance.cstar", "performance.Isp_vac", "performance.Isp_vac_fr", "performance.Isp_vac_eq",
+            "performance.Isp_sl", "performance.Isp_opt", "performance.td_props", "performance.gammae",
+            "performance.Me", *transport,
+        )
+        delivered = (
+            "performance.z_r", "performance.z_f", "performance.z_d", "performance.z_n", "performance.z_overall",
+            "performance.k_film", "performance.cstar_d", "performance.m_f_d", "performance.m_ox_d",
+            "performance.CF_d", "performance.thrust_d",
+        )
+        film = ("thermal.film", "thermal.fuelfilm", "thermal.oxfilm")
+
+        def disable_cooling(*methods):
+            def on_error():
+                for method in methods:
+                    getattr(self.thermalframe, f"{method}var").set(False)
+                    getattr(self.thermalframe, f"toggle_{method}_cooling")()
+            return on_error
+
+        def geometry():
             self.geometryframe.estimate_Tn()
             self.geometryframe.plot()
-        except Exception:
-            pass
 
-        try:
-            self.statuslabel.configure(text="Status: computing performance...")
-            self.statuslabel.update()
+        def performance():
             self.performanceframe.run()
             self.estimate_At()
-        except Exception:
-            pass
 
-        try:
-            self.statuslabel.configure(text="Status: running nested analysis...")
-            self.statuslabel.update()
-            self.nestedframe.run()
-        except Exception:
-            pass
-
-        try:
-            self.statuslabel.configure(text="Status: performing thermal analysis...")
-            self.statuslabel.update()
-            self.thermalframe.run()
-        except Exception:
-            self.thermalframe.regenvar.set(False)
-            self.thermalframe.toggle_regen_cooling()
-            self.thermalframe.radvar.set(False)
-            self.thermalframe.toggle_rad_cooling()
-            self.thermalframe.filmvar.set(False)
-            self.thermalframe.toggle_film_cooling()
-
-        try: 
-            self.statuslabel.configure(text="Status: loading tanks...")
-            self.statuslabel.update()
-            self.tanksframe.compute()
-        except Exception:
-            pass
-
-        try:
-            self.statuslabel.configure(text="Status: running flight simulation...")
-            self.statuslabel.update()
-            self.missionframe.run()
-        except Exception:
-            pass
-
-        self.statuslabel.configure(text="Status: idle")
-        self.statuslabel.update()
+        stages = [
+            Stage(
+                "initial", self.initialframe.run,
+                reads=film,
+                writes=(
+                    "performance.ox", "performance.fuel", "performance.pc", "performance.epsc", "performance.mr_s",
+                    "performance.mr", "performance.alpha", "performance.eps", "performance.pe", "performance.c",
+                    "performance.thrust", "performance.pamb", "performance.At", *theoretical,
+                ),
+                inputs=lambda: widget_state(self.initialframe),
+                status="Status: running...",
+            ),
+            Stage(
+                "regen", lambda: self.thermalframe.load_regen_cooling(),
+                reads=("performance.pc", "thermal.pcoOvpc"),
+                writes=(
+                    "thermal.regen", "thermal.coolant", "thermal.m_dot_c", "thermal.T_ci", "thermal.p_ci",
+                    "thermal.enable_dp", "thermal.lambda_w", "thermal.t_w",
+                ),
+                inputs=lambda: widget_state(self.thermalframe),
+                status="Status: loading regenerative cooling...",
+                on_error=disable_cooling("regen"),
+                enabled=lambda: self.in_use("thermalframe"),
+            ),
+            Stage(
+                "rad", lambda: self.thermalframe.load_rad_cooling(),
+                writes=("thermal.rad", "thermal.eps_w"),
+                inputs=lambda: widget_state(self.thermalframe),
+                status="Status: loading radiation cooling...",
+                on_error=disable_cooling("rad"),
+                enabled=lambda: self.in_use("thermalframe"),
+            ),
+            Stage(
+                "film", lambda: self.thermalframe.load_film_cooling(),
+                writes=film,
+                inputs=lambda: widget_state(self.thermalframe),
+                status="Status: loading film cooling...",
+                on_error=disable_cooling("film"),
+                enabled=lambda: self.in_use("thermalframe"),
+            ),
+            Stage(
+                "geometry", geometry,
+                reads=("performance.eps", "performance.epsc", "performance.thrust", "performance.At",
+                       "performance.gammae", "performance.Me"),
+                writes=("performance.At", "performance.Le", "performance.theta_e", *thermal_geometry),
+                inputs=lambda: widget_state(self.geometryframe),
+                status="Status: computing geometry...",
+            ),
+            Stage(
+                "performance", performance,
+                reads=(
+                    "performance.ox", "performance.fuel", "performance.pc", "performance.mr", "performance.eps",
+                    "performance.epsc", "performance.pe", "performance.pamb", "performance.thrust",
+                    "performance.At", "performance.Le", "performance.theta_e", *film,
+                ),
+                writes=(*theoretical, *delivered, "performance.At", "performance.Le", "performance.theta_e",
+                        *thermal_geometry),
+                inputs=lambda: widget_state(self.performanceframe, self.geometryframe),
+                status="Status: computing performance...",
+            ),
+            Stage(
+                "nested", lambda: self.nestedframe.run(),
+                reads=("performance.ox", "performance.fuel", "performance.pe", "performance.mr", "performance.mr_s",
+                       "performance.pc", "performance.epsc", "performance.eps"),
+                inputs=lambda: widget_state(self.nestedframe, exclude=(self.nestedframe.table,)),
+                status="Status: running nested analysis...",
+                enabled=lambda: self.in_use("nestedframe"),
+            ),
+            Stage(
+                "thermal", lambda: self.thermalframe.run(),
+                reads=(
+                    "performance.pc", "performance.At", "performance.eps", "performance.epsc", "performance.cstar_d",
+                    *transport, *thermal_geometry, "thermal.regen", "thermal.rad", "thermal.coolant",
+                    "thermal.m_dot_c", "thermal.T_ci", "thermal.p_ci", "thermal.enable_dp", "thermal.lambda_w",
+                    "thermal.t_w", "thermal.eps_w", "thermal.NC", "thermal.cmode", "thermal.a1", "thermal.a2",
+                    "thermal.a3", "thermal.b1", "thermal.b2", "thermal.b3", "thermal.d1", "thermal.d2", "thermal.d3",
+                    "thermal.pcoOvpc", "thermal.absolute_roughness", "thermal.dp_method", "thermal.max_iter",
+                    "thermal.n_stations", "thermal.stability", "thermal.t_eOvt_w", "thermal.tuning_factor",
+                ),
+                inputs=lambda: widget_state(self.thermalframe),
+                status="Status: performing thermal analysis...",
+                on_error=disable_cooling("regen", "rad", "film"),
+                enabled=lambda: self.in_use("thermalframe"),
+            ),
+            Stage(
+                "tanks", lambda: self.tanksframe.compute(),
+                reads=("performance.m_f_d", "performance.m_ox_d", "performance.mr", *film),
+                writes=(
+                    "mission.MR", "mission.mdot", "mission.ox_rho", "mission.fuel_rho", "mission.r_ox",
+                    "mission.r_fuel", "mission.exc_ox", "mission.exc_fuel", "mission.ox_tank_pos",
+                    "mission.fuel_tank_pos", "mission.prop_mass", "mission.tanks_mass",
+                ),
+                inputs=lambda: widget_state(self.tanksframe),
+                status="Status: loading tanks...",
+                enabled=lambda: self.in_use("tanksframe"),
+            ),
+            Stage(
+                "mission", lambda: self.missionframe.run(),
+                reads=("mission.rocket", "mission.env", "mission.engine", "mission.rail_length",
+                       "mission.inclination", "mission.heading"),
+                writes=("mission.flight",),
+                inputs=lambda: widget_state(self.missionframe),
+                status="Status: running flight simulation...",
+                enabled=lambda: self.in_use("missionframe"),
+            ),
+        ]
+        return Pipeline(stages, status=self.set_status)
 
     def estimate_At(self):
-        if conf.thrust is not None:
-            iter = 0
-            while abs(conf.thrust_d - conf.thrust) > 1.0e-5 * conf.thrust_d:
-                iter += 1
-                conf.At = conf.thrust * conf.k_film / conf.CF_d / conf.pc
-                self.geometryframe.estimate_Tn()
-                self.geometryframe.plot()
-                self.performanceframe.run()
-                if iter == 10:
-                    break
+        """
+        Sizes the throat for the design thrust with the headless solver, which
+        reuses the theoretical performance, then redraws the geometry and the
+        delivered performance once.
+        """
+        if conf.thrust is None:
+            return
+        conf.At = size_throat(
+            DesignState.from_config(), conf.cstar, conf.Isp_vac, conf.Isp_vac_fr,
+            geometry=self.geometryframe.divergent_geometry
+        )
+        self.geometryframe.estimate_Tn()
+        self.geometryframe.plot()
+        self.performanceframe.run_delivered()
 
     def about_window(self):
         if self.about is None or not self.about.winfo_exists():
@@ -363,6 +493,8 @@ class RocketForge(CTk):
         
     def load_config(self):
         config.load_config(self)
+        self.pipeline.invalidate()
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     RocketForge(className="Rocket Forge").mainloop()
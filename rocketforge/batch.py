@@ -0,0 +1,393 @@
+"""
+Headless batch runner for Rocket Forge project files (.rf).
+
+Every project is evaluated in a worker process through the same performance,
+geometry, thermal and tank routines as the GUI, but without creating any Tk
+window. Results are written as JSON lines, one object per project, as soon
+as each project completes.
+
+Usage:
+    python -m rocketforge.batch designs/*.rf --jobs 8 --output results.jsonl
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import importlib
+import traceback
+from configparser import ConfigParser
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from numpy import degrees
+import rocketforge.performance.config as pconf
+import rocketforge.thermal.config as tconf
+import rocketforge.mission.config as mconf
+import rocketforge.geometry.convergent as convergent
+import rocketforge.geometry.divergent as divergent
+import rocketforge.geometry.chamber as chamber
+import rocketforge.thermal.cooling as cooling
+import rocketforge.mission.tanks as tanks
+from rocketforge.performance.corrfactors import correction_factors
+from rocketforge.performance.deliveredperf import delivered
+from rocketforge.performance.design import DesignState
+from rocketforge.performance.designpoint import EXIT_EPS, EXIT_PRESSURE, EXIT_RATIO, design_point, design_throat
+from rocketforge.performance.sizing import size_throat
+from rocketforge.performance.theoreticalperf import theoretical
+from rocketforge.utils.conversions import (
+    angle_uom, area_uom, density_uom, length_uom, mass_uom, mdot_uom, pressure_uom, temperature_uom, thrust_uom
+)
+from rocketforge.utils.logger import logger
+
+
+# Sections every project file must have
+REQUIRED_SECTIONS = ("InitialData", "Performance", "Geometry")
+
+
+def _float(section, key: str):
+    """Returns an entry as a float, or None if it is missing or empty."""
+    value = section.get(key, "").strip()
+    return float(value) if value else None
+
+
+def _int(section, key: str, default: int = 0) -> int:
+    value = section.get(key, "").strip()
+    return int(float(value)) if value else default
+
+
+def _flag(section, key: str) -> bool:
+    return section.get(key, "").strip().lower() in ("1", "true", "yes")
+
+
+def read_project(path: str) -> ConfigParser:
+    """
+    Parses a project file saved by the GUI.
+
+    Raises:
+        ValueError: If the file is missing or is not a project file.
+    """
+    project = ConfigParser()
+    if not project.read(path):
+        raise ValueError(f"Cannot read {path}.")
+    missing = [name for name in REQUIRED_SECTIONS if not project.has_section(name)]
+    if missing:
+        raise ValueError(f"{path} is not a Rocket Forge project (missing {', '.join(missing)}).")
+    return project
+
+
+def reset_config() -> None:
+    """Restores the defaults of the config modules, so that projects evaluated by the same worker are independent."""
+    for module in (pconf, tconf, mconf):
+        importlib.reload(module)
+
+
+# Stages
+
+def load_film(project: ConfigParser) -> None:
+    """Film cooling settings, see `ThermalFrame.load_film_cooling`."""
+    if not project.has_section("Thermal"):
+        return
+    s = project["Thermal"]
+    cooling.set_film_cooling(_flag(s, "enable_film"), _float(s, "fuel_film") or 0.0, _float(s, "ox_film") or 0.0)
+
+
+def run_initial(project: ConfigParser) -> None:
+    """Design point and theoretical performance, see `designpoint.design_point`."""
+    s = project["InitialData"]
+    exit_condition = _int(s, "exit_condition", EXIT_PRESSURE)
+    if exit_condition == EXIT_EPS:
+        exit_value = float(s["expansion_area_ratio"])
+    elif exit_condition == EXIT_RATIO:
+        exit_value = float(s["expansion_pressure_ratio"])
+    else:
+        exit_value = float(s["exit_pressure"]) * pressure_uom(s["exit_pressure_uom"])
+    optmode = _int(s, "mixture_ratio_optimization")
+    C = design_point(
+        s["oxidizer"],
+        s["fuel"],
+        float(s["chamber_pressure"]) * pressure_uom(s["chamber_pressure_uom"]),
+        _float(s, "contraction_ratio") if _int(s, "inlet_conditions") == 0 else None,
+        optmode,
+        exit_condition,
+        exit_value,
+        float(s["mixture_ratio"]) if optmode == 0 else None,
+        s.get("mixture_ratio_uom", "O/F"),
+    )
+
+    p = project["Performance"]
+    frozen, frozenatthroat = {0: (0, 0), 1: (1, 0), 2: (1, 1)}[_int(p, "flow_model")]
+    theoretical(_int(p, "number_of_stations", 1) + 1, frozen, frozenatthroat)
+
+    thrust, pamb = _float(s, "thrust"), _float(s, "ambient_pressure")
+    if thrust is not None and pamb is not None:
+        design_throat(C, thrust * thrust_uom(s["thrust_uom"]), pamb * pressure_uom(s["ambient_pressure_uom"]))
+    else:
+        g = project["Geometry"]
+        pconf.At = float(g["throat_area"]) * area_uom(g["throat_area_uom"])
+
+
+def divergent_geometry(project: ConfigParser):
+    """Returns the function mapping the throat area to the divergent (Le, theta_e), see `GeometryFrame.divergent_geometry`."""
+    g = project["Geometry"]
+    shape = g["shape"]
+    RnOvRt = float(g["rnovrt"])
+
+    if shape == divergent.TOP:
+        value = float(g["divergent_length"])
+        if g["divergent_length_uom"] == "Le/Lc15":
+            Le, Lf = None, value
+        else:
+            Le, Lf = value * length_uom(g["divergent_length_uom"]), None
+        thetae = float(g["theta_e"]) * angle_uom(g["theta_e_uom"])
+        return lambda At: divergent.length_and_angle(shape, At, RnOvRt, pconf.eps, Le=Le, Lf=Lf, thetae=thetae)
+
+    if shape == divergent.CONICAL:
+        selected = _int(g, "cselected")
+        if selected == 0:
+            Le = float(g["cle"]) * length_uom(g["cle_uom"])
+            return lambda At: divergent.length_and_angle(shape, At, RnOvRt, pconf.eps, Le=Le)
+        if selected == 1:
+            Lf = float(g["clf"])
+            return lambda At: divergent.length_and_angle(shape, At, RnOvRt, pconf.eps, Lf=Lf)
+        thetae = float(g["ctheta"]) * angle_uom(g["ctheta_uom"])
+        return lambda At: divergent.length_and_angle(shape, At, RnOvRt, pconf.eps, thetae=thetae)
+
+    raise ValueError(f"Unsupported divergent shape '{shape}' in batch mode.")
+
+
+def run_geometry(project: ConfigParser) -> dict:
+    """Thrust chamber geometry at the current throat area, see `GeometryFrame.plot`."""
+    g = project["Geometry"]
+    At = pconf.At
+    Le, thetae = divergent_geometry(project)(At)
+
+    RnOvRt = float(g["rnovrt"])
+    if g["shape"] == divergent.TOP:
+        tconf.shape = 1
+        thetan = _float(g, "theta_n")
+        if thetan is None:
+            thetan = divergent.initial_angle(pconf.gammae, pconf.Me)
+        else:
+            thetan *= angle_uom(g["theta_n_uom"])
+    else:
+        tconf.shape = 0
+        thetan = thetae
+
+    geometry = {"At": At, "Le": Le, "theta_e": degrees(thetae), "theta_n": degrees(thetan)}
+    if pconf.epsc is None:
+        # Infinite area combustor, no convergent section
+        chamber.set_geometry(At, Le, thetan, thetae, RnOvRt)
+        return geometry
+
+    epsc = pconf.epsc
+    R1OvRt = float(g["r1ovrt"])
+    R2OvR2max = float(g["r2ovr2max"])
+    b = float(g["contraction_angle"]) * angle_uom(g["contraction_angle_uom"])
+    if g["chamber_length_uom"] == "L* [m]":
+        Lstar = float(g["chamber_length"])
+        Lc = convergent.get_Lc(At, R1OvRt, Lstar, b, R2OvR2max, epsc)
+    else:
+        Lc = float(g["chamber_length"]) * length_uom(g["chamber_length_uom"])
+        Lstar = convergent.get_Lstar(At, R1OvRt, Lc, b, R2OvR2max, epsc)
+    chamber.set_geometry(At, Le, thetan, thetae, RnOvRt, Lc, R1OvRt, b, R2OvR2max)
+
+    geometry.update({"Lc": Lc, "Lstar": Lstar, "L_cyl": tconf.L_cyl})
+    return geometry
+
+
+def run_performance(project: ConfigParser) -> dict:
+    """
+    Delivered performance. With a design thrust, the throat is sized by
+    `size_throat` and the geometry is updated, see `RocketForge.estimate_At`.
+    """
+    geometry = run_geometry(project)
+    correction_factors()
+    delivered()
+    if pconf.thrust is not None:
+        pconf.At = size_throat(
+            DesignState.from_config(), pconf.cstar, pconf.Isp_vac, pconf.Isp_vac_fr,
+            geometry=divergent_geometry(project)
+        )
+        geometry = run_geometry(project)
+        correction_factors()
+        delivered()
+    return geometry
+
+
+def load_thermal(project: ConfigParser) -> None:
+    """Cooling settings, see `rocketforge.thermal.cooling`."""
+    s = project["Thermal"]
+    cooling.set_rad_cooling(_flag(s, "enable_rad"), _float(s, "eps_w"))
+    if not _flag(s, "enable_regen"):
+        tconf.regen = False
+        return
+
+    # Channel and advanced settings first, as the coolant inlet pressure depends on pcoOvpc
+    for key, attribute in (("channels_ac", "a1"), ("channels_at", "a2"), ("channels_ae", "a3"),
+                           ("channels_bc", "b1"), ("channels_bt", "b2"), ("channels_be", "b3"),
+                           ("adv_pinj/pc", "pcoOvpc"), ("adv_tuning", "tuning_factor"),
+                           ("adv_stability", "stability"), ("adv_abs_roughness", "absolute_roughness"),
+                           ("t_eOvt_w", "t_eOvt_w")):
+        if _float(s, key) is not None:
+            setattr(tconf, attribute, _float(s, key))
+    for key, attribute in (("number_of_channels", "NC"), ("adv_stations", "n_stations"),
+                           ("adv_max_iter", "max_iter"), ("adv_friction_method", "dp_method")):
+        if _float(s, key) is not None:
+            setattr(tconf, attribute, _int(s, key))
+    enable_dp = _flag(s, "pressure_drops")
+    cooling.set_regen_cooling(
+        True,
+        s["coolant"],
+        float(s["coolant_flow_rate"]) * mdot_uom(s["coolant_flow_rate_uom"]),
+        temperature_uom(float(s["coolant_Ti"]), s["coolant_Ti_uom"]),
+        enable_dp,
+        None if enable_dp else float(s["coolant_pi"]) * pressure_uom(s["coolant_pi_uom"]),
+        float(s["inner_wall"]) * length_uom(s["inner_wall_uom"]),
+        float(s["wall_conductivity"]),
+    )
+
+
+def run_thermal(project: ConfigParser) -> dict:
+    """Regenerative cooling analysis, see `ThermalFrame.run`."""
+    load_thermal(project)
+    if not tconf.regen:
+        return None
+
+    # Imported here, as the thermal solver loads the coolant property tables
+    from rocketforge.thermal.regenerative import Regen
+    regen = Regen()
+    regen.run()
+    thermal = {
+        "T_wg_max": regen.T_wg.max(),
+        "T_wc_max": regen.T_wc.max(),
+        "T_c_max": regen.T_c.max(),
+        "q_max": regen.q.max(),
+    }
+    if tconf.enable_dp:
+        thermal["dp"] = regen.Dp
+    return thermal
+
+
+def run_tanks(project: ConfigParser) -> dict:
+    """Tank sizing, see `rocketforge.mission.tanks.size_tanks`."""
+    s = project["Tanks"]
+    mdot = _float(s, "mass_flow_rate")
+    mdot = tanks.default_mdot() if mdot is None else mdot * mdot_uom(s["mass_flow_rate_uom"])
+    MR = _float(s, "mixture_ratio")
+    sizes = tanks.size_tanks(
+        mdot,
+        tanks.default_mr() if MR is None else MR,
+        float(s["prop_mass"]) * mass_uom(s["prop_mass_uom"]),
+        float(s["k0"]) * mass_uom(s["k0_uom"]),
+        float(s["kt"]),
+        float(s["rho_ox"]) * density_uom(s["rho_ox_uom"]),
+        float(s["rho_fuel"]) * density_uom(s["rho_fuel_uom"]),
+        float(s["r_ox"]) * length_uom(s["r_ox_uom"]),
+        float(s["r_fuel"]) * length_uom(s["r_fuel_uom"]),
+        float(s["exc_ox"]),
+        float(s["exc_fuel"]),
+    )
+    return {"mdot": mdot, **sizes}
+
+
+def run_project(path: str) -> dict:
+    """
+    Evaluates a project file.
+
+    Failures of the design point or performance stages fail the project;
+    failures of the thermal and tank stages are reported under "errors".
+
+    Returns:
+        dict: JSON-serializable results.
+    """
+    start = time.perf_counter()
+    result = {"project": path, "errors": {}}
+    try:
+        reset_config()
+        project = read_project(path)
+        result["name"] = project["InitialData"].get("name", "")
+        load_film(project)
+        run_initial(project)
+        result["geometry"] = run_performance(project)
+    except Exception as err:
+        result["errors"]["performance"] = f"{type(err).__name__}: {err}"
+        result["elapsed"] = time.perf_counter() - start
+        return result
+
+    result["design"] = {
+        "ox": pconf.ox, "fuel": pconf.fuel, "pc": pconf.pc, "mr": pconf.mr, "mr_s": pconf.mr_s,
+        "eps": pconf.eps, "epsc": pconf.epsc, "pe": pconf.pe, "thrust": pconf.thrust, "pamb": pconf.pamb,
+    }
+    result["theoretical"] = {
+        "cstar": pconf.cstar, "Isp_vac": pconf.Isp_vac, "Isp_vac_eq": pconf.Isp_vac_eq,
+        "Isp_vac_fr": pconf.Isp_vac_fr, "Isp_sl": pconf.Isp_sl, "Isp_opt": pconf.Isp_opt,
+        "gammae": pconf.gammae, "Me": pconf.Me, "T_c": tconf.T_c,
+    }
+    result["delivered"] = {
+        "z_r": pconf.z_r, "z_f": pconf.z_f, "z_d": pconf.z_d, "z_overall": pconf.z_overall,
+        "cstar_d": pconf.cstar_d, "CF_d": pconf.CF_d, "thrust_d": pconf.thrust_d,
+        "m_f_d": pconf.m_f_d, "m_ox_d": pconf.m_ox_d, "k_film": pconf.k_film,
+    }
+
+    for name, section, stage in (("thermal", "Thermal", run_thermal), ("tanks", "Tanks", run_tanks)):
+        if not project.has_section(section):
+            continue
+        try:
+            result[name] = stage(project)
+        except Exception as err:
+            result["errors"][name] = f"{type(err).__name__}: {err}"
+            logger.debug(traceback.format_exc())
+
+    result["elapsed"] = time.perf_counter() - start
+    return result
+
+
+def run_batch(paths: list, jobs: int = None):
+    """
+    Evaluates project files on a process pool, yielding their results in
+    completion order. Projects whose worker failed are reported as failed
+    rather than ending the batch.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1:
+        for path in paths:
+            yield run_project(path)
+        return
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = {executor.submit(run_project, path): path for path in paths}
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as err:
+                # The worker died (e.g. a crash in the CEA extension breaks the pool)
+                result = {"project": futures[future], "errors": {"performance": f"{type(err).__name__}: {err}"},
+                          "elapsed": None}
+            yield result
+
+
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m rocketforge.batch", description="Evaluate Rocket Forge project files without the GUI."
+    )
+    parser.add_argument("projects", nargs="+", help=".rf project files")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="number of worker processes (default: CPU count)")
+    parser.add_argument("-o", "--output", default="results.jsonl", help="JSON lines output file (default: results.jsonl)")
+    args = parser.parse_args(argv)
+
+    failed = 0
+    start = time.perf_counter()
+    with open(args.output, "w") as f:
+        for done, result in enumerate(run_batch(args.projects, args.jobs), 1):
+            f.write(json.dumps(result, default=float) + "\n")
+            f.flush()
+            if "performance" in result["errors"]:
+                failed += 1
+                logger.error(f"[{done}/{len(args.projects)}] {result['project']}: {result['errors']['performance']}")
+            else:
+                logger.info(f"[{done}/{len(args.projects)}] {result['project']} ({result['elapsed']:.1f} s)")
+
+    logger.info(f"Batch completed in {time.perf_counter() - start:.1f} s: {failed} of {len(args.projects)} projects failed.")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,51 @@
+import numpy as np
+import rocketforge.performance.config as config
+import rocketforge.thermal.config as tconf
+import rocketforge.geometry.convergent as convergent
+
+
+def set_geometry(
+    At: float,
+    Le: float,
+    thetan: float,
+    thetae: float,
+    RnOvRt: float,
+    Lc: float = None,
+    R1OvRt: float = None,
+    b: float = None,
+    R2OvR2max: float = None
+) -> None:
+    """
+    #### Thrust chamber geometry.
+    Stores the geometry in the performance and thermal configs, used by the
+    geometry tab and the batch runner. The convergent section is only stored
+    if its length is given (it is undefined for an infinite area combustor).
+
+    Parameters:
+        At (float): Throat area.
+        Le (float): Divergent length.
+        thetan (float): Initial divergent angle in radians.
+        thetae (float): Final divergent angle in radians.
+        RnOvRt (float): Ratio of divergent circular arc radius to throat radius.
+        Lc (float, optional): Chamber length.
+        R1OvRt (float, optional): Ratio of convex circular arc radius to throat radius.
+        b (float, optional): Contraction angle in radians.
+        R2OvR2max (float, optional): Ratio of concave arc radius to maximum allowed value.
+    """
+    config.At = At
+    config.Le = Le
+    config.theta_e = thetae
+
+    tconf.L_e = Le
+    tconf.RnOvRt = RnOvRt
+    tconf.theta = np.degrees(thetan)
+    tconf.thetan = np.degrees(thetan)
+    tconf.thetae = np.degrees(thetae)
+    if Lc is None:
+        return
+
+    tconf.L_cyl = convergent.get_Lcyl(At, R1OvRt, Lc, b, R2OvR2max, config.epsc)
+    tconf.L_c = Lc
+    tconf.R1OvRt = R1OvRt
+    tconf.R2OvR2max = R2OvR2max
+    tconf.b = np.degrees(b)
@@ -1,5 +1,4 @@
 import numpy as np
-from scipy.optimize import brentq
 from typing import Tuple
 
 
@@ -83,6 +82,8 @@ def get_theta(
             - Le
         )
 
+    from scipy.optimize import brentq
+
     theta_solution = brentq(
         equation,
         np.radians(0.0001),
@@ -1,5 +1,4 @@
 import numpy as np
-from scipy.integrate import quad
 from typing import Tuple
 
 
@@ -143,6 +142,41 @@ def get_Lstar(
     return Lstar
 
 
+def get_Lcyl(
+    At: float,
+    R1OvRt: float,
+    Lc: float,
+    b: float,
+    R2OvR2max: float,
+    epsc: float
+) -> float:
+    """
+    Computes the length of the cylindrical section of the chamber.
+
+    Parameters:
+        At (float): Throat area.
+        R1OvRt (float): Ratio of convex circular arc radius to throat radius.
+        Lc (float): Chamber length.
+        b (float): Contraction angle in radians.
+        R2OvR2max (float): Ratio of concave arc radius to maximum allowed value.
+        epsc (float): Contraction area ratio.
+
+    Returns:
+        float: Cylindrical section length.
+    """
+    Rt = np.sqrt(At / np.pi)
+    R1 = R1OvRt * Rt
+    Rc = Rt * np.sqrt(epsc)
+    R2max = (Rc - Rt) / (1 - np.cos(b)) - R1
+    R2 = R2OvR2max * R2max
+
+    m = -np.tan(b)
+    q = Rt + R1 * (1 - np.cos(b) - np.tan(b) * np.sin(b))
+    xB = (Rc - R2 * (1 - np.cos(b)) - q) / m - R2 * np.sin(b)
+
+    return xB + Lc
+
+
 def get_I(
     At: float,
     R1OvRt: float,
@@ -179,6 +213,8 @@ def get_I(
     y2 = lambda x: (m * x + q) ** 2
     y3 = lambda x: (Rc - R2 + np.sqrt(R2**2 - (x - xB) ** 2)) ** 2
 
+    from scipy.integrate import quad
+
     I1 = quad(y1, xD, 0)[0]
     I2 = quad(y2, xC, xD)[0]
     I3 = quad(y3, xB, xC)[0]
@@ -0,0 +1,70 @@
+import numpy as np
+import rocketforge.geometry.conical as conical
+from typing import Tuple
+
+
+# Divergent section shapes, as named in the geometry tab
+TOP = "Thrust-optimized parabolic"
+TIC = "Truncated ideal contour"
+CONICAL = "Conical"
+
+
+def length_and_angle(
+    shape: str,
+    At: float,
+    RnOvRt: float,
+    eps: float,
+    Le: float = None,
+    Lf: float = None,
+    thetae: float = None
+) -> Tuple[float, float]:
+    """
+    Returns the length and exit angle of the divergent section.
+
+    A TOP nozzle is defined by its exit angle and either its length or its
+    fractional length (relative to a 15-degree conical nozzle). A conical
+    nozzle is defined by exactly one of length, fractional length and angle.
+
+    Parameters:
+        shape (str): One of `TOP` and `CONICAL`.
+        At (float): Throat area.
+        RnOvRt (float): Ratio of divergent circular arc radius to throat radius.
+        eps (float): Expansion area ratio.
+        Le (float, optional): Divergent nozzle length.
+        Lf (float, optional): Fractional length, Le/Lc15.
+        thetae (float, optional): Exit angle in radians.
+
+    Returns:
+        Tuple[float, float]: Divergent length and exit angle in radians.
+
+    Raises:
+        ValueError: If the shape is not supported or underdefined.
+    """
+    if Le is None and Lf is not None:
+        Le = Lf * conical.lc15(At, RnOvRt, eps)
+
+    if shape == TOP:
+        if Le is None or thetae is None:
+            raise ValueError("A TOP nozzle requires its length and exit angle.")
+        return Le, thetae
+
+    if shape == CONICAL:
+        if Le is not None:
+            return Le, conical.get_theta(At, RnOvRt, eps, Le)
+        if thetae is not None:
+            return conical.le(At, RnOvRt, eps, thetae), thetae
+        raise ValueError("A conical nozzle requires its length or divergence angle.")
+
+    raise ValueError(f"Unsupported divergent shape '{shape}'.")
+
+
+def initial_angle(gamma: float, Me: float) -> float:
+    """
+    Returns the estimated initial parabola angle of a TOP nozzle in radians,
+    half the Prandtl-Meyer angle of the exit Mach number.
+    """
+    nu = (
+        np.sqrt((gamma + 1) / (gamma - 1)) * np.arctan(np.sqrt((gamma - 1) * (Me**2 - 1) / (gamma + 1)))
+        - np.arctan(np.sqrt(Me**2 - 1))
+    )
+    return nu / 2
@@ -0,0 +1,113 @@
+import queue
+import hashlib
+import threading
+from collections import OrderedDict
+import numpy as np
+from rocketforge.utils.logger import logger
+from rocketforge.utils.tracing import span
+
+
+# Number of rendered images kept for reuse
+PREVIEW_CACHE_SIZE = 32
+# Azimuthal points of the revolved chamber surface
+PREVIEW_NTHETA = 180
+
+
+class PreviewRenderer:
+    """
+    Off-screen renderer of the 3D chamber preview.
+
+    Rendering runs in a single worker thread, which owns the pyvista plotter
+    (and its OpenGL context). Only the latest submitted geometry is rendered:
+    a submission replaces any request the worker has not picked up yet.
+    Rendered images are kept in an LRU cache keyed by `key`, and posted to
+    `self.results` as (key, image) pairs for the Tk main loop to display
+    (image is None if the render failed).
+    """
+
+    def __init__(self, size: tuple = (590, 200), background: str = "#c1c1c1",
+                 cache_size: int = PREVIEW_CACHE_SIZE):
+        self.size = size
+        self.background = background
+        self.cache_size = cache_size
+        self.results = queue.Queue()
+        self._cache = OrderedDict()
+        self._pending = None
+        self._condition = threading.Condition()
+        self._thread = None
+        self._plotter = None
+        self._actor = None
+
+    @staticmethod
+    def key(x: np.ndarray, y: np.ndarray, camera: tuple) -> str:
+        """Hash of a contour and camera position."""
+        digest = hashlib.sha1()
+        digest.update(np.ascontiguousarray(x, dtype=float).tobytes())
+        digest.update(np.ascontiguousarray(y, dtype=float).tobytes())
+        digest.update(repr(camera).encode())
+        return digest.hexdigest()
+
+    def cached(self, key: str) -> np.ndarray:
+        """Returns the rendered image of a key, or None."""
+        with self._condition:
+            if key not in self._cache:
+                return None
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+    def submit(self, key: str, x: np.ndarray, y: np.ndarray, camera: tuple) -> None:
+        """Requests a render, replacing the pending request, if any."""
+        with self._condition:
+            self._pending = (key, np.array(x, dtype=float), np.array(y, dtype=float), camera)
+            self._condition.notify()
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._work, name="PreviewRenderer", daemon=True)
+            self._thread.start()
+
+    def _work(self) -> None:
+        while True:
+            with self._condition:
+                while self._pending is None:
+                    self._condition.wait()
+                key, x, y, camera = self._pending
+                self._pending = None
+            try:
+                image = self.render(x, y, camera)
+            except Exception as e:
+                logger.warning(f"3D preview rendering failed: {e}")
+                self.results.put((key, None))
+                continue
+            with self._condition:
+                self._cache[key] = image
+                self._cache.move_to_end(key)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+            self.results.put((key, image))
+
+    def render(self, x: np.ndarray, y: np.ndarray, camera: tuple) -> np.ndarray:
+        """Renders a contour revolved about the x axis. Called by the worker thread only."""
+        plotter = self._get_plotter()
+        with span("3D preview", "render"):
+            plotter.camera_position = list(camera)
+            if self._actor is not None:
+                plotter.remove_actor(self._actor)
+            self._actor = plotter.add_mesh(get_chamber(x, y), color="#727472")
+            return np.uint8(plotter.screenshot(return_img=True))
+
+    def _get_plotter(self):
+        if self._plotter is None:
+            import pyvista as pv
+            self._plotter = pv.Plotter(off_screen=True, title="Geometry")
+            self._plotter.window_size = list(self.size)
+            self._plotter.set_background(self.background)
+        return self._plotter
+
+
+def get_chamber(x: np.ndarray, y: np.ndarray, ntheta: int = PREVIEW_NTHETA):
+    """Returns the chamber surface, revolving the contour (x, y) about the x axis."""
+    import pyvista as pv
+    theta = np.linspace(0, 2*np.pi, ntheta)
+    X = np.outer(x, np.ones((1, ntheta)))
+    Y = np.outer(y, np.cos(theta))
+    Z = np.outer(y, np.sin(theta))
+    return pv.StructuredGrid(X, Y, Z)
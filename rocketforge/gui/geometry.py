@@ -1,3 +1,4 @@
+import queue
 import tkinter as tk
 from tkinter.messagebox import showwarning
 from tkinter.filedialog import asksaveasfilename
@@ -9,6 +10,9 @@ import rocketforge.geometry.top as top
 import rocketforge.geometry.tic as tic
 import rocketforge.geometry.conical as conical
 import rocketforge.geometry.convergent as convergent
+import rocketforge.geometry.divergent as divergent
+import rocketforge.geometry.chamber as chamber
+from rocketforge.geometry.preview import PreviewRenderer
 from rocketforge.utils.conversions import angle_uom, area_uom, length_uom
 from rocketforge.utils.helpers import update_entry, update_textbox
 from rocketforge.utils.resources import resource_path
@@ -18,7 +22,12 @@ from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from PIL import Image
 from numpy import *
 from tabulate import tabulate
-import pyvista as pv
+
+
+# Delay between a geometry change and its 3D preview render, in ms
+PREVIEW_DEBOUNCE_MS = 150
+# Interval between polls of the 3D preview renderer, in ms
+PREVIEW_POLL_MS = 50
 
 
 class GeometryFrame(ctk.CTkFrame):
@@ -236,13 +245,17 @@ class GeometryFrame(ctk.CTkFrame):
         self.view_angle = 0.0
         self.distance = 4.0
         self.enable_3d = False
-        self.mesh = None
 
-        self.plotter = pv.Plotter(off_screen=True, title="Geometry")
-        self.plotter.window_size = [590, 200]
-        self.plotter.set_background('#c1c1c1')
-        image_array = self.plotter.screenshot(return_img=True)
-        photo = CTkImage(Image.fromarray(uint8(image_array)), size=(590, 200))
+        # The 3D preview is rendered off-screen in a worker thread, which
+        # creates the plotter (and imports pyvista/VTK) on its first render
+        self.renderer = PreviewRenderer((590, 200), "#c1c1c1")
+        self.preview_key = None
+        self.preview_request = None
+        # Key of the render in flight, None once its result is received
+        self.submitted_key = None
+        self.preview_after = None
+        self.preview_polling = False
+        photo = CTkImage(Image.new("RGB", (590, 200), "#c1c1c1"), size=(590, 200))
         self.plot3dlabel.configure(image=photo)
 
         CTkButton(
@@ -302,6 +315,7 @@ class GeometryFrame(ctk.CTkFrame):
             self.plotframe.place_forget()
             self.plot3dframe.place(anchor="s", relx=0.5, rely=0.99)
         self.enable_3d = not self.enable_3d
+        self.update_3d_plot()
     
     def increase_distance(self):
         self.distance *= 1.1
@@ -460,29 +474,7 @@ class GeometryFrame(ctk.CTkFrame):
             except Exception:
                 pass
 
-            config.At = At
-            config.Le = Le
-            config.theta_e = thetae
-
-            Rt = sqrt(At/pi)
-            Re = Rt * sqrt(eps)
-            Rc = Rt * sqrt(epsc)
-            R1 = R1OvRt * Rt
-            R2max = (Rc - Rt)/(1-cos(b)) - R1
-            R2 = R2OvR2max * R2max
-            m = - tan(b)
-            q = Rt + R1 * (1 - cos(b) - tan(b) * sin(b))
-            xB = (Rc - R2*(1-cos(b)) - q)/m - R2 * sin(b)
-            tconf.L_cyl = xB + Lc
-            tconf.L_c = Lc
-            tconf.L_e = Le
-            tconf.RnOvRt = RnOvRt
-            tconf.R1OvRt = R1OvRt
-            tconf.R2OvR2max = R2OvR2max
-            tconf.b = degrees(b)
-            tconf.theta = degrees(thetan)
-            tconf.thetan = degrees(thetan)
-            tconf.thetae = degrees(thetae)
+            chamber.set_geometry(At, Le, thetan, thetae, RnOvRt, Lc, R1OvRt, b, R2OvR2max)
 
             self.update_3d_plot()
 
@@ -490,39 +482,109 @@ class GeometryFrame(ctk.CTkFrame):
             pass
 
     def update_3d_plot(self):
+        """
+        Updates the 3D preview of the plotted geometry, while it is shown.
+        Previously rendered views are shown at once. Otherwise, the render
+        is requested after `PREVIEW_DEBOUNCE_MS`, so that a burst of updates
+        (e.g. the throat area iterations of a run) renders the last one only.
+        """
+        if not self.enable_3d or len(self.x) == 0:
+            return
         try:
             Le = tconf.L_e
             Lc = tconf.L_c
             Re = sqrt(config.At * config.eps)
             Rc = sqrt(config.At * config.epsc)
-            chamber = self.get_chamber()
-            self.plotter.camera_position = [
+            camera = (
                 ((Le - Lc) / 2 + self.distance * max((Re, Rc)) * sin(self.view_angle), 0, self.distance * max((Re, Rc)) * cos(self.view_angle)),
                 ((Le - Lc) / 2, 0, 0),
                 (0, 1, 0)
-            ]
-            if self.mesh is not None:
-                self.plotter.remove_actor(self.mesh)
-            self.mesh = self.plotter.add_mesh(chamber, color="#727472")
-            image_array = self.plotter.screenshot(return_img=True)
-            photo = CTkImage(Image.fromarray(uint8(image_array)), size=(590, 200))
-            self.plot3dlabel.configure(image=photo)
+            )
         except Exception:
+            return
+
+        if self.preview_after is not None:
+            self.after_cancel(self.preview_after)
+            self.preview_after = None
+        self.preview_key = self.renderer.key(self.x, self.y, camera)
+        image = self.renderer.cached(self.preview_key)
+        if image is not None:
+            self.show_3d_plot(image)
+            return
+        self.preview_request = (self.preview_key, self.x, self.y, camera)
+        self.preview_after = self.after(PREVIEW_DEBOUNCE_MS, self.submit_3d_plot)
+
+    def submit_3d_plot(self):
+        self.preview_after = None
+        self.submitted_key = self.preview_request[0]
+        self.renderer.submit(*self.preview_request)
+        if not self.preview_polling:
+            self.preview_polling = True
+            self.after(PREVIEW_POLL_MS, self.poll_3d_plot)
+
+    def poll_3d_plot(self):
+        """
+        Drains the renderer results in the Tk main loop while a render is in
+        flight, i.e. until the last submitted render is done (the next submit
+        restarts polling). Only the image of the latest update is shown;
+        superseded ones are just cached.
+        """
+        try:
+            while True:
+                key, image = self.renderer.results.get_nowait()
+                if key == self.submitted_key:
+                    self.submitted_key = None
+                if key == self.preview_key and image is not None:
+                    self.show_3d_plot(image)
+        except queue.Empty:
             pass
 
-    def get_chamber(self):
-        ntheta = 180
-        theta = linspace(0, 2*pi, ntheta)
-        X = outer(self.x, ones((1, ntheta)))
-        Y = outer(self.y, cos(theta))
-        Z = outer(self.y, sin(theta))
-        return pv.StructuredGrid(X, Y, Z)
+        if self.submitted_key is None:
+            self.preview_polling = False
+        else:
+            self.after(PREVIEW_POLL_MS, self.poll_3d_plot)
+
+    def show_3d_plot(self, image):
+        photo = CTkImage(Image.fromarray(image), size=(590, 200))
+        self.plot3dlabel.configure(image=photo)
+
+    def divergent_geometry(self, At):
+        """
+        Returns the divergent length and exit angle (Le, theta_e) that the
+        current settings give for a throat area `At`, without plotting.
+        Settings that do not depend on the throat area keep the values of
+        the last plotted geometry.
+        """
+        RnOvRt = float(self.rnovrtentry.get())
+
+        if self.shape.get() == divergent.TOP:
+            value = float(self.divergentlengthentry.get())
+            if self.divergentlengthuom.get() == "Le/Lc15":
+                Le, Lf = None, value
+            else:
+                Le, Lf = value * length_uom(self.divergentlengthuom.get()), None
+            thetae = float(self.thetaexentry.get()) * angle_uom(self.thetaexuom.get())
+            return divergent.length_and_angle(divergent.TOP, At, RnOvRt, config.eps, Le=Le, Lf=Lf, thetae=thetae)
+
+        if self.shape.get() == divergent.CONICAL:
+            selected = self.cselected.get()
+            if selected == 0:
+                Le = float(self.cleentry.get()) * length_uom(self.cleuom.get())
+                return divergent.length_and_angle(divergent.CONICAL, At, RnOvRt, config.eps, Le=Le)
+            if selected == 1:
+                Lf = float(self.clfentry.get())
+                return divergent.length_and_angle(divergent.CONICAL, At, RnOvRt, config.eps, Lf=Lf)
+            if selected == 2:
+                thetae = float(self.cthetaentry.get()) * angle_uom(self.cthetauom.get())
+                return divergent.length_and_angle(divergent.CONICAL, At, RnOvRt, config.eps, thetae=thetae)
+
+        return config.Le, config.theta_e
 
     def estimate_Tn(self):
         gamma = config.gammae
         Me = config.Me
         if self.thetanentry.get() == "":
-            thetan = (sqrt((gamma+1)/(gamma-1))*arctan(sqrt((gamma-1)*(Me**2-1)/(gamma+1)))-arctan(sqrt(Me**2-1)))/2
+            thetan = divergent.initial_angle(gamma, Me)
             update_entry(self.thetanentry, thetan / angle_uom(self.thetanuom.get()))
     
     def advanced(self):
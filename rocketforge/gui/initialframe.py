@@ -2,14 +2,12 @@ import tkinter as tk
 import customtkinter as ctk
 import os
 import rocketforge.performance.config as config
-import rocketforge.thermal.config as tconf
 from customtkinter import CTkEntry, CTkFont, CTkFrame, CTkLabel, CTkOptionMenu
 from tabulate import tabulate
-from rocketcea.cea_obj_w_units import CEA_Obj
 from rocketforge.utils.conversions import pressure_uom, thrust_uom
 from rocketforge.utils.helpers import update_textbox
 from rocketforge.utils.fonts import get_font
-from rocketforge.performance.mixtureratio import optimizemr, optimizermr_at_pe
+from rocketforge.performance.designpoint import EXIT_EPS, EXIT_RATIO, design_point, design_throat
 from rocketforge.performance.theoreticalperf import theoretical
 
 
@@ -322,64 +320,27 @@ class InitialFrame(ctk.CTkFrame):
 
     def run(self):
         try: 
-            config.ox = self.oxoptmenu.get()
-            config.fuel = self.fueloptmenu.get()
-            config.pc = float(self.pcentry.get()) * pressure_uom(self.pcuom.get())
-            if self.inletcondition.get() == 0:
-                config.epsc = float(self.epscentry.get())
+            optmode = self.optimizationmode.get()
+            exitcondition = self.exitcondition.get()
+            if exitcondition == EXIT_EPS:
+                exit_value = float(self.epsentry.get())
+            elif exitcondition == EXIT_RATIO:
+                exit_value = float(self.peratioentry.get())
             else:
-                config.epsc = None
-
-            C = CEA_Obj(
-                oxName=config.ox,
-                fuelName=config.fuel,
-                fac_CR=config.epsc,
-                cstar_units="m/s",
-                pressure_units="Pa",
-                temperature_units="K",
-                sonic_velocity_units="m/s",
-                enthalpy_units="kJ/kg",
-                density_units="kg/m^3",
-                specific_heat_units="J/kg-K",
+                exit_value = float(self.peentry.get()) * pressure_uom(self.peuom.get())
+
+            C = design_point(
+                self.oxoptmenu.get(),
+                self.fueloptmenu.get(),
+                float(self.pcentry.get()) * pressure_uom(self.pcuom.get()),
+                float(self.epscentry.get()) if self.inletcondition.get() == 0 else None,
+                optmode,
+                exitcondition,
+                exit_value,
+                float(self.mrentry.get()) if optmode == 0 else None,
+                self.mruom.get(),
             )
 
-            config.mr_s = C.getMRforER(ERphi=1)
-
-            if self.optimizationmode.get() == 0:
-                if self.mruom.get() == "O/F":
-                    config.mr = float(self.mrentry.get())
-                    config.alpha = config.mr / config.mr_s
-                elif self.mruom.get() == "alpha":
-                    config.alpha = float(self.mrentry.get())
-                    config.mr = config.alpha * config.mr_s
-
-                if self.exitcondition.get() == 0:
-                    config.eps = float(self.epsentry.get())
-                    config.pe = config.pc / C.get_PcOvPe(Pc=config.pc, MR=config.mr, eps=config.eps)
-                elif self.exitcondition.get() == 1:
-                    config.eps = C.get_eps_at_PcOvPe(
-                        Pc=config.pc, MR=config.mr, PcOvPe=float(self.peratioentry.get())
-                    )
-                    config.pe = config.pc / float(self.peratioentry.get())
-                elif self.exitcondition.get() == 2:
-                    config.pe = float(self.peentry.get()) * pressure_uom(self.peuom.get())
-                    config.eps = C.get_eps_at_PcOvPe(Pc=config.pc, MR=config.mr, PcOvPe=config.pc / config.pe)
-
-            elif self.exitcondition.get() == 0:
-                config.eps = float(self.epsentry.get())
-                config.mr = optimizemr(C, config.pc, config.eps, self.optimizationmode.get())
-                config.alpha = config.mr / config.mr_s
-                config.pe = config.pc / C.get_PcOvPe(Pc=config.pc, MR=config.mr, eps=config.eps)
-
-            else:
-                if self.exitcondition.get() == 1:
-                    config.pe = config.pc / float(self.peratioentry.get())
-                elif self.exitcondition.get() == 2:
-                    config.pe = float(self.peentry.get()) * pressure_uom(self.peuom.get())
-                config.mr = optimizermr_at_pe(C, config.pc, config.pe, self.optimizationmode.get())
-                config.eps = C.get_eps_at_PcOvPe(Pc=config.pc, MR=config.mr, PcOvPe=config.pc / config.pe)
-                config.alpha = config.mr / config.mr_s
-
             results = [
                 ["Expansion Area Ratio", config.eps, ""],
                 ["Expansion pressure ratio", config.pc / config.pe, ""],
@@ -398,13 +359,11 @@ class InitialFrame(ctk.CTkFrame):
         update_textbox(self.textbox, output, True)
 
         try:
-            config.thrust = float(self.thrustentry.get()) * thrust_uom(self.thrustuom.get())
-            config.pamb = float(self.thrustentry2.get()) * pressure_uom(self.thrustuom2.get())
-            config.c = C.estimate_Ambient_Isp(Pc=config.pc, MR=config.mr, eps=config.eps, Pamb=config.pamb)[0] * 9.80655
-            if tconf.film:
-                config.At = config.thrust * config.cstar / config.c / config.pc * (1 + (tconf.fuelfilm + config.mr*tconf.oxfilm)/100/(1+config.mr))
-            else:
-                config.At = config.thrust * config.cstar / config.c / config.pc
+            design_throat(
+                C,
+                float(self.thrustentry.get()) * thrust_uom(self.thrustuom.get()),
+                float(self.thrustentry2.get()) * pressure_uom(self.thrustuom2.get()),
+            )
         except Exception:
             config.At = None
             config.thrust = None
@@ -3,11 +3,14 @@ from tkinter import filedialog, messagebox
 import customtkinter as ctk
 import sys
 import rocketforge.mission.config as config
-import rocketforge.mission.analysis as msa
 from rocketforge.utils.helpers import update_entry
+from rocketforge.utils.lazy import lazy_import
 from rocketforge.utils.resources import resource_path
 from customtkinter import CTkEntry, CTkFont, CTkFrame, CTkLabel, CTkButton
 
+# rocketpy is loaded on the first mission analysis call
+msa = lazy_import("rocketforge.mission.analysis")
+
 
 class MissionFrame(ctk.CTkFrame):
     def __init__(self, master=None, **kw):
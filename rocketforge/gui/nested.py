@@ -1,11 +1,13 @@
 # Standard library
 import re
+import time
+import queue
 import threading
-from contextlib import contextmanager
 from operator import countOf
 
 # Tkinter
 import tkinter as tk
+from tkinter.filedialog import askopenfilename, asksaveasfilename
 from tkinter.messagebox import showwarning
 
 # Third-party
@@ -13,8 +15,6 @@ import customtkinter as ctk
 import numpy as np
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
-from rocketcea.cea_obj_w_units import CEA_Obj
-from tabulate import tabulate
 
 # CustomTkinter
 from customtkinter import (
@@ -24,23 +24,35 @@ from customtkinter import (
     CTkFrame,
     CTkLabel,
     CTkOptionMenu,
-    CTkProgressBar,
-    CTkTextbox
+    CTkProgressBar
 )
 
 # Project-specific
 import rocketforge.performance.config as config
-from rocketforge.performance.theoreticalperf import theoretical
+from rocketforge.performance.cea import cache as cea_cache
+from rocketforge.performance.design import DesignState
+from rocketforge.nested.surrogate import surrogate_sweep
 from rocketforge.utils.conversions import pressure_uom
 from rocketforge.utils.custom.CTkScrollableFrameUpdated import CTkScrollableFrameUpdated
+from rocketforge.utils.custom.CTkVirtualTable import CTkVirtualTable
 from rocketforge.utils.fonts import get_font
-from rocketforge.utils.helpers import update_textbox
 from rocketforge.utils.logger import logger
 from rocketforge.utils.resources import resource_path
-from rocketforge.nested.helpers import abort_plot, extract_variable
+from rocketforge.nested.helpers import abort_plot, extract_variable, get_slice_index, validate_slice_index
 from rocketforge.nested.mapper import mapper
 from rocketforge.nested.nestedplot import format_2D_plot, plot_2D, plot_3D
+from rocketforge.nested.sweep import SweepCancelled, run_sweep
+from rocketforge.nested.adaptive import adaptive_sweep
+from rocketforge.nested.doe import SAMPLERS, doe_sweep
+from rocketforge.nested.store import CellStore
+import rocketforge.nested.storage as storage
+from rocketforge.nested.results import NestedResults
+import rocketforge.nested.providers as providers
 
+# Interval between sweep queue polls, in ms
+SWEEP_POLL_MS = 100
+# Minimum interval between partial plot redraws, in s
+PARTIAL_PLOT_INTERVAL = 1.0
 
 
 class NestedFrame(CTkFrame):
@@ -49,6 +61,13 @@ class NestedFrame(CTkFrame):
     unicodesquared = "\u00b2"
     unicodecdot = "\u00b7"
 
+    # Optimized-MR modes of the mixture ratio row (see `optimizemr`)
+    mr_optmodes = {
+        "Optimal (Isp vac)": 1,
+        "Optimal (Isp opt)": 2,
+        "Optimal (Isp SL)": 3
+    }
+
     def __init__(self, master=None, **kw):
         super(NestedFrame, self).__init__(master, **kw)
 
@@ -61,6 +80,12 @@ class NestedFrame(CTkFrame):
         self.toplabel = CTkLabel(self.topframe, text="Nested Analysis")
         self.toplabel.place(anchor="center", relx=0.5, rely=0.5, x=0, y=0)
 
+        # Create export and import buttons
+        self.exportbutton = CTkButton(self.topframe, text="Export...", command=self.export_results, width=70, height=24)
+        self.exportbutton.place(anchor="e", relx=1, rely=0.5, x=-80)
+        self.importbutton = CTkButton(self.topframe, text="Import...", command=self.import_results, width=70, height=24)
+        self.importbutton.place(anchor="e", relx=1, rely=0.5, x=-5)
+
         # Create the input grid frame
         self.inputgrid = CTkFrame(self, border_width=1)
         self.inputgrid.place(anchor="n", relx=0.5, rely=0.03 + 28/600, relwidth=59/60) # Horrible but it works for now
@@ -71,7 +96,7 @@ class NestedFrame(CTkFrame):
             self.inputgrid.grid_columnconfigure(i, weight=1)
 
         # First row headers
-        headers = ["Variable Parameter", "Start Value", "End Value", ["Step Size", "Step No."], "Unit/Mode"]
+        headers = ["Variable Parameter", "Start Value", "End Value", ["Step Size", "Step No.", "Adaptive"], "Unit/Mode"]
         for i, header in enumerate(headers):
             if i != 3:
                 label = CTkLabel(self.inputgrid, text=header)
@@ -83,7 +108,10 @@ class NestedFrame(CTkFrame):
         # Define the row data for the input grid
         self.rows = []
         row_data = [
-            ("Mixture Ratio",               ["O/F", "alpha"]),
+            ("Mixture Ratio",               ["O/F", "alpha",
+                                             "Optimal (Isp vac)",
+                                             "Optimal (Isp opt)",
+                                             "Optimal (Isp SL)"]),
             ("Chamber Pressure",            ["MPa", "bar", "Pa", "psia", "atm"]),
             ("Nozzle Inlet Conditions",     ["Contraction Area Ratio (Ac/At)",
                                              "Infinite Area Combustor"]),
@@ -112,10 +140,36 @@ class NestedFrame(CTkFrame):
             self, text="Plot...", command=self.plot_window, width=100, height=28
         ).place(relx=0.993, rely=0.475, anchor="ne")
         self.plotwindow = None
-
-        # Create output textbox
-        self.textbox = CTkTextbox(self, height=204, state="disabled", wrap="none", font=get_font())
-        self.textbox.place(relwidth=59/60, relx=0.5, rely=0.965, anchor="s")
+        self.cellstore = CellStore()
+
+        # Create a cancel button
+        self.cancelbutton = CTkButton(
+            self, text="Cancel", command=self.cancel, width=80, height=28, state="disabled"
+        )
+        self.cancelbutton.place(relx=0.993, rely=0.475, x=-105, anchor="ne")
+
+        # Create the sweep options (surrogate mode, adaptive sweep and sampling settings)
+        self.optionsframe = CTkFrame(self, fg_color="transparent")
+        self.optionsframe.place(relx=0.007, rely=0.475, anchor="nw")
+        self.surrogatecheckbox = CTkCheckBox(self.optionsframe, text="Surrogate")
+        self.surrogatecheckbox.grid(row=0, column=0, padx=5)
+        CTkLabel(self.optionsframe, text="Refine:").grid(row=0, column=1, padx=5)
+        self.adaptivevariable = CTkOptionMenu(
+            self.optionsframe, values=[
+                name for name in mapper.get_all_names("dependent")
+                if mapper.get_symbol(name) in providers.BASE_COLUMNS
+            ], width=130
+        )
+        self.adaptivevariable.grid(row=0, column=2, padx=5)
+        self.adaptivebudget = CTkEntry(self.optionsframe, justify="right", placeholder_text="Budget", width=70)
+        self.adaptivebudget.grid(row=0, column=3, padx=5)
+        CTkLabel(self.optionsframe, text="Sampling:").grid(row=0, column=4, padx=5)
+        self.samplermenu = CTkOptionMenu(self.optionsframe, values=["Full factorial", *SAMPLERS], width=130)
+        self.samplermenu.grid(row=0, column=5, padx=5)
+
+        # Create output table
+        self.table = CTkVirtualTable(self, height=204, font=get_font())
+        self.table.place(relwidth=59/60, relx=0.5, rely=0.965, anchor="s")
 
         # Create a progress bar
         self.progressbar = CTkProgressBar(self)
@@ -180,77 +234,95 @@ class NestedFrame(CTkFrame):
                 else:
                     widget.configure(state="disabled")
 
-    @contextmanager
-    def _cache_config(self):
-        """
-        Cache the current configuration values and restore them after the
-        nested analysis, even if the nested analysis fails.
-
-        Yields:
-            None
-        """
-        # Setup: save the current config values
-        cached_mr = config.mr
-        cached_pc = config.pc
-        cached_epsc = config.epsc
-        cached_eps = config.eps
-        cached_cstar = config.cstar
-        cached_Isp_vac = config.Isp_vac
-        cached_Isp_vac_eq = config.Isp_vac_eq
-        cached_Isp_vac_fr = config.Isp_vac_fr
-        cached_Isp_sl = config.Isp_sl
-        cached_Isp_opt = config.Isp_opt
-        cached_td_props = config.td_props
-        cached_gammae = config.gammae
-        cached_Me = config.Me
-        try:
-            # Give control back to the code inside the 'with' block
-            yield
-        finally:
-            # Teardown: restore the original config values
-            # this code runs even if an exception is raised within the 'with' block
-            config.mr = cached_mr
-            config.pc = cached_pc
-            config.epsc = cached_epsc
-            config.eps = cached_eps
-            config.cstar = cached_cstar
-            config.Isp_vac = cached_Isp_vac
-            config.Isp_vac_eq = cached_Isp_vac_eq
-            config.Isp_vac_fr = cached_Isp_vac_fr
-            config.Isp_sl = cached_Isp_sl
-            config.Isp_opt = cached_Isp_opt
-            config.td_props = cached_td_props
-            config.gammae = cached_gammae
-            config.Me = cached_Me
-
     def run(self) -> None:
         """
         Starts the analysis thread if it is not already running.
 
-        This method checks if the 'analysis_thread' attribute exists and if it is alive.
-        If the thread does not exist or is not alive, it creates a new thread to run
-        the 'run_analysis' method and starts it.
+        The sweep settings are read from the widgets here, in the Tk main loop;
+        the analysis thread only computes and reports through `self.sweep_queue`,
+        which is drained by `poll_sweep` on an `after()` timer.
 
         Returns:
             None
         """
-        if not hasattr(self, 'analysis_thread') or not self.analysis_thread.is_alive():
-            self.analysis_thread = threading.Thread(target=self.run_analysis, daemon=True)
-            self.analysis_thread.start()
+        if self.is_running():
+            return
+        try:
+            job = self.get_sweep_job()
+        except ValueError:
+            return
+        self.start_job(job)
+
+    def is_running(self) -> bool:
+        return hasattr(self, 'analysis_thread') and self.analysis_thread.is_alive()
+
+    def start_job(self, job: dict) -> None:
+        """Runs a job of `run_analysis` in the analysis thread."""
+        self.job_mode = job["mode"]
+        self.cancel_event = threading.Event()
+        self.sweep_queue = queue.Queue()
+        self.last_partial_plot = 0.0
+        self.partial_plot = True
+        self.progressbar.set(0)
+        self.cancelbutton.configure(state="normal")
+        self.analysis_thread = threading.Thread(target=self.run_analysis, args=(job,), daemon=True)
+        self.analysis_thread.start()
+        self.after(SWEEP_POLL_MS, self.poll_sweep)
+
+    def cancel(self) -> None:
+        """Requests the running analysis to stop; completed cells are kept."""
+        if hasattr(self, 'cancel_event'):
+            self.cancel_event.set()
+            logger.info("Nested analysis cancellation requested.")
+
+    def get_sweep_job(self) -> dict:
+        """
+        Reads the nested analysis settings from the widgets.
 
-    # Unfortunately the analyses cannot be multithreaded as they rely on the same config variables, in the future we could try fixing this
-    def run_analysis(self) -> None:
+        Returns:
+            dict: Sweep mode ("adaptive", "doe", "surrogate" or "grid"), context,
+            inputs, the adaptive refinement variable, the sampler and the cell
+            budget. Jobs of mode
+            "columns" are built by `compute_columns` instead.
+        """
+        job = {
+            "context": self.get_sweep_context(),
+            "inputs": self.get_nested_inputs(),
+            "mode": "grid"
+        }
+        step_mode = self.inputgrid.grid_slaves(row=0, column=3)[0].get()
+        if step_mode == "Adaptive":
+            job["mode"] = "adaptive"
+            job["key"] = mapper.get_symbol(self.adaptivevariable.get())
+            job["budget"] = self.get_adaptive_budget()
+        elif self.samplermenu.get() in SAMPLERS:
+            job["mode"] = "doe"
+            job["method"] = self.samplermenu.get()
+            job["budget"] = self.get_adaptive_budget()
+        elif self.surrogatecheckbox.get():
+            job["mode"] = "surrogate"
+        return job
+
+    def run_analysis(self, job: dict) -> None:
         """
         Executes the nested parameter configuration and performance calculation.
-        This method performs the following steps:
-        1. Retrieves nested input parameters.
-        2. Generates the Cartesian product of the input parameters using `numpy.meshgrid`.
-        3. Initializes a results array to store the output for each combination of parameters.
-        4. Iterates over all combinations of parameters and runs an analysis.
-        5. Stores the results in a dictionary and updates the results array.
-        6. Formats the results into a table and updates the GUI textbox with the table.
-
-        The `inputs` dictionary is expected to have the following structure:
+        This method runs in the analysis thread and performs the following steps:
+        1. Generates the Cartesian product of the input parameters using `numpy.meshgrid`.
+        2. Evaluates all combinations of parameters with `run_sweep`, which distributes
+           large grids over a pool of worker processes. Cells already computed by a
+           previous run with the same settings are taken from the cell store.
+           In surrogate mode the cells are interpolated from a CEA surrogate table
+           instead, and in "Adaptive" step mode the grid is refined by `adaptive_sweep`
+           up to the cell budget. With a design-of-experiments sampler, only as many
+           cells as the budget are evaluated and a response surface fitted to
+           them fills in the grid. Completed cells are checkpointed to disk, so that
+           an interrupted sweep resumes where it stopped when it is run again.
+        3. Posts progress and completion messages to `self.sweep_queue`.
+
+        Jobs of mode "columns" compute dependent variables that are not part of
+        the base sweep on the existing results instead, see `compute_columns`.
+
+        The `inputs` dictionary of the job is expected to have the following structure:
         {
             "mr": numpy.ndarray,   # Mixture ratio values
             "pc": numpy.ndarray,   # Chamber pressure values
@@ -258,106 +330,258 @@ class NestedFrame(CTkFrame):
             "eps": numpy.ndarray   # Exit condition values
         }
 
+        Args:
+            job (dict): Sweep settings, see `get_sweep_job`.
+
         Returns:
             None
         """
-        with self._cache_config():
-            inputs = self.get_nested_inputs()
-            # Generate Cartesian product using meshgrid
-            mr, pc, epsc, eps = np.meshgrid(
-                inputs["mr"],
-                inputs["pc"],
-                inputs["epsc"],
-                inputs["eps"],
-                indexing='ij'
-            )
-            # Initialize results array with the appropriate shape
-            self.results = np.empty(mr.shape, dtype=object)
-            # Iterate over all combinations using a multidimensional index
-            for idx,index in enumerate(np.ndindex(mr.shape)):
-                self.progressbar.set((idx+1) / mr.size)
-                self.progressbar.update_idletasks()
-
-                # Apply the current nested parameters
-                config.mr = mr[index]
-                config.pc = pc[index]
-                config.epsc = epsc[index]
-
-                C = CEA_Obj(
-                    oxName=config.ox,
-                    fuelName=config.fuel,
-                    fac_CR=config.epsc,
-                    cstar_units="m/s",
-                    pressure_units="Pa",
-                    temperature_units="K",
-                    sonic_velocity_units="m/s",
-                    enthalpy_units="kJ/kg",
-                    density_units="kg/m^3",
-                    specific_heat_units="J/kg-K",
+        progress = lambda done, total: self.sweep_queue.put(("progress", done, total))
+        if job["mode"] == "columns":
+            try:
+                providers.ensure_columns(
+                    self.results, job["keys"], job["context"], job["design"],
+                    progress=progress, cancel=self.cancel_event
                 )
-                # Manage exit condition
-                eps_row = self.rows[3]
-                if eps_row["checkbox"].get():
-                    eps_dropdown = eps_row["unit_dropdown"].get()
-                    if eps_dropdown == "Expansion Area Ratio (Ae/At)":
-                        eps_tmp = eps[index]
-                    else:
-                        if eps_dropdown == "Pressure Ratio (pc/pe)":
-                            pe = config.pc / eps[index]
-                        else: # Exit pressure
-                            # Capture content in parentheses
-                            match = re.search(r'\((.*?)\)', eps_dropdown)
-                            unit = match.group(1)
-                            pe = eps[index] * pressure_uom(unit)
-                        eps_tmp = C.get_eps_at_PcOvPe(Pc=config.pc, MR=config.mr, PcOvPe=config.pc / pe)
+            except SweepCancelled:
+                self.sweep_queue.put(("cancelled",))
+            except Exception as e:
+                self.sweep_queue.put(("error", e))
+            else:
+                self.sweep_queue.put(("done",))
+            return
+
+        context, inputs = job["context"], job["inputs"]
+        # The results and context of the previous run are kept until the
+        # results of this job are published; set once they are
+        published = False
+        try:
+            if job["mode"] == "adaptive":
+                results = adaptive_sweep(
+                    context, inputs, job["key"], job["budget"],
+                    progress=progress, cancel=self.cancel_event, checkpoint=True
+                )
+                self.cellstore.put(context, results)
+            elif job["mode"] == "doe":
+                results = doe_sweep(
+                    context, inputs, job["budget"], job["method"], progress=progress, cancel=self.cancel_event
+                )
+            else:
+                # Generate Cartesian product using meshgrid
+                grid = np.meshgrid(
+                    inputs["mr"],
+                    inputs["pc"],
+                    inputs["epsc"],
+                    inputs["eps"],
+                    indexing='ij'
+                )
+                if job["mode"] == "surrogate":
+                    results = surrogate_sweep(context, grid, progress=progress, cancel=self.cancel_event)
+                else:
+                    # Only the cells not shared with a previous run are evaluated.
+                    # The results are published before the sweep starts, so that
+                    # partial plots can be drawn while cells are being filled in.
+                    results, mask = self.cellstore.prepare(context, inputs)
+                    self.results, self.results_context = results, context
+                    published = True
+                    run_sweep(
+                        context, grid, progress=progress, results=results,
+                        mask=mask, cancel=self.cancel_event, checkpoint=True
+                    )
+                    self.cellstore.put(context, results)
+            self.results, self.results_context = results, context
+        except SweepCancelled:
+            self.sweep_queue.put(("cancelled", published))
+        except Exception as e:
+            self.sweep_queue.put(("error", e))
+        else:
+            self.sweep_queue.put(("done",))
+
+    def poll_sweep(self) -> None:
+        """
+        Drains the sweep queue in the Tk main loop: updates the progress bar,
+        redraws an open plot window at most every `PARTIAL_PLOT_INTERVAL` seconds
+        and shows the results table when the sweep ends.
+        """
+        progress, finished = None, None
+        try:
+            while True:
+                message = self.sweep_queue.get_nowait()
+                if message[0] == "progress":
+                    progress = message[1:]
                 else:
-                    eps_tmp = eps[index]
-                config.eps = eps_tmp
-
-                # Calculate the theoretical performance
-                theoretical()
-                result_dict = {
-                    "mr": config.mr,
-                    "pc": config.pc,
-                    "epsc": config.epsc,
-                    "eps": config.eps,
-                    "cstar": config.cstar,
-                    "Isp_vac": config.Isp_vac,
-                    "Isp_vac_eq": config.Isp_vac_eq,
-                    "Isp_vac_fr": config.Isp_vac_fr,
-                    "Isp_sl": config.Isp_sl,
-                    "Isp_opt": config.Isp_opt,
-                    "td_props": config.td_props,
-                    "gammae": config.gammae,
-                    "Me": config.Me
-                }
-                self.results[index] = result_dict
-
-            #    The results are stored in a 4D array, where each axis corresponds
-            #    to a different variable (mr, pc, epsc, eps).
-            #    Each element of the array is a dictionary containing the variables
-            #    and the results of the analysis executed with those variables.
-            #
-            #               ,-'‾‾,-'‾‾,-'‾‾,-'|                ,-'‾‾,-'‾‾,-'‾‾,-'|
-            #           ,-'‾‾,-'‾‾,-'‾‾,-'|   |            ,-'‾‾,-'‾‾,-'‾‾,-'|   |
-            #       ,-'‾‾,-'‾‾,-'‾‾,-'|   |,-'|        ,-'‾‾,-'‾‾,-'‾‾,-'|   |,-'|
-            #      |‾‾‾‾|‾‾‾‾|‾‾‾‾|   |,-'|   |       |‾‾‾‾|‾‾‾‾|‾‾‾‾|   |,-'|   |
-            #      |____|____|____|,-'|   |,-'|       |____|____|____|,-'|   |,-'|
-            #    pc|    |    |    |   |,-'|   |     pc|    |    |    |   |,-'|   |
-            #      |____|____|____|,-'|   |,-'        |____|____|____|,-'|   |,-'
-            #      |    |    |    |   |,-' epsc       |    |    |    |   |,-' epsc
-            #      |____|____|____|,-'                |____|____|____|,-'
-            #             mr                                 mr
-            #               ----------------eps---------------->
-
-            headers = ["mr", "pc [Pa]", "epsc", "eps", "c* [m/s]", "Isp (SL) [s]", "Isp (opt) [s]", "Isp (vac) [s]", "gamma_e", "M_e"]
-            table_data = [
-                [result["mr"], result["pc"], result["epsc"], result["eps"], result["cstar"], result["Isp_sl"], result["Isp_opt"], result["Isp_vac"], result["gammae"], result["Me"]]
-                for result in self.results.flatten()
-            ]
-
-            table = tabulate(table_data, headers, numalign="right")
-            update_textbox(self.textbox, table, disabled=True)
+                    finished = message
+        except queue.Empty:
+            pass
+
+        if progress is not None:
+            self.update_progress(*progress)
+            now = time.monotonic()
+            if self.job_mode != "columns" and self.partial_plot and self.plotwindow is not None \
+                    and self.plotwindow.winfo_exists() and now - self.last_partial_plot > PARTIAL_PLOT_INTERVAL:
+                self.last_partial_plot = now
+                self.plot_partial()
+
+        if finished is None:
+            self.after(SWEEP_POLL_MS, self.poll_sweep)
+            return
+
+        self.cancelbutton.configure(state="disabled")
+        if finished[0] == "error":
+            logger.error(f"Nested analysis failed: {finished[1]}")
+            if self.job_mode == "columns":
+                showwarning("Plot Failed", f"Could not compute the plotted variable:\n{finished[1]}")
+            else:
+                showwarning("Analysis Failed", f"The nested analysis failed:\n{finished[1]}")
+            return
+        if self.job_mode == "columns":
+            self.update_progress(1, 1)
+            if finished[0] == "cancelled":
+                logger.warning("Nested variable computation cancelled.")
+            elif self.plotwindow is not None and self.plotwindow.winfo_exists():
+                self.plot_wrap()
+            return
+        if finished[0] == "cancelled":
+            if not finished[1]:
+                # Only sweeps on the grid publish their results as they run
+                logger.warning("Nested analysis cancelled.")
+                return
+            logger.warning("Nested analysis cancelled, showing partial results.")
+        else:
+            self.update_progress(1, 1)
+        self.show_results()
+
+    def export_results(self) -> None:
+        """Saves the results of the nested analysis to a .npz archive."""
+        if not isinstance(getattr(self, "results", None), NestedResults):
+            showwarning("No Results", "Run the nested analysis first.")
+            return
+        path = asksaveasfilename(
+            defaultextension=".npz", filetypes=(("Nested results", "*.npz"), ("all files", "*.*"))
+        )
+        if path:
+            storage.export_results(path, self.results, getattr(self, "results_context", None))
+
+    def import_results(self) -> None:
+        """
+        Opens nested results saved by `export_results`. The archive is
+        memory-mapped, so only the variables that are plotted are read.
+        """
+        if hasattr(self, 'analysis_thread') and self.analysis_thread.is_alive():
+            showwarning("Analysis Running", "Wait for the nested analysis to finish or cancel it.")
+            return
+        path = askopenfilename(
+            title="Load nested results", filetypes=(("Nested results", "*.npz"), ("all files", "*.*"))
+        )
+        if not path:
+            return
+        try:
+            self.results, self.results_context = storage.import_results(path)
+        except (OSError, ValueError) as e:
+            logger.error(f"Could not import nested results: {e}")
+            showwarning("Import Failed", f"Could not import nested results:\n{e}")
+            return
+
+        # The plot window lists the axis values of the previous results
+        if self.plotwindow is not None and self.plotwindow.winfo_exists():
+            self.plotwindow.destroy()
+        logger.info(f"Loaded {path}: grid shape {self.results.shape}, variables {list(self.results.columns)}.")
+        self.show_results()
+
+    def show_results(self) -> None:
+        """Displays the results in the output table."""
+        #    The results are stored as one 4D array per variable, where each axis
+        #    corresponds to a different input (mr, pc, epsc, eps).
+        #    Each element of an array is the value of that variable for the
+        #    analysis executed with the corresponding inputs.
+        #
+        #               ,-'‾‾,-'‾‾,-'‾‾,-'|                ,-'‾‾,-'‾‾,-'‾‾,-'|
+        #           ,-'‾‾,-'‾‾,-'‾‾,-'|   |            ,-'‾‾,-'‾‾,-'‾‾,-'|   |
+        #       ,-'‾‾,-'‾‾,-'‾‾,-'|   |,-'|        ,-'‾‾,-'‾‾,-'‾‾,-'|   |,-'|
+        #      |‾‾‾‾|‾‾‾‾|‾‾‾‾|   |,-'|   |       |‾‾‾‾|‾‾‾‾|‾‾‾‾|   |,-'|   |
+        #      |____|____|____|,-'|   |,-'|       |____|____|____|,-'|   |,-'|
+        #    pc|    |    |    |   |,-'|   |     pc|    |    |    |   |,-'|   |
+        #      |____|____|____|,-'|   |,-'        |____|____|____|,-'|   |,-'
+        #      |    |    |    |   |,-' epsc       |    |    |    |   |,-' epsc
+        #      |____|____|____|,-'                |____|____|____|,-'
+        #             mr                                 mr
+        #               ----------------eps---------------->
+
+        headers = {
+            "mr": "mr",
+            "pc": "pc [Pa]",
+            "epsc": "epsc",
+            "eps": "eps",
+            "cstar": "c* [m/s]",
+            "Isp_sl": "Isp (SL) [s]",
+            "Isp_opt": "Isp (opt) [s]",
+            "Isp_vac": "Isp (vac) [s]",
+            "gammae": "gamma_e",
+            "Me": "M_e"
+        }
+        # Only the visible rows are formatted, so huge sweeps display instantly
+        columns = {key: self.results.columns[key] for key in headers if key in self.results.columns}
+        if columns:
+            self.table.set_data(columns, headers)
+        else:
+            self.table.show_text("No completed cells.")
+        logger.info(f"CEA cache statistics: {cea_cache.stats()}")
+
+    def update_progress(self, done: int, total: int) -> None:
+        """
+        Updates the progress bar with the fraction of completed cells.
+
+        Args:
+            done (int): Number of completed cells.
+            total (int): Total number of cells.
+        """
+        self.progressbar.set(done / total)
+
+    def get_adaptive_budget(self) -> int:
+        """
+        Get the maximum number of cells of an adaptive or sampled sweep.
+
+        Returns:
+            int: The cell budget.
+        """
+        try:
+            budget = int(self.adaptivebudget.get())
+        except ValueError:
+            budget = 0
+        if budget < 1:
+            showwarning("Invalid Cell Budget", "Cell budget must be a positive integer.")
+            raise ValueError("Invalid Cell Budget")
+        return budget
+
+    def get_sweep_context(self) -> dict:
+        """
+        Get the sweep-wide settings shared by every cell of the nested analysis.
+
+        Returns:
+            dict: Propellants, design exit pressure and the interpretation of the
+            nozzle exit condition values (see `rocketforge.nested.sweep.run_sweep`).
+        """
+        context = {
+            "ox": config.ox,
+            "fuel": config.fuel,
+            "pe": config.pe,
+            "exit_mode": "eps",
+            "exit_factor": 1.0
+        }
+        mr_row = self.rows[0]
+        if mr_row["checkbox"].get():
+            context["mr_optmode"] = self.mr_optmodes.get(mr_row["unit_dropdown"].get())
+        eps_row = self.rows[3]
+        if eps_row["checkbox"].get():
+            eps_dropdown = eps_row["unit_dropdown"].get()
+            if eps_dropdown == "Pressure Ratio (pc/pe)":
+                context["exit_mode"] = "ratio"
+            elif eps_dropdown != "Expansion Area Ratio (Ae/At)": # Exit pressure
+                # Capture content in parentheses
+                match = re.search(r'\((.*?)\)', eps_dropdown)
+                context["exit_mode"] = "pressure"
+                context["exit_factor"] = pressure_uom(match.group(1))
+        return context
 
     def generate_range(self, step_mode, start, end, step) -> np.ndarray:
         """
@@ -369,6 +593,8 @@ class NestedFrame(CTkFrame):
         value.
         If the step mode is "Step No.", the range will be generated using
         the specified number of steps.
+        If the step mode is "Adaptive", the specified number of steps defines
+        the coarse starting grid of the adaptive sweep.
 
         Args:
             step_mode (str): The mode to be used to generate values, either "Step Size" or "Step No.".
@@ -389,7 +615,7 @@ class NestedFrame(CTkFrame):
                 )
             return np.round(np.arange(start, end + step, step), decimals=d)
 
-        elif step_mode == "Step No.":
+        elif step_mode in ("Step No.", "Adaptive"):
             if step % 1 != 0:
                 showwarning("Invalid Step Count", "Step count must be an integer.")
                 raise ValueError("Invalid Step Count")
@@ -424,11 +650,15 @@ class NestedFrame(CTkFrame):
         Returns:
             numpy.ndarray: An array of mixture ratio values.
             If the checkbox is not selected, the value from the initial frame (config.mr) is returned.
+            If an optimal mode is selected, an array containing None is returned and the mixture
+            ratio is optimized for every cell of the analysis.
             If the checkbox is selected, a range of values is generated based on the step_mode, start,
             end, and step inputs.
         """
         row = self.rows[0]
-        if row["checkbox"].get():
+        if row["checkbox"].get() and row["unit_dropdown"].get() in self.mr_optmodes:
+            return np.array([None])
+        elif row["checkbox"].get():
             start, end, step = self.get_inputs(row)
             if row["unit_dropdown"].get() == "alpha":
                 start, end = start * config.mr_s, end * config.mr_s
@@ -522,7 +752,7 @@ class NestedFrame(CTkFrame):
         return start, end, step
 
     def plot_window(self):
-        if not hasattr(self, "results") or not isinstance(self.results, np.ndarray):
+        if not hasattr(self, "results") or not isinstance(self.results, NestedResults):
             logger.warning("Trying to open plot window without running the analysis.")
             showwarning("No Results", "Run the nested analysis first.")
             return
@@ -758,25 +988,82 @@ class NestedFrame(CTkFrame):
             self.plotwindow.lift()
             self.plotwindow.focus()
 
+    def compute_columns(self, keys: list) -> bool:
+        """
+        Starts computing dependent variables that the results do not hold yet
+        (see `rocketforge.nested.providers`) in the analysis thread. The plot
+        is drawn once they are available.
+
+        Returns:
+            bool: True if the computation was started.
+        """
+        if self.is_running():
+            logger.warning("The plotted variable is computed once the running analysis completes.")
+            return False
+        context = getattr(self, "results_context", None) or {}
+        if not all(key in context for key in ("ox", "fuel", "pe")):
+            return abort_plot("Variable not available", "The sweep settings of these results are unknown, run the nested analysis again.")
+        logger.info(f"Computing nested variables: {', '.join(keys)}.")
+        self.start_job({"mode": "columns", "keys": keys, "context": context, "design": DesignState.from_config()})
+        return True
+
     def plot_wrap(self):
         if self.plot():
             logger.info("Plotting successful.")
         else:
             logger.warning("Plotting aborted due to invalid settings or errors.")
 
+    def plot_selection(self) -> tuple:
+        """
+        Returns the axis modes of the plot window, the dependent variable
+        symbol and the number of variables and parameters selected.
+        """
+        settings = {
+            "mr": self.inputframe.mixture_mode.get(),
+            "pc": self.inputframe.pressure_mode.get(),
+            "epsc": self.inputframe.inlet_mode.get(),
+            "eps": self.inputframe.outlet_mode.get()
+        }
+        dependent_symbol = mapper.get_symbol(self.inputframe.dependent_dropdown.get())
+        return settings, dependent_symbol, countOf(settings.values(), "Variable"), countOf(settings.values(), "Parameter")
+
+    def plot_partial(self) -> None:
+        """
+        Redraws the plot window with the partial results of a running sweep.
+        Selections that cannot be drawn yet (invalid settings, or variables the
+        partial results do not hold) are skipped without logging. A redraw
+        that fails anyway is logged once and stops the partial redraws of the
+        sweep.
+        """
+        settings, dependent_symbol, var_count, param_count = self.plot_selection()
+        if var_count not in (1, 2) or param_count > 1:
+            return
+        results = getattr(self, "results", None)
+        keys = [name for name, mode in settings.items() if mode != "Constant"] + ["Isp_vac", dependent_symbol]
+        if not isinstance(results, NestedResults) or any(key not in results.columns for key in keys):
+            return
+        if providers.missing_columns(results, [dependent_symbol], DesignState.from_config()):
+            return
+        parametric = param_count > 0
+        slice_index = get_slice_index(self, parametric)
+        if not validate_slice_index(slice_index, settings)[0]:
+            return
+        if parametric and not any(len(s) > 1 for s in slice_index):
+            return
+
+        try:
+            if var_count == 1:
+                plot_2D(self, settings, dependent_symbol, param_count, verbose=False)
+            else:
+                plot_3D(self, settings, dependent_symbol, param_count, verbose=False)
+        except Exception as e:
+            logger.error(f"Partial plot failed: {e}")
+            self.partial_plot = False
+
     def plot(self):
         logger.info("Plotting...")
         try:
-            settings = {
-                "mr": self.inputframe.mixture_mode.get(),
-                "pc": self.inputframe.pressure_mode.get(),
-                "epsc": self.inputframe.inlet_mode.get(),
-                "eps": self.inputframe.outlet_mode.get()
-            }
-
-            var_count = countOf(settings.values(), "Variable")
-            param_count = countOf(settings.values(), "Parameter")
-            dependent_symbol = mapper.get_symbol(self.inputframe.dependent_dropdown.get())
+            settings, dependent_symbol, var_count, param_count = self.plot_selection()
 
             if var_count == 0:
                 return abort_plot("No variable selected", "Select at least one variable to plot.")
@@ -787,6 +1074,10 @@ class NestedFrame(CTkFrame):
             if param_count > 1:
                 return abort_plot("Too many parametric variables selected", "Only one variable can be selected for parametric plotting.")
 
+            # Variables outside the base sweep are computed on first use
+            if providers.missing_columns(self.results, [dependent_symbol], DesignState.from_config()):
+                return self.compute_columns([dependent_symbol])
+
             if var_count == 1:
                 return plot_2D(self, settings, dependent_symbol, param_count)
 
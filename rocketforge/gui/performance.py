@@ -83,6 +83,10 @@ class PerformanceFrame(ctk.CTkFrame):
 
         update_textbox(self.thermodynamicframe.textbox, x, True)
 
+        self.run_delivered()
+
+    def run_delivered(self):
+        """Updates the correction factors and the delivered performance, reusing the theoretical results."""
         correction_factors()
 
         update_entry(self.deliveredframe.reactioneffentry, config.z_r, True)
@@ -1,13 +1,13 @@
 import tkinter as tk
 import customtkinter as ctk
-import rocketforge.performance.config as pconf
-import rocketforge.thermal.config as tconf
 import rocketforge.mission.config as config
-import rocketforge.mission.analysis as msa
+import rocketforge.mission.tanks as tanks
 from customtkinter import CTkEntry, CTkFrame, CTkLabel, CTkButton
 from rocketforge.utils.conversions import mass_uom, mdot_uom, density_uom, length_uom
 from rocketforge.utils.helpers import update_entry
-from numpy import pi
+from rocketforge.utils.lazy import lazy_import
+
+msa = lazy_import("rocketforge.mission.analysis")
 
 
 class TanksFrame(ctk.CTkFrame):
@@ -287,45 +287,37 @@ class TanksFrame(ctk.CTkFrame):
     def compute(self):
         try:
             if self.mdotentry.get() == "":
-                update_entry(self.mdotentry, (pconf.m_f_d + pconf.m_ox_d) /  mdot_uom(self.mdotuom.get()))
+                update_entry(self.mdotentry, tanks.default_mdot() / mdot_uom(self.mdotuom.get()))
             if self.mrentry.get() == "":
-                if tconf.film:
-                    update_entry(self.mrentry, pconf.mr * (100 + tconf.oxfilm) / (100 + tconf.fuelfilm))
-                else:
-                    update_entry(self.mrentry, pconf.mr)
+                update_entry(self.mrentry, tanks.default_mr())
         except Exception:
             pass
 
         try:
-            config.mdot = float(self.mdotentry.get()) * mdot_uom(self.mdotuom.get())
-            config.MR = float(self.mrentry.get())
-            config.prop_mass = float(self.mpentry.get()) * mass_uom(self.mpuom.get())
-            k0 = float(self.k0entry.get()) * mass_uom(self.k0uom.get())
-            config.tanks_mass = k0 + float(self.ktentry.get()) * config.prop_mass
-            config.ox_rho = float(self.oxrhoentry.get()) * density_uom(self.oxrhouom.get())
-            config.fuel_rho = float(self.fuelrhoentry.get()) * density_uom(self.fuelrhouom.get())
-            config.r_ox = float(self.oxrentry.get()) * length_uom(self.oxruom.get())
-            config.r_fuel = float(self.fuelrentry.get()) * length_uom(self.fuelruom.get())
-            config.exc_ox = float(self.oxexcentry.get())
-            config.exc_fuel = float(self.fuelexcentry.get())
+            sizes = tanks.size_tanks(
+                float(self.mdotentry.get()) * mdot_uom(self.mdotuom.get()),
+                float(self.mrentry.get()),
+                float(self.mpentry.get()) * mass_uom(self.mpuom.get()),
+                float(self.k0entry.get()) * mass_uom(self.k0uom.get()),
+                float(self.ktentry.get()),
+                float(self.oxrhoentry.get()) * density_uom(self.oxrhouom.get()),
+                float(self.fuelrhoentry.get()) * density_uom(self.fuelrhouom.get()),
+                float(self.oxrentry.get()) * length_uom(self.oxruom.get()),
+                float(self.fuelrentry.get()) * length_uom(self.fuelruom.get()),
+                float(self.oxexcentry.get()),
+                float(self.fuelexcentry.get()),
+            )
             config.ox_tank_pos = float(self.oxxentry.get()) * length_uom(self.oxxuom.get())
             config.fuel_tank_pos = float(self.fuelxentry.get()) * length_uom(self.fuelxuom.get())
 
-            m_ox = config.prop_mass * config.MR / (1 + config.MR)
-            m_fuel = config.prop_mass / (1 + config.MR)
-            mdot_ox = config.mdot * config.MR / (1 + config.MR)
-            mdot_fuel = config.mdot / (1 + config.MR)
-            h_ox = config.exc_ox * m_ox / config.ox_rho / (pi * config.r_ox**2)
-            h_fuel = config.exc_fuel * m_fuel / config.fuel_rho / (pi * config.r_fuel**2)
-
-            update_entry(self.mtentry, config.tanks_mass, True)
-            update_entry(self.tbentry, config.prop_mass / config.mdot, True)
-            update_entry(self.oxhentry, h_ox, True)
-            update_entry(self.fuelhentry, h_fuel, True)
-            update_entry(self.oxmdotentry, mdot_ox, True)
-            update_entry(self.fuelmdotentry, mdot_fuel, True)
-            update_entry(self.oxmentry, m_ox, True)
-            update_entry(self.fuelmentry, m_fuel, True)
+            update_entry(self.mtentry, sizes["tanks_mass"], True)
+            update_entry(self.tbentry, sizes["burn_time"], True)
+            update_entry(self.oxhentry, sizes["h_ox"], True)
+            update_entry(self.fuelhentry, sizes["h_fuel"], True)
+            update_entry(self.oxmdotentry, sizes["mdot_ox"], True)
+            update_entry(self.fuelmdotentry, sizes["mdot_fuel"], True)
+            update_entry(self.oxmentry, sizes["m_ox"], True)
+            update_entry(self.fuelmentry, sizes["m_fuel"], True)
 
             msa.set_engine()
         except Exception:
@@ -4,12 +4,16 @@ from tkinter.messagebox import showwarning
 from customtkinter import CTkEntry, CTkButton, CTkFrame, CTkLabel, CTkCheckBox, CTkOptionMenu
 import rocketforge.thermal.config as config
 import rocketforge.performance.config as pconf
-from rocketforge.thermal.regenerative import Regen
+import rocketforge.thermal.cooling as cooling
 from rocketforge.utils.conversions import mdot_uom, temperature_uom, pressure_uom, length_uom
 from rocketforge.utils.resources import resource_path
 from rocketforge.utils.helpers import update_entry
+from rocketforge.utils.lazy import lazy_import
 import warnings
 
+# The solver loads rocketprops, matplotlib and pyvista on the first analysis
+regenerative = lazy_import("rocketforge.thermal.regenerative")
+
 
 class ThermalFrame(ctk.CTkFrame):
     def __init__(self, master=None, **kw):
@@ -196,7 +200,7 @@ class ThermalFrame(ctk.CTkFrame):
     def run(self):
         if config.regen:
             try:
-                self.regen = Regen()
+                self.regen = regenerative.Regen()
                 self.regen.run()
             except RuntimeWarning:
                 raise Exception
@@ -556,23 +560,23 @@ class ThermalFrame(ctk.CTkFrame):
         config.film = self.filmvar.get()
 
     def load_regen_cooling(self):
-        config.regen = self.regenvar.get()
-        config.coolant = self.coolant.get()
-        config.m_dot_c = float(self.mdotcentry.get()) * mdot_uom(self.mdotcuom.get())
-        config.T_ci = temperature_uom(float(self.tcientry.get()), self.tciuom.get())
-        config.enable_dp = self.dp.get()
-        if config.enable_dp:
-            config.p_ci = pconf.pc * config.pcoOvpc
-        else:
-            config.p_ci = float(self.pcientry.get()) * pressure_uom(self.pciuom.get())
-        config.t_w = float(self.tentry.get()) * length_uom(self.tuom.get())
-        config.lambda_w = float(self.kentry.get())
+        cooling.set_regen_cooling(
+            self.regenvar.get(),
+            self.coolant.get(),
+            float(self.mdotcentry.get()) * mdot_uom(self.mdotcuom.get()),
+            temperature_uom(float(self.tcientry.get()), self.tciuom.get()),
+            self.dp.get(),
+            None if self.dp.get() else float(self.pcientry.get()) * pressure_uom(self.pciuom.get()),
+            float(self.tentry.get()) * length_uom(self.tuom.get()),
+            float(self.kentry.get()),
+        )
     
     def load_rad_cooling(self):
-        config.rad = self.radvar.get()
-        config.eps_w = float(self.radepsentry.get())
+        cooling.set_rad_cooling(self.radvar.get(), float(self.radepsentry.get()))
 
     def load_film_cooling(self):
-        config.film = self.filmvar.get()
-        config.oxfilm = 0.0 if self.oxfilm.get() == "" else float(self.oxfilm.get())
-        config.fuelfilm = 0.0 if self.fuelfilm.get() == "" else float(self.fuelfilm.get())
\ No newline at end of file
+        cooling.set_film_cooling(
+            self.filmvar.get(),
+            0.0 if self.fuelfilm.get() == "" else float(self.fuelfilm.get()),
+            0.0 if self.oxfilm.get() == "" else float(self.oxfilm.get()),
+        )
@@ -3,6 +3,7 @@ from rocketpy import Fluid, LiquidMotor, CylindricalTank, MassFlowRateBasedTank
 from rocketpy import Environment, Rocket, Flight
 from datetime import datetime
 from numpy import pi
+from rocketforge.utils.tracing import span
 
 
 def set_environment():
@@ -126,13 +127,14 @@ def add_parachute():
 
 def simulate():
     # Simulate flight
-    config.flight = Flight(
-        rocket=config.rocket,
-        environment=config.env,
-        rail_length=config.rail_length,
-        inclination=config.inclination,
-        heading=config.heading,
-    )
+    with span("Flight", "rocketpy"):
+        config.flight = Flight(
+            rocket=config.rocket,
+            environment=config.env,
+            rail_length=config.rail_length,
+            inclination=config.inclination,
+            heading=config.heading,
+        )
     # Print Environment Data
     config.env.prints.gravity_details()
     config.env.prints.launch_site_details()
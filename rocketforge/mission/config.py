@@ -63,9 +63,11 @@ rail_length = None
 inclination = None
 heading = None
 
-# Simulation Parameters
-from rocketpy import Environment, LiquidMotor, Rocket, Flight
-env : Environment = None
-engine : LiquidMotor = None
-rocket : Rocket = None
-flight : Flight = None
\ No newline at end of file
+# Simulation Parameters (rocketpy objects, imported by the mission analysis on first use)
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from rocketpy import Environment, LiquidMotor, Rocket, Flight
+env : "Environment" = None
+engine : "LiquidMotor" = None
+rocket : "Rocket" = None
+flight : "Flight" = None
\ No newline at end of file
@@ -0,0 +1,60 @@
+import rocketforge.performance.config as pconf
+import rocketforge.thermal.config as tconf
+import rocketforge.mission.config as config
+from numpy import pi
+
+
+def default_mdot() -> float:
+    """Delivered propellant mass flow rate of the engine."""
+    return pconf.m_f_d + pconf.m_ox_d
+
+
+def default_mr() -> float:
+    """Mixture ratio of the propellant drawn from the tanks, film coolant included."""
+    if tconf.film:
+        return pconf.mr * (100 + tconf.oxfilm) / (100 + tconf.fuelfilm)
+    return pconf.mr
+
+
+def size_tanks(mdot: float, MR: float, prop_mass: float, k0: float, kt: float, ox_rho: float, fuel_rho: float,
+               r_ox: float, r_fuel: float, exc_ox: float, exc_fuel: float) -> dict:
+    """
+    #### Tanks sizing.
+    Stores the tank settings in the mission config, used by the tanks tab
+    and the batch runner, and sizes the propellant tanks.
+
+    Parameters:
+        mdot (float): Propellant mass flow rate in kg/s.
+        MR (float): Mixture ratio.
+        prop_mass (float): Propellant mass in kg.
+        k0, kt (float): Dry tanks and feed system mass, k0 + kt * prop_mass, in kg.
+        ox_rho, fuel_rho (float): Propellant densities in kg/m^3.
+        r_ox, r_fuel (float): Tank radii in m.
+        exc_ox, exc_fuel (float): Tank volume factors (volume over propellant volume).
+
+    Returns:
+        dict: Burn time, tanks mass, propellant masses and flow rates, and tank lengths.
+    """
+    config.mdot = mdot
+    config.MR = MR
+    config.prop_mass = prop_mass
+    config.tanks_mass = k0 + kt * prop_mass
+    config.ox_rho = ox_rho
+    config.fuel_rho = fuel_rho
+    config.r_ox = r_ox
+    config.r_fuel = r_fuel
+    config.exc_ox = exc_ox
+    config.exc_fuel = exc_fuel
+
+    m_ox = prop_mass * MR / (1 + MR)
+    m_fuel = prop_mass / (1 + MR)
+    return {
+        "burn_time": prop_mass / mdot,
+        "tanks_mass": config.tanks_mass,
+        "m_ox": m_ox,
+        "m_fuel": m_fuel,
+        "mdot_ox": mdot * MR / (1 + MR),
+        "mdot_fuel": mdot / (1 + MR),
+        "h_ox": exc_ox * m_ox / ox_rho / (pi * r_ox**2),
+        "h_fuel": exc_fuel * m_fuel / fuel_rho / (pi * r_fuel**2),
+    }
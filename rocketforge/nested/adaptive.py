@@ -0,0 +1,157 @@
+import threading
+import numpy as np
+from typing import Callable
+from rocketforge.nested.results import AXES, NestedResults
+from rocketforge.nested.sweep import run_sweep
+from rocketforge.nested.checkpoint import Checkpoint
+from rocketforge.utils.logger import logger
+
+
+# Interpolation error (relative to the variable range) below which an interval is not refined
+ADAPTIVE_TOLERANCE = 1e-3
+# Maximum number of refinement passes
+ADAPTIVE_MAX_PASSES = 10
+
+
+def interval_errors(results: NestedResults, key: str) -> dict:
+    """
+    Estimates the linear interpolation error of a variable on every interval
+    of every axis with at least two points.
+
+    The error of interval [x_i, x_i+1] is estimated as |f''| h^2 / 8, with the
+    second derivative taken from the nonuniform second difference at the
+    interval ends, maximized over all other axes and normalized by the range
+    of the variable. An axis with two points has no curvature estimate: the
+    error of its only interval is taken as the variation of the variable
+    across it, so that it is bisected whenever the variable depends on it.
+
+    Returns:
+        dict: Array of interval errors, keyed by axis name.
+    """
+    f = results.column(key)
+    span = np.nanmax(f) - np.nanmin(f)
+    if not span > 0:
+        return {}
+
+    errors = {}
+    for axis, name in enumerate(AXES):
+        x = results.axes[name]
+        if len(x) < 2:
+            continue
+        x = x.astype(float)
+        h = np.diff(x)
+        g = np.moveaxis(f, axis, 0)
+        if len(x) == 2:
+            errors[name] = np.array([np.nanmax(np.abs(g[1] - g[0])) / span])
+            continue
+        slope = np.diff(g, axis=0) / h.reshape((-1,) + (1,) * (g.ndim - 1))
+        d2 = 2 * np.diff(slope, axis=0) / (h[:-1] + h[1:]).reshape((-1,) + (1,) * (g.ndim - 1))
+        d2 = np.nanmax(np.abs(d2).reshape(len(d2), -1), axis=1)
+
+        # Interior points bound both neighbouring intervals
+        curvature = np.zeros(len(h))
+        curvature[:-1] = d2
+        curvature[1:] = np.maximum(curvature[1:], d2)
+        errors[name] = curvature * h ** 2 / 8 / span
+    return errors
+
+
+def refine_axes(results: NestedResults, key: str, budget: int, tolerance: float = ADAPTIVE_TOLERANCE) -> dict:
+    """
+    Inserts midpoints into the intervals with the largest interpolation
+    error, as long as the refined grid fits within `budget` cells.
+
+    Returns:
+        dict: The refined axes, or None if no interval can or needs to be refined.
+    """
+    errors = interval_errors(results, key)
+    candidates = sorted(
+        ((error, name, i) for name, values in errors.items() for i, error in enumerate(values)),
+        reverse=True,
+    )
+
+    sizes = {name: len(results.axes[name]) for name in AXES}
+    inserted = {name: [] for name in AXES}
+    for error, name, i in candidates:
+        if error < tolerance:
+            break
+        cells = np.prod([sizes[n] + (n == name) for n in AXES])
+        if cells > budget:
+            continue
+        x = results.axes[name].astype(float)
+        inserted[name].append((x[i] + x[i + 1]) / 2)
+        sizes[name] += 1
+
+    if not any(inserted.values()):
+        return None
+    return {
+        name: np.sort(np.concatenate([results.axes[name], inserted[name]])) if inserted[name] else results.axes[name]
+        for name in AXES
+    }
+
+
+def adaptive_sweep(context: dict, axes: dict, key: str, budget: int, progress: Callable[[int, int], None] = None,
+                   workers: int = None, tolerance: float = ADAPTIVE_TOLERANCE, cancel: threading.Event = None,
+                   checkpoint: bool = False) -> NestedResults:
+    """
+    Nested analysis with adaptive refinement.
+
+    The coarse grid spanned by `axes` is evaluated first; then, on every pass,
+    the intervals where the interpolation error of `key` is largest are split
+    and only the new cells are evaluated. The grid stays Cartesian, so the
+    results are plotted like those of a uniform sweep.
+
+    Args:
+        context (dict): Sweep-wide settings, see `run_sweep`.
+        axes (dict): Starting axis values, keyed by the names in `AXES`.
+        key (str): Symbol of the dependent variable driving the refinement.
+        budget (int): Maximum number of cells, starting grid included.
+        progress (Callable, optional): Called with (evaluated cells, budget).
+        workers (int, optional): Number of worker processes.
+        tolerance (float, optional): Target relative interpolation error.
+        cancel (threading.Event, optional): Cancel token, see `run_sweep`.
+        checkpoint (bool, optional): Checkpoint the cells of every pass to a file keyed
+            by the adaptive sweep definition (starting axes, key, budget and tolerance),
+            so that an interrupted sweep resumes without evaluating the finished
+            cells of any pass again. The file is removed once all passes complete.
+
+    Returns:
+        NestedResults: Results on the refined grid.
+
+    Raises:
+        ValueError: If the starting grid has more cells than `budget`.
+    """
+    cells = int(np.prod([len(axes[name]) for name in AXES]))
+    if cells > budget:
+        raise ValueError(f"The starting grid has {cells} cells, more than the budget of {budget} cells.")
+
+    evaluated = 0
+
+    def report(done: int, total: int) -> None:
+        if progress is not None:
+            progress(min(evaluated + done, budget), budget)
+
+    store = None
+    if checkpoint:
+        store = Checkpoint(context, axes, options={"key": key, "budget": budget, "tolerance": tolerance})
+
+    grid = np.meshgrid(*(axes[name] for name in AXES), indexing="ij")
+    results = run_sweep(context, grid, progress=report, workers=workers, cancel=cancel, checkpoint=store)
+    evaluated = results.size
+
+    for _ in range(ADAPTIVE_MAX_PASSES):
+        refined = refine_axes(results, key, budget, tolerance)
+        if refined is None:
+            break
+        results, mask = results.reindex(refined)
+        grid = np.meshgrid(*(refined[name] for name in AXES), indexing="ij")
+        results = run_sweep(context, grid, progress=report, workers=workers, results=results, mask=mask, cancel=cancel,
+                            checkpoint=store)
+        evaluated += int(mask.sum())
+
+    if store is not None:
+        store.remove()
+    logger.info(f"Adaptive sweep: {evaluated} cells, grid shape {results.shape}.")
+    if progress is not None:
+        progress(1, 1)
+    return results
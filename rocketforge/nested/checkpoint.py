@@ -0,0 +1,110 @@
+import os
+import json
+import time
+import pickle
+import hashlib
+import numpy as np
+from rocketforge.nested.results import AXES, _axis_key
+from rocketforge.utils.logger import logger
+
+
+CHECKPOINT_DIR = os.path.join(os.path.expanduser("~"), ".rocketforge", "checkpoints")
+# Minimum interval between checkpoint writes, in s
+CHECKPOINT_INTERVAL = 10.0
+# Bumped whenever the cell layout changes, so that stale checkpoints are ignored
+CHECKPOINT_VERSION = 3
+
+
+def sweep_key(context: dict, axes: dict, evaluate: str = "evaluate_cell", options: dict = None) -> str:
+    """
+    Returns the hash of a sweep definition (settings, cell function, axis
+    values and the options of sweeps spanning several grids).
+    """
+    definition = [
+        CHECKPOINT_VERSION,
+        evaluate,
+        sorted(context.items()),
+        [[None if value is None else float(value) for value in axes[name]] for name in AXES],
+        sorted((options or {}).items()),
+    ]
+    return hashlib.sha1(json.dumps(definition, default=float).encode()).hexdigest()
+
+
+class Checkpoint:
+    """
+    Append-only file of the completed cells of a sweep.
+
+    Cells are buffered and appended as pickled batches of (grid point, cell)
+    pairs at most every `CHECKPOINT_INTERVAL` seconds. A batch truncated by a
+    crash is ignored on load, so a checkpoint is always readable. Cells are
+    stored by their axis values rather than by their index, so that a
+    checkpoint can be shared by the successive grids of an adaptive sweep.
+    """
+
+    def __init__(self, context: dict, axes: dict, evaluate: str = "evaluate_cell", directory: str = CHECKPOINT_DIR,
+                 options: dict = None):
+        self.key = sweep_key(context, axes, evaluate, options)
+        self.path = os.path.join(directory, f"{self.key}.ckpt")
+        self._buffer = []
+        self._last_write = time.monotonic()
+
+    def load(self, axes: dict) -> list:
+        """Returns the (flat index, cell) pairs of the grid `axes` saved by previous runs."""
+        cells = []
+        if not os.path.exists(self.path):
+            return cells
+        points = []
+        with open(self.path, "rb") as f:
+            while True:
+                try:
+                    points.extend(pickle.load(f))
+                except EOFError:
+                    break
+                except (pickle.UnpicklingError, ValueError, AttributeError):
+                    logger.warning(f"Ignoring truncated batch in checkpoint {self.path}.")
+                    break
+
+        positions = [{_axis_key(value): i for i, value in enumerate(axes[name])} for name in AXES]
+        shape = tuple(len(axes[name]) for name in AXES)
+        for point, cell in points:
+            index = [position.get(value) for position, value in zip(positions, point)]
+            if None not in index:
+                cells.append((int(np.ravel_multi_index(index, shape)), cell))
+        if cells:
+            logger.info(f"Resuming sweep from checkpoint: {len(cells)} cells restored.")
+        return cells
+
+    def add(self, cells: list, axes: dict) -> None:
+        """
+        Buffers completed (flat index, cell) pairs of the grid `axes`, writing
+        them if the interval has elapsed.
+        """
+        shape = tuple(len(axes[name]) for name in AXES)
+        for idx, cell in cells:
+            index = np.unravel_index(idx, shape)
+            self._buffer.append((tuple(_axis_key(axes[name][i]) for name, i in zip(AXES, index)), cell))
+        if time.monotonic() - self._last_write > CHECKPOINT_INTERVAL:
+            self.flush()
+
+    def flush(self) -> None:
+        """Appends the buffered cells to the checkpoint file."""
+        if not self._buffer:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, "ab") as f:
+                pickle.dump(self._buffer, f, protocol=pickle.HIGHEST_PROTOCOL)
+                f.flush()
+                os.fsync(f.fileno())
+        except OSError as err:
+            logger.warning(f"Could not write checkpoint: {err}")
+        self._buffer = []
+        self._last_write = time.monotonic()
+
+    def remove(self) -> None:
+        """Deletes the checkpoint file of a completed sweep."""
+        self._buffer = []
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,249 @@
+import threading
+import warnings
+import numpy as np
+from typing import Callable
+from rocketforge.performance.surrogate import LOG_AXES
+from rocketforge.nested.results import AXES, NestedResults
+from rocketforge.nested.sweep import run_sweep
+from rocketforge.utils.logger import logger
+
+
+# Design-of-experiments samplers
+SAMPLERS = ("Latin hypercube", "Sobol", "Halton")
+# Radial basis function of the response surface
+DOE_KERNEL = "thin_plate_spline"
+# Fraction of the samples held out to estimate the response surface error
+DOE_HOLDOUT = 0.1
+# Number of grid cells evaluated per response surface query
+DOE_QUERY_CHUNK = 65536
+
+
+def _dims(axes: dict) -> list:
+    """Returns the names of the axes that span more than one value."""
+    return [name for name in AXES if len(axes[name]) > 1]
+
+
+def _coords(name: str, values: np.ndarray) -> np.ndarray:
+    values = np.asarray(values, dtype=float)
+    return np.log(values) if name in LOG_AXES else values
+
+
+def min_samples(axes: dict) -> int:
+    """
+    Returns the smallest budget a response surface can be fitted with: the
+    polynomial tail of the RBF needs d + 1 points once a sample is held out.
+    """
+    return len(_dims(axes)) + 2
+
+
+def sample_points(axes: dict, budget: int, method: str = "Latin hypercube", seed: int = 0) -> dict:
+    """
+    Draws scattered samples of the box spanned by the axes.
+
+    Pressure and area ratio axes are sampled on a logarithmic scale, axes with
+    a single value are held fixed. The corners of the box are always included
+    when they take at most a quarter of the budget, so that the response
+    surface never extrapolates. Sobol sequences are only balanced for powers
+    of two, so a warning is logged for other sample counts.
+
+    Args:
+        axes (dict): Axis values, keyed by the names in `AXES`.
+        budget (int): Maximum number of samples.
+        method (str, optional): One of `SAMPLERS`.
+        seed (int, optional): Seed of the (scrambled) sequences.
+
+    Returns:
+        dict: Arrays of sample values, keyed by axis name.
+
+    Raises:
+        ValueError: If the budget is smaller than `min_samples`, or the sampler is unknown.
+    """
+    from scipy.stats import qmc
+
+    dims = _dims(axes)
+    d = len(dims)
+    if budget < min_samples(axes):
+        raise ValueError(
+            f"A response surface over {d} axes needs a budget of at least {min_samples(axes)} samples, got {budget}."
+        )
+    corners = np.array(np.meshgrid(*([[0.0, 1.0]] * d), indexing="ij")).reshape(d, -1).T
+    if 4 * len(corners) > budget:
+        corners = np.empty((0, d))
+    n = budget - len(corners)
+
+    if method == "Latin hypercube":
+        unit = qmc.LatinHypercube(d, seed=seed).random(n)
+    elif method == "Sobol":
+        if n & (n - 1):
+            logger.warning(f"Sobol sampling of {n} points: the sequence is only balanced for powers of two.")
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", UserWarning)
+            unit = qmc.Sobol(d, seed=seed).random(n)
+    elif method == "Halton":
+        unit = qmc.Halton(d, seed=seed).random(n)
+    else:
+        raise ValueError(f"Unknown sampler '{method}'. Must be one of: {list(SAMPLERS)}")
+    unit = np.vstack([corners, unit])
+
+    points = {}
+    for name in AXES:
+        if name in dims:
+            lo, hi = _coords(name, [np.min(axes[name]), np.max(axes[name])])
+            x = lo + unit[:, dims.index(name)] * (hi - lo)
+            points[name] = np.exp(x) if name in LOG_AXES else x
+        else:
+            points[name] = np.full(len(unit), axes[name][0], dtype=np.asarray(axes[name]).dtype)
+    return points
+
+
+class ResponseSurface:
+    """
+    Radial basis function fit of scattered nested analysis samples.
+
+    Inputs are the sampled axes, on a logarithmic scale for pressures and
+    area ratios, normalized to the unit box. Every output variable has its
+    own `RBFInterpolator`; samples where a variable is NaN (e.g. failed CEA
+    solutions) are left out of its fit.
+    """
+
+    def __init__(self, axes: dict, points: dict, values: dict):
+        """
+        Args:
+            axes (dict): Axes of the grid the surface is evaluated on.
+            points (dict): Sample values, see `sample_points`.
+            values (dict): 1-D arrays of the evaluated variables at the samples, keyed by symbol.
+        """
+        from scipy.interpolate import RBFInterpolator
+
+        self.dims = _dims(axes)
+        self._bounds = {name: _coords(name, [np.min(axes[name]), np.max(axes[name])]) for name in self.dims}
+        x = self._normalize(points)
+        self._interp = {}
+        for key, y in values.items():
+            valid = np.isfinite(y)
+            self._interp[key] = RBFInterpolator(x[valid], y[valid], kernel=DOE_KERNEL)
+
+    def _normalize(self, points: dict) -> np.ndarray:
+        columns = []
+        for name in self.dims:
+            lo, hi = self._bounds[name]
+            columns.append((_coords(name, points[name]).ravel() - lo) / (hi - lo))
+        return np.column_stack(columns)
+
+    def evaluate(self, points: dict) -> dict:
+        """Returns every fitted variable at the given points, with their shape."""
+        shape = np.shape(points[self.dims[0]])
+        x = self._normalize(points)
+        columns = {}
+        for key, interp in self._interp.items():
+            y = np.concatenate([interp(x[i:i + DOE_QUERY_CHUNK]) for i in range(0, len(x), DOE_QUERY_CHUNK)])
+            columns[key] = y.reshape(shape)
+        return columns
+
+
+class DOESamples:
+    """
+    The CEA-evaluated samples behind results fitted by a response surface,
+    kept as `NestedResults.doe`. Variables computed later by CEA providers
+    are only evaluated on the samples and fitted on the grid with the same
+    kind of surface (see `providers.ensure_columns`), rather than evaluated
+    with CEA on every cell of the grid.
+    """
+
+    def __init__(self, points: dict, samples: NestedResults):
+        """
+        Args:
+            points (dict): Sample values, see `sample_points`.
+            samples (NestedResults): Results of the samples, as an (n, 1, 1, 1) grid.
+        """
+        self.points = points
+        self.samples = samples
+
+    @classmethod
+    def from_columns(cls, points: dict, columns: dict) -> "DOESamples":
+        """Rebuilds the samples from their points and (n, 1, 1, 1) result columns."""
+        axes = {name: points[name] if name == AXES[0] else points[name][:1] for name in AXES}
+        return cls(points, NestedResults(axes, columns))
+
+    def fit(self, axes: dict, keys: list) -> dict:
+        """Returns the columns `keys` of the samples, fitted on the grid spanned by `axes`."""
+        values = {key: self.samples.column(key).ravel() for key in keys}
+        grid = np.meshgrid(*(axes[name] for name in AXES), indexing="ij")
+        return ResponseSurface(axes, self.points, values).evaluate(dict(zip(AXES, grid)))
+
+
+def holdout_error(axes: dict, points: dict, values: dict) -> dict:
+    """
+    Fits the samples without a `DOE_HOLDOUT` fraction of them and returns the
+    maximum relative error of every variable on the held-out samples.
+    """
+    n = len(points[AXES[0]])
+    held = np.zeros(n, dtype=bool)
+    held[np.random.default_rng(0).choice(n, max(1, int(n * DOE_HOLDOUT)), replace=False)] = True
+    surface = ResponseSurface(
+        axes, {name: points[name][~held] for name in AXES}, {key: y[~held] for key, y in values.items()}
+    )
+    approx = surface.evaluate({name: points[name][held] for name in AXES})
+    errors = {}
+    for key, y in values.items():
+        with np.errstate(divide="ignore", invalid="ignore"):
+            error = np.abs(approx[key] / y[held] - 1)
+        errors[key] = float(np.nanmax(error)) if np.isfinite(error).any() else np.nan
+    return errors
+
+
+def doe_sweep(context: dict, axes: dict, budget: int, method: str = "Latin hypercube",
+              progress: Callable[[int, int], None] = None, workers: int = None,
+              cancel: threading.Event = None) -> NestedResults:
+    """
+    Nested analysis from a design of experiments.
+
+    At most `budget` scattered samples of the box spanned by `axes` are
+    evaluated with CEA, then a response surface fitted to them is evaluated
+    on the full Cartesian grid, so that the results are plotted like those of
+    a grid sweep. Grids that fit within the budget are evaluated directly.
+
+    Args:
+        context (dict): Sweep-wide settings, see `run_sweep`.
+        axes (dict): Axis values, keyed by the names in `AXES`.
+        budget (int): Maximum number of CEA-evaluated cells.
+        method (str, optional): One of `SAMPLERS`.
+        progress (Callable, optional): Called with (completed, total) as samples complete.
+        workers (int, optional): Number of worker processes.
+        cancel (threading.Event, optional): Cancel token, see `run_sweep`.
+
+    Returns:
+        NestedResults: Response surface on the grid spanned by `axes`, with the
+        samples kept as its `doe` attribute.
+    """
+    grid = np.meshgrid(*(axes[name] for name in AXES), indexing="ij")
+    if grid[0].size <= budget or not _dims(axes):
+        return run_sweep(context, grid, progress=progress, workers=workers, cancel=cancel)
+
+    # Samples are evaluated as an (n, 1, 1, 1) grid
+    points = sample_points(axes, budget, method)
+    sample_grid = tuple(points[name].reshape(-1, 1, 1, 1) for name in AXES)
+    samples = run_sweep(context, sample_grid, progress=progress, workers=workers, cancel=cancel)
+
+    # Inputs that are exact on the grid are not fitted
+    exact = {"pc": grid[1].astype(float)}
+    if axes["mr"][0] is not None:
+        exact["mr"] = grid[0].astype(float)
+    exact["epsc"] = np.full(grid[0].shape, np.nan) if axes["epsc"][0] is None else grid[2].astype(float)
+    if context["exit_mode"] == "eps":
+        exact["eps"] = grid[3].astype(float)
+    doe = DOESamples(points, samples)
+    values = {key: samples.column(key).ravel() for key in samples.columns if key not in exact}
+
+    errors = holdout_error(axes, points, values)
+    worst = max(errors, key=lambda key: np.nan_to_num(errors[key]))
+    logger.info(
+        f"{method} response surface: {samples.size} samples for {grid[0].size} cells, "
+        f"max hold-out relative error {errors[worst]:.2e} ({worst})."
+    )
+
+    columns = doe.fit(axes, list(values))
+    columns.update(exact)
+    results = NestedResults(axes, columns)
+    results.doe = doe
+    return results
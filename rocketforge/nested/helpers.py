@@ -23,16 +23,14 @@ def extract_variable(nestedframe, axis_symbols: str | list[str], key: str = None
     if key is None:
         key = axis_symbols[0] if len(axis_symbols) == 1 else axis_symbols
 
-    sliced = nestedframe.results[tuple(slice_index)]
-    try:
-        if len(axis_symbols) == 1:
-            return np.array([entry[key] for entry in sliced])
-        elif len(axis_symbols) == 2:
-            return np.array([[entry[key] for entry in row] for row in sliced]).T
-        else:
-            raise ValueError("only 1D or 2D extraction is supported")
-    except KeyError:
-        raise KeyError(f"Key '{key}' not found in result dictionaries.")
+    # Columns share the grid shape, so extraction is a plain (zero-copy) slice
+    sliced = nestedframe.results.column(key)[tuple(slice_index)]
+    if len(axis_symbols) == 1:
+        return sliced
+    elif len(axis_symbols) == 2:
+        return sliced.T
+    else:
+        raise ValueError("only 1D or 2D extraction is supported")
 
 
 def get_slice_index(nestedframe, parametric):
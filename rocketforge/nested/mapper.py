@@ -2,11 +2,24 @@ import json
 from rocketforge.utils.logger import logger
 
 VARIABLES_PATH = "rocketforge/nested/variables.json"
-with open(VARIABLES_PATH, "r") as f:
-    var_dict = json.load(f)
 
 class VarMapper:
-    def __init__(self, var_dict):
+    """
+    Name, symbol and unit lookup of the nested analysis variables. The
+    variables file is read on the first lookup rather than at import.
+    """
+    def __init__(self, path):
+        self.path = path
+        self._name_to_symbol = None
+        self._symbol_to_name = None
+        self._symbol_to_unit = None
+
+    def _load(self):
+        if self._name_to_symbol is not None:
+            return
+        with open(self.path, "r") as f:
+            var_dict = json.load(f)
+
         self._name_to_symbol = {}
         self._symbol_to_name = {}
         self._symbol_to_unit = {}
@@ -22,6 +35,7 @@ class VarMapper:
                 self._symbol_to_unit[sym] = uom
 
     def get_symbol(self, name):
+        self._load()
         for pair in self._name_to_symbol.values():
             if name in pair:
                 return pair[name]
@@ -29,18 +43,21 @@ class VarMapper:
         return None
 
     def get_name(self, symbol):
+        self._load()
         if symbol in self._symbol_to_name:
             return self._symbol_to_name[symbol]
         logger.warning(f"Symbol '{symbol}' not found in mapping.")
         return None
 
     def get_uom(self, symbol):
+        self._load()
         if symbol in self._symbol_to_unit:
             return self._symbol_to_unit[symbol]
         logger.warning(f"Symbol '{symbol}' not found in mapping.")
         return None
 
     def get_all_names(self, type):
+        self._load()
         return list(self._name_to_symbol.get(type, {}).keys())
 
-mapper = VarMapper(var_dict)
\ No newline at end of file
+mapper = VarMapper(VARIABLES_PATH)
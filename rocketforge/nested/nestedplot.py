@@ -8,7 +8,7 @@ from rocketforge.utils.conversions import pressure_uom
 from rocketforge.nested.mapper import mapper
 from rocketforge.nested.helpers import extract_variable, get_slice_index, validate_slice_index, abort_plot
 
-def plot_2D(nestedframe, settings: dict, dependent_symbol: str, param_count: int) -> bool:
+def plot_2D(nestedframe, settings: dict, dependent_symbol: str, param_count: int, verbose: bool = True) -> bool:
     """
     Plots a 2D graph based on the provided settings.
 
@@ -17,6 +17,7 @@ def plot_2D(nestedframe, settings: dict, dependent_symbol: str, param_count: int
         settings (dict): Dictionary mapping variable/parameter names to their roles.
         dependent_symbol (str): Symbol for the dependent variable.
         param_count (int): Number of parameters being varied.
+        verbose (bool, optional): Log the kind of plot drawn.
 
     Returns:
         bool: True if plot was successful, False otherwise.
@@ -31,13 +32,15 @@ def plot_2D(nestedframe, settings: dict, dependent_symbol: str, param_count: int
     if not slice_index_valid:
         return abort_plot(f"{invalid_name} is not selected", f"Select a value for: {invalid_name}")
     if not parametric:
-        logger.info("Plotting non-parametric 2D graph...")
+        if verbose:
+            logger.info("Plotting non-parametric 2D graph...")
         x = extract_variable(nestedframe, variable_symbol)
         x = [_x / pressure_uom("bar") for _x in x] if variable_symbol == "pc" else x
         y = extract_variable(nestedframe, variable_symbol, dependent_symbol, slice_index)
         nestedframe.ax.plot(x, y, color=cm.YlOrRd(0.5), linewidth=2)
     else:
-        logger.info("Plotting parametric 2D graph...")
+        if verbose:
+            logger.info("Plotting parametric 2D graph...")
         param_axis_gen = (i for i, s in enumerate(slice_index) if len(s) > 1) # Gets the axis that stores multiple values
         param_axis = next(param_axis_gen, None)
         if param_axis is None:
@@ -95,7 +98,7 @@ def format_2D_plot(nestedframe, variable_symbol: str = None, dependent_symbol: s
     nestedframe.ax.xaxis.label.set_color("white")
     nestedframe.ax.yaxis.label.set_color("white")
 
-def plot_3D(nestedframe, settings: dict, dependent_symbol: str, param_count: int) -> bool:
+def plot_3D(nestedframe, settings: dict, dependent_symbol: str, param_count: int, verbose: bool = True) -> bool:
     """
     Plots a 3D graph based on the provided settings.
 
@@ -104,6 +107,7 @@ def plot_3D(nestedframe, settings: dict, dependent_symbol: str, param_count: int
         settings (dict): Dictionary mapping variable/parameter names to their roles.
         dependent_symbol (str): Symbol for the dependent variable.
         param_count (int): Number of parameters being varied.
+        verbose (bool, optional): Log the kind of plot drawn.
 
     Returns:
         bool: True if plot was successful, False otherwise.
@@ -120,7 +124,8 @@ def plot_3D(nestedframe, settings: dict, dependent_symbol: str, param_count: int
             f"Select a value for: {mapper.get_name(list(settings.keys())[i])}"
         )
     if not parametric:
-        logger.info("Plotting non-parametric 3D graph...")
+        if verbose:
+            logger.info("Plotting non-parametric 3D graph...")
         X = extract_variable(nestedframe, variable_symbols[0])
         X = [x / pressure_uom("bar") for x in X] if variable_symbols[0] == "pc" else X
         Y = extract_variable(nestedframe, variable_symbols[1])
@@ -130,7 +135,8 @@ def plot_3D(nestedframe, settings: dict, dependent_symbol: str, param_count: int
         col = cm.YlOrRd(0.5)
         nestedframe.ax.plot_surface(X, Y, Z, color=col, edgecolor=col, linewidth=2, alpha=0.6)
     else:
-        logger.info("Plotting parametric 3D graph...")
+        if verbose:
+            logger.info("Plotting parametric 3D graph...")
         param_axis_gen = (i for i, s in enumerate(slice_index) if len(s) > 1) # Gets the axis that stores multiple values
         param_axis = next(param_axis_gen, None)
         if param_axis is None:
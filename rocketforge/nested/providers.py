@@ -0,0 +1,267 @@
+import json
+import threading
+import numpy as np
+from dataclasses import asdict, dataclass, replace
+from typing import Callable
+from rocketforge.performance.cea import get_cea
+from rocketforge.performance.design import DesignState
+from rocketforge.performance.sizing import delivered_at, size_throat
+from rocketforge.performance.stations import stations
+from rocketforge.nested.results import AXES, NestedResults
+from rocketforge.nested.sweep import run_sweep
+from rocketforge.nested.doe import DOESamples
+from rocketforge.utils.logger import logger
+
+
+# Columns computed by every sweep (see `sweep.evaluate_cell`)
+BASE_COLUMNS = ("mr", "pc", "epsc", "eps", "cstar", "Isp_vac", "Isp_sl", "Isp_opt", "gammae", "Me")
+# Provider costs
+COST_CEA = "cea"          # One CEA pass per cell, evaluated on the sweep process pool
+COST_DERIVED = "derived"  # Computed in-process from other columns
+
+
+@dataclass(frozen=True)
+class Provider:
+    """
+    Producer of dependent-variable columns that are not part of the base sweep.
+
+    CEA providers evaluate a module-level cell function with the signature
+    `(context, mr, pc, epsc, eps) -> dict` over the completed cells of a
+    sweep. Derived providers compute whole columns from other columns with
+    a function `(results, design) -> dict` and are recomputed when the design
+    geometry they depend on changes.
+    """
+    symbols: tuple
+    inputs: tuple
+    cost: str
+    evaluate: Callable
+    design: bool = False
+
+
+_registry = {}
+
+
+def register(provider: Provider) -> Provider:
+    """Registers a provider for each of its symbols."""
+    for symbol in provider.symbols:
+        _registry[symbol] = provider
+    return provider
+
+
+def get_provider(symbol: str) -> Provider:
+    """
+    Returns the provider of a column.
+
+    Raises:
+        KeyError: If no provider computes the column.
+    """
+    try:
+        return _registry[symbol]
+    except KeyError:
+        raise KeyError(f"No provider for nested variable '{symbol}'.")
+
+
+def provided_symbols() -> list:
+    return list(_registry)
+
+
+# CEA providers
+
+def frozen_isp_cell(context: dict, mr: float, pc: float, epsc: float, eps: float) -> dict:
+    C = get_cea(context["ox"], context["fuel"], epsc)
+    return {
+        "Isp_vac_eq": C.get_Isp(Pc=pc, MR=mr, eps=eps),
+        "Isp_vac_fr": C.get_Isp(Pc=pc, MR=mr, eps=eps, frozen=1),
+    }
+
+
+def transport_cell(context: dict, mr: float, pc: float, epsc: float, eps: float) -> dict:
+    C = get_cea(context["ox"], context["fuel"], epsc)
+    cp_0, mu_0, _, Pr_0 = C.get_Chamber_Transport(Pc=pc, MR=mr, eps=eps, frozen=1)
+    return {
+        "cp_0": cp_0,
+        "mu_0": mu_0 / 1.0e4,
+        "Pr_0": Pr_0,
+        "T_c": C.get_Temperatures(Pc=pc, MR=mr, eps=eps, frozen=1)[0],
+        "Pr_t": C.get_Exit_Transport(Pc=pc, MR=mr, eps=1.0, frozen=1)[3],
+        "Pr_e": C.get_Exit_Transport(Pc=pc, MR=mr, eps=eps, frozen=1)[3],
+    }
+
+
+def stations_cell(context: dict, mr: float, pc: float, epsc: float, eps: float) -> dict:
+    C = get_cea(context["ox"], context["fuel"], epsc)
+    return {"stations": stations(C, pc, mr, eps)}
+
+
+register(Provider(("Isp_vac_eq", "Isp_vac_fr"), (), COST_CEA, frozen_isp_cell))
+register(Provider(("cp_0", "mu_0", "Pr_0", "T_c", "Pr_t", "Pr_e"), (), COST_CEA, transport_cell))
+register(Provider(("stations",), (), COST_CEA, stations_cell))
+
+
+# Derived providers
+
+DELIVERED_FIELDS = {
+    "cstar_d": "cstar_d",
+    "Isp_vac_d": "Is_vac_d",
+    "Isp_sl_d": "Is_SL_d",
+    "Isp_opt_d": "Is_opt_d",
+    "CF_vac_d": "CF_vac_d",
+    "CF_sl_d": "CF_SL_d",
+    "CF_d": "CF_d",
+    "m_d": "m_d",
+}
+
+
+def delivered_columns(results: NestedResults, design: DesignState) -> dict:
+    """
+    Delivered performance of every cell, with the correction factors of the
+    design geometry. If the design thrust and ambient pressure are known, the
+    throat of each cell is resized for the design thrust (with the design
+    divergent length and exit angle) and its area is returned as "At_d";
+    otherwise every cell uses the design throat.
+
+    Raises:
+        ValueError: If the design geometry has not been computed.
+    """
+    if design.At is None or design.Le is None or design.theta_e is None:
+        raise ValueError("Delivered performance requires the nozzle geometry, run the main analysis first.")
+    sizing = design.thrust is not None and design.pamb is not None
+
+    columns = {symbol: np.full(results.shape, np.nan) for symbol in (*DELIVERED_FIELDS, "At_d")}
+    mr, pc, eps = results.column("mr"), results.column("pc"), results.column("eps")
+    cstar, Isp_vac, Isp_vac_fr = results.column("cstar"), results.column("Isp_vac"), results.column("Isp_vac_fr")
+    for index in np.ndindex(results.shape):
+        if np.isnan(cstar[index]) or np.isnan(Isp_vac_fr[index]):
+            continue
+        state = replace(design, mr=float(mr[index]), pc=float(pc[index]), eps=float(eps[index]))
+        theoretical = float(cstar[index]), float(Isp_vac[index]), float(Isp_vac_fr[index])
+        try:
+            At = size_throat(state, *theoretical) if sizing else state.At
+        except ValueError:
+            continue  # No throat delivers the design thrust in this cell
+        delivered = delivered_at(state, At, *theoretical)
+        for symbol, field in DELIVERED_FIELDS.items():
+            value = getattr(delivered, field)
+            columns[symbol][index] = np.nan if value is None else value
+        columns["At_d"][index] = At
+    return columns
+
+
+register(Provider((*DELIVERED_FIELDS, "At_d"), ("Isp_vac_fr",), COST_DERIVED, delivered_columns, design=True))
+
+
+# Evaluation
+
+def design_key(design: DesignState) -> str:
+    """Returns the provenance key of the design inputs of derived columns (the cell inputs excluded)."""
+    inputs = asdict(replace(design, pc=None, mr=None, eps=None, epsc=None))
+    return json.dumps(sorted(inputs.items()), default=float)
+
+
+def _completed(results: NestedResults) -> np.ndarray:
+    """Returns the mask of the cells evaluated by the base sweep."""
+    return ~np.isnan(results.column("Isp_vac"))
+
+
+def _pending(results: NestedResults, provider: Provider, design: DesignState) -> np.ndarray:
+    """Returns the mask of the cells a provider still has to compute."""
+    completed = _completed(results)
+    symbol = provider.symbols[0]
+    if symbol == "stations":
+        if results.stations is None:
+            return completed
+        return completed & np.isnan(results.stations["p"][..., 0])
+    if symbol not in results.columns:
+        return completed
+    if provider.design and (design is None or results.sources.get(symbol) != design_key(design)):
+        return completed
+    return completed & np.isnan(results.columns[symbol])
+
+
+def missing_columns(results: NestedResults, keys: list, design: DesignState = None) -> list:
+    """
+    Returns the keys that have to be computed (or recomputed) before they can
+    be read from the results, including the inputs of their providers.
+    """
+    missing = []
+    for key in keys:
+        if key in BASE_COLUMNS or key not in _registry:
+            continue
+        provider = _registry[key]
+        missing.extend(k for k in missing_columns(results, provider.inputs, design) if k not in missing)
+        if key not in missing and _pending(results, provider, design).any():
+            missing.append(key)
+    return missing
+
+
+def ensure_columns(results: NestedResults, keys: list, context: dict, design: DesignState = None,
+                   progress: Callable[[int, int], None] = None, workers: int = None,
+                   cancel: threading.Event = None) -> NestedResults:
+    """
+    Computes the provided columns among `keys` that are missing or stale.
+
+    CEA providers only evaluate the completed cells that lack their columns,
+    on the sweep process pool, at the mixture ratio and area ratio stored in
+    each cell (so optimized-MR and pressure-exit sweeps are handled alike).
+    On results fitted by a response surface, they only evaluate the samples
+    of the fit, and their columns are fitted on the grid in turn.
+
+    Args:
+        results (NestedResults): Results of a sweep, completed in place.
+        keys (list): Symbols of the variables to be read.
+        context (dict): Settings of the sweep, see `run_sweep`.
+        design (DesignState, optional): Design geometry, required by derived providers.
+        progress, workers, cancel: See `run_sweep`.
+
+    Returns:
+        NestedResults: The completed results.
+
+    Raises:
+        ValueError: If a derived provider has no design state, or if station
+            tables are requested on results fitted by a response surface.
+    """
+    done = set()
+    for key in missing_columns(results, keys, design):
+        provider = _registry[key]
+        if provider in done:
+            continue
+        done.add(provider)
+        mask = _pending(results, provider, design)
+        logger.info(f"Computing nested columns {', '.join(provider.symbols)} ({int(mask.sum())} cells).")
+
+        if provider.cost == COST_CEA:
+            cell_context = {"ox": context["ox"], "fuel": context["fuel"], "pe": context["pe"],
+                            "exit_mode": "eps", "exit_factor": 1.0}
+            if results.doe is None:
+                run_sweep(cell_context, _cell_grid(results), progress=progress, workers=workers, results=results,
+                          mask=mask, cancel=cancel, evaluate=provider.evaluate)
+            elif "stations" in provider.symbols:
+                raise ValueError("Station tables are not available on design-of-experiments results.")
+            else:
+                samples = results.doe.samples
+                run_sweep(cell_context, _sample_grid(results.doe), progress=progress, workers=workers,
+                          results=samples, mask=_pending(samples, provider, design), cancel=cancel,
+                          evaluate=provider.evaluate)
+                results.columns.update(results.doe.fit(results.axes, list(provider.symbols)))
+        else:
+            if design is None:
+                raise ValueError(f"Nested variable '{key}' requires the design state.")
+            for symbol, column in provider.evaluate(results, design).items():
+                results.columns[symbol] = column
+                results.sources[symbol] = design_key(design)
+            if progress is not None:
+                progress(1, 1)
+    return results
+
+
+def _cell_grid(results: NestedResults) -> tuple:
+    """Returns the (mr, pc, epsc, eps) arrays of the values actually evaluated in each cell."""
+    grid = np.meshgrid(*(results.axes[name] for name in AXES), indexing="ij")
+    return results.column("mr"), grid[1], grid[2], results.column("eps")
+
+
+def _sample_grid(doe: DOESamples) -> tuple:
+    """Returns the (mr, pc, epsc, eps) arrays of the values actually evaluated in each sample of a fit."""
+    samples = doe.samples
+    return (samples.column("mr"), doe.points["pc"].reshape(samples.shape),
+            doe.points["epsc"].reshape(samples.shape), samples.column("eps"))
@@ -0,0 +1,130 @@
+import numpy as np
+from rocketforge.performance.stations import STATION_DTYPE
+
+
+# Grid axes, in storage order
+AXES = ("mr", "pc", "epsc", "eps")
+
+
+class NestedResults:
+    """
+    Columnar store of nested analysis results.
+
+    Every output variable is kept in its own float array with the 4-D grid
+    shape (mr, pc, epsc, eps), so that extracting a variable along one or two
+    axes is a zero-copy slice. Station tables are kept apart in a dense
+    `STATION_DTYPE` array of shape grid + (stations,).
+
+    Note that the "eps" column holds the area ratio actually evaluated in each
+    cell, which differs from the "eps" axis values when the exit condition is
+    given as a pressure or a pressure ratio. An infinite area combustor is
+    stored as NaN in the "epsc" column.
+    """
+
+    def __init__(self, axes: dict, columns: dict = None, stations: np.ndarray = None):
+        """
+        Args:
+            axes (dict): Axis values, keyed by the names in `AXES`.
+            columns (Mapping, optional): Existing columns, keyed by variable symbol.
+            stations (numpy.ndarray, optional): Existing station tables.
+        """
+        self.axes = {name: np.asarray(axes[name]) for name in AXES}
+        self.shape = tuple(len(self.axes[name]) for name in AXES)
+        self.columns = {} if columns is None else columns
+        self.stations = stations
+        # Provenance of the columns computed by providers, keyed by symbol
+        self.sources = {}
+        # Samples of results fitted by a response surface (see `doe.DOESamples`), None for exact results
+        self.doe = None
+
+    @property
+    def ndim(self) -> int:
+        return len(self.shape)
+
+    @property
+    def size(self) -> int:
+        return int(np.prod(self.shape))
+
+    def column(self, key: str) -> np.ndarray:
+        """
+        Returns the array of a variable.
+
+        Raises:
+            KeyError: If the variable has not been computed.
+        """
+        try:
+            return self.columns[key]
+        except KeyError:
+            raise KeyError(f"Key '{key}' not found in nested results.")
+
+    def set_cell(self, flat_index: int, cell: dict) -> None:
+        """
+        Stores the results of a single cell.
+
+        Args:
+            flat_index (int): Index of the cell in the flattened grid.
+            cell (dict): Scalar results keyed by variable symbol, plus an optional
+                "stations" entry holding a `STATION_DTYPE` array.
+        """
+        index = np.unravel_index(flat_index, self.shape)
+        for key, value in cell.items():
+            if key == "stations":
+                if self.stations is None:
+                    self.stations = np.full(self.shape + value.shape, np.nan, dtype=STATION_DTYPE)
+                self.stations[index] = value
+                continue
+            if key not in self.columns:
+                self.columns[key] = np.full(self.shape, np.nan)
+            self.columns[key][index] = np.nan if value is None else value
+
+    def reindex(self, axes: dict) -> tuple:
+        """
+        Returns the results spliced into a grid with new axes, and a boolean
+        mask of the cells that still have to be evaluated. Axis values are
+        matched to 12 significant digits; values that were dropped are
+        discarded along with their cells.
+        """
+        results = NestedResults(axes)
+        results.sources = dict(self.sources)
+        old_positions, new_positions = [], []
+        for name in AXES:
+            old_index, new_index = _match(self.axes[name], results.axes[name])
+            old_positions.append(old_index)
+            new_positions.append(new_index)
+        old_block, new_block = np.ix_(*old_positions), np.ix_(*new_positions)
+
+        for key, column in self.columns.items():
+            results.columns[key] = np.full(results.shape, np.nan)
+            results.columns[key][new_block] = column[old_block]
+        if self.stations is not None:
+            results.stations = np.full(results.shape + self.stations.shape[4:], np.nan, dtype=self.stations.dtype)
+            results.stations[new_block] = self.stations[old_block]
+
+        mask = np.ones(results.shape, dtype=bool)
+        mask[new_block] = False
+        return results, mask
+
+    def table(self, keys: list) -> np.ndarray:
+        """
+        Returns a 2-D array with one row per cell and one column per key.
+        """
+        return np.column_stack([self.column(key).ravel() for key in keys])
+
+    def nbytes(self) -> int:
+        total = sum(column.nbytes for column in self.columns.values())
+        if self.stations is not None:
+            total += self.stations.nbytes
+        return total
+
+
+def _axis_key(value):
+    return None if value is None else float(f"{value:.12g}")
+
+
+def _match(old: np.ndarray, new: np.ndarray) -> tuple:
+    """Returns the indices of the values shared by two axes, in `old` and in `new`."""
+    positions = {_axis_key(value): j for j, value in enumerate(new)}
+    pairs = [(i, positions[_axis_key(value)]) for i, value in enumerate(old) if _axis_key(value) in positions]
+    old_index = np.array([i for i, _ in pairs], dtype=int)
+    new_index = np.array([j for _, j in pairs], dtype=int)
+    return old_index, new_index
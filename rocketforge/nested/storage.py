@@ -0,0 +1,171 @@
+import json
+import zipfile
+import numpy as np
+from collections.abc import MutableMapping
+from rocketforge.nested.results import AXES, NestedResults
+from rocketforge.nested.doe import DOESamples
+from rocketforge.utils.logger import logger
+
+
+# Format version of exported nested results
+STORAGE_VERSION = 1
+# Archive member prefixes
+COLUMN_PREFIX = "column_"
+STATIONS_MEMBER = "stations"
+METADATA_MEMBER = "metadata"
+DOE_POINT_PREFIX = "doe_point_"
+DOE_COLUMN_PREFIX = "doe_column_"
+
+
+def export_results(path: str, results: NestedResults, context: dict = None) -> None:
+    """
+    Saves nested results to an uncompressed .npz archive.
+
+    Every column and the station tables are stored as separate .npy members,
+    so that they can be memory-mapped by `import_results`. Axes, sweep
+    settings and the provenance of the provider columns (see
+    `providers.design_key`) are stored as a JSON metadata member. The
+    samples of results fitted by a response surface are stored alongside.
+
+    Args:
+        path (str): Destination file.
+        results (NestedResults): Results to export.
+        context (dict, optional): Sweep settings, see `run_sweep`.
+    """
+    metadata = {
+        "version": STORAGE_VERSION,
+        "axes": {name: [None if v is None else float(v) for v in results.axes[name]] for name in AXES},
+        "context": context or {},
+        "doe": results.doe is not None,
+        "sources": dict(results.sources),
+    }
+    arrays = {f"{COLUMN_PREFIX}{key}": np.asarray(column) for key, column in results.columns.items()}
+    if results.stations is not None:
+        arrays[STATIONS_MEMBER] = np.asarray(results.stations)
+    if results.doe is not None:
+        for name in AXES:
+            arrays[f"{DOE_POINT_PREFIX}{name}"] = np.array(
+                [np.nan if v is None else float(v) for v in results.doe.points[name]]
+            )
+        for key, column in results.doe.samples.columns.items():
+            arrays[f"{DOE_COLUMN_PREFIX}{key}"] = np.asarray(column)
+    arrays[METADATA_MEMBER] = np.array(json.dumps(metadata, default=float))
+
+    # np.savez stores members uncompressed, which is required for memory mapping
+    with open(path, "wb") as f:
+        np.savez(f, **arrays)
+    logger.info(f"Nested results exported to {path}.")
+
+
+def _member_offsets(path: str) -> dict:
+    """Returns the offset of the data of every stored member of a zip archive."""
+    offsets = {}
+    with zipfile.ZipFile(path) as archive, open(path, "rb") as f:
+        for info in archive.infolist():
+            if info.compress_type != zipfile.ZIP_STORED:
+                continue
+            # Local file header: 30 bytes, then the name and extra fields
+            f.seek(info.header_offset + 26)
+            name_length, extra_length = np.frombuffer(f.read(4), dtype="<u2")
+            offsets[info.filename] = info.header_offset + 30 + int(name_length) + int(extra_length)
+    return offsets
+
+
+def _memmap_member(path: str, offset: int) -> np.ndarray:
+    """
+    Memory-maps a .npy member of an archive, given the offset of its data.
+    The map is copy-on-write: cells can be completed in place (see
+    `NestedResults.set_cell`) without modifying the archive.
+    """
+    with open(path, "rb") as f:
+        f.seek(offset)
+        version = np.lib.format.read_magic(f)
+        if version == (1, 0):
+            shape, fortran, dtype = np.lib.format.read_array_header_1_0(f)
+        else:
+            shape, fortran, dtype = np.lib.format.read_array_header_2_0(f)
+        data_offset = f.tell()
+    return np.memmap(path, dtype=dtype, mode="c", offset=data_offset, shape=shape, order="F" if fortran else "C")
+
+
+class LazyColumns(MutableMapping):
+    """
+    Mapping of columns that are memory-mapped (copy-on-write) on first access.
+    Columns added after loading, e.g. by providers, are kept in memory.
+    """
+
+    def __init__(self, path: str, offsets: dict):
+        self._path = path
+        self._offsets = offsets
+        self._columns = {}
+
+    def __getitem__(self, key: str) -> np.ndarray:
+        if key not in self._columns:
+            self._columns[key] = _memmap_member(self._path, self._offsets[key])
+        return self._columns[key]
+
+    def __setitem__(self, key: str, value: np.ndarray) -> None:
+        self._columns[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        self._columns.pop(key, None)
+        self._offsets.pop(key, None)
+
+    def __iter__(self):
+        return iter(self._offsets.keys() | self._columns.keys())
+
+    def __len__(self) -> int:
+        return len(self._offsets.keys() | self._columns.keys())
+
+
+def import_results(path: str) -> tuple:
+    """
+    Opens nested results exported by `export_results`.
+
+    Columns are memory-mapped lazily, only when they are first accessed, so
+    opening an archive does not read its data.
+
+    Returns:
+        tuple: The NestedResults (with copy-on-write stored columns) and the sweep settings.
+
+    Raises:
+        ValueError: If the file is not a compatible nested results archive.
+    """
+    offsets = _member_offsets(path)
+    if f"{METADATA_MEMBER}.npy" not in offsets:
+        raise ValueError(f"{path} is not a nested results archive.")
+
+    with np.load(path) as archive:
+        metadata = json.loads(str(archive[METADATA_MEMBER]))
+    if metadata["version"] > STORAGE_VERSION:
+        raise ValueError(f"{path} was written by a newer version of Rocket Forge.")
+
+    columns = LazyColumns(path, {
+        name[len(COLUMN_PREFIX):-len(".npy")]: offset
+        for name, offset in offsets.items() if name.startswith(COLUMN_PREFIX)
+    })
+    stations = None
+    if f"{STATIONS_MEMBER}.npy" in offsets:
+        stations = _memmap_member(path, offsets[f"{STATIONS_MEMBER}.npy"])
+
+    results = NestedResults(metadata["axes"], columns, stations)
+    results.sources = dict(metadata.get("sources", {}))
+    if metadata.get("doe"):
+        results.doe = _import_doe(path, results.axes)
+    logger.info(f"Nested results imported from {path} (grid shape {results.shape}).")
+    return results, metadata["context"]
+
+
+def _import_doe(path: str, axes: dict) -> DOESamples:
+    """Reads the samples of results fitted by a response surface."""
+    with np.load(path) as archive:
+        points = {}
+        for name in AXES:
+            values = archive[f"{DOE_POINT_PREFIX}{name}"]
+            # Axes holding None (optimized mixture ratio, infinite area combustor) are not sampled
+            points[name] = np.full(len(values), None, dtype=object) if axes[name][0] is None else values
+        columns = {
+            member[len(DOE_COLUMN_PREFIX):]: archive[member]
+            for member in archive.files if member.startswith(DOE_COLUMN_PREFIX)
+        }
+    return DOESamples.from_columns(points, columns)
@@ -0,0 +1,59 @@
+import json
+from collections import OrderedDict
+from rocketforge.nested.results import NestedResults
+from rocketforge.utils.logger import logger
+
+
+# Number of sweeps kept for reuse
+CELL_STORE_SIZE = 4
+
+
+class CellStore:
+    """
+    Keeps the results of the latest sweeps, keyed by their sweep context
+    (propellants, design exit pressure, exit and mixture ratio modes), so that
+    a sweep whose axes were edited only evaluates the cells it does not
+    share with a previous run of the same context.
+    """
+
+    def __init__(self, size: int = CELL_STORE_SIZE):
+        self.size = size
+        self._sweeps = OrderedDict()
+
+    @staticmethod
+    def key(context: dict) -> str:
+        return json.dumps(sorted(context.items()), default=float)
+
+    def get(self, context: dict) -> NestedResults:
+        """Returns the latest results of a context, or None."""
+        key = self.key(context)
+        if key not in self._sweeps:
+            return None
+        self._sweeps.move_to_end(key)
+        return self._sweeps[key]
+
+    def put(self, context: dict, results: NestedResults) -> None:
+        """Stores the results of a context, evicting the oldest context if needed."""
+        key = self.key(context)
+        self._sweeps[key] = results
+        self._sweeps.move_to_end(key)
+        while len(self._sweeps) > self.size:
+            self._sweeps.popitem(last=False)
+
+    def prepare(self, context: dict, axes: dict) -> tuple:
+        """
+        Splices the stored results of a context into a grid with new axes.
+
+        Returns:
+            tuple: The (partially filled) NestedResults and the boolean mask of
+            the cells to evaluate, None if every cell has to be evaluated.
+        """
+        previous = self.get(context)
+        if previous is None:
+            return NestedResults(axes), None
+        results, mask = previous.reindex(axes)
+        logger.info(f"Nested sweep: reusing {mask.size - int(mask.sum())} of {mask.size} cells.")
+        return results, mask
+
+    def clear(self) -> None:
+        self._sweeps.clear()
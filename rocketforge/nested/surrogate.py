@@ -0,0 +1,178 @@
+import threading
+import numpy as np
+from typing import Callable
+from rocketforge.performance.surrogate import LOG_AXES, SURROGATE_VARIABLES, Surrogate
+from rocketforge.nested.results import AXES, NestedResults
+from rocketforge.nested.sweep import PARALLEL_MIN_CELLS, evaluate_full_cell, exit_area_ratio, run_sweep
+from rocketforge.utils.logger import logger
+
+
+# Maximum number of table points per axis
+DEFAULT_POINTS = {"mr": 25, "pc": 9, "epsc": 5, "eps": 17}
+# A table is only built if it has at most this fraction of the cells of the grid it answers
+SURROGATE_MAX_FRACTION = 0.5
+# Number of random CEA spot checks run after a build
+VALIDATION_SAMPLES = 32
+# Maximum relative error above which a validation warning is logged
+SURROGATE_TOLERANCE = 1e-3
+
+_surrogates = []
+
+
+def build_surrogate(context: dict, bounds: dict, points: dict = None, workers: int = None,
+                    progress: Callable[[int, int], None] = None, method: str = "cubic",
+                    cancel: threading.Event = None) -> Surrogate:
+    """
+    Evaluates a new surrogate table with CEA on the persistent sweep pool.
+
+    Args:
+        context (dict): Propellants and design exit pressure.
+        bounds (dict): (min, max) of every axis; (None, None) for an infinite area combustor.
+        points (dict, optional): Number of table points per axis, see `DEFAULT_POINTS`.
+        workers (int, optional): Number of worker processes.
+        progress (Callable, optional): Called with (completed, total) as table cells complete.
+        method (str, optional): Preferred interpolation method.
+        cancel (threading.Event, optional): Cancel token, see `run_sweep`.
+    """
+    points = {**DEFAULT_POINTS, **(points or {})}
+    axes = {}
+    for name in AXES:
+        lo, hi = bounds[name]
+        if lo is None or lo == hi:
+            axes[name] = np.array([lo])
+        elif name in LOG_AXES:
+            axes[name] = np.geomspace(lo, hi, points[name])
+        else:
+            axes[name] = np.linspace(lo, hi, points[name])
+
+    grid = np.meshgrid(*(axes[name] for name in AXES), indexing="ij")
+    sweep_context = {**context, "exit_mode": "eps", "exit_factor": 1.0}
+    results = run_sweep(
+        sweep_context, grid, progress=progress, workers=workers, cancel=cancel, evaluate=evaluate_full_cell
+    )
+    logger.info(
+        f"CEA surrogate built for {context['ox']}/{context['fuel']} "
+        f"({results.size} cells, {method} interpolation)."
+    )
+    return Surrogate(context, results.axes, results.columns, method)
+
+
+def validate_surrogate(surrogate: Surrogate, samples: int = VALIDATION_SAMPLES, seed: int = 0) -> dict:
+    """
+    Compares a surrogate table with CEA at random points inside its bounds,
+    and stores the errors in `surrogate.errors`.
+
+    Returns:
+        dict: Maximum relative error of every variable.
+    """
+    rng = np.random.default_rng(seed)
+    point = {}
+    for name in AXES:
+        values = surrogate.axes[name]
+        if len(values) == 1:
+            point[name] = np.full(samples, values[0], dtype=values.dtype)
+        else:
+            lo, hi = surrogate.coords(name, values[[0, -1]].astype(float))
+            x = rng.uniform(lo, hi, samples)
+            point[name] = np.exp(x) if name in LOG_AXES else x
+
+    approx = surrogate.evaluate(*(point[name] for name in AXES))
+    context = {**surrogate.context, "exit_mode": "eps", "exit_factor": 1.0}
+    errors = dict.fromkeys(SURROGATE_VARIABLES, 0.0)
+    for i in range(samples):
+        exact = evaluate_full_cell(context, *(point[name][i] for name in AXES))
+        for key in SURROGATE_VARIABLES:
+            if exact[key]:
+                error = abs(approx[key][i] / exact[key] - 1)
+                errors[key] = max(errors[key], float(error))
+
+    surrogate.errors = errors
+    worst = max(errors, key=errors.get)
+    message = f"CEA surrogate max relative error: {errors[worst]:.2e} ({worst})."
+    if errors[worst] > SURROGATE_TOLERANCE:
+        logger.warning(message)
+    else:
+        logger.info(message)
+    return errors
+
+
+def table_points(grid: tuple) -> dict:
+    """
+    Returns the number of table points per axis for a grid: as many as the
+    grid has values, up to `DEFAULT_POINTS`, so that a table never has more
+    cells than the grid it answers.
+    """
+    shape = dict(zip(AXES, grid[0].shape))
+    return {name: min(DEFAULT_POINTS[name], shape[name]) for name in AXES}
+
+
+def exit_area_ratio_cell(context: dict, mr: float, pc: float, epsc: float, exit_value: float) -> dict:
+    """Cell function converting the exit condition of a cell into an area ratio, see `run_sweep`."""
+    return {"eps": exit_area_ratio(context, mr, pc, epsc, exit_value)}
+
+
+def get_surrogate(context: dict, bounds: dict, points: dict = None, workers: int = None,
+                  progress: Callable[[int, int], None] = None, cancel: threading.Event = None) -> Surrogate:
+    """
+    Returns a surrogate covering `bounds`, building and validating a new one
+    if none of the tables built in this session does. `points` gives the
+    number of table points per axis of a new table, see `table_points`.
+    """
+    for surrogate in _surrogates:
+        if surrogate.covers(context, bounds):
+            return surrogate
+    surrogate = build_surrogate(context, bounds, points, workers, progress, cancel=cancel)
+    validate_surrogate(surrogate)
+    _surrogates.append(surrogate)
+    return surrogate
+
+
+def surrogate_sweep(context: dict, grid: tuple, progress: Callable[[int, int], None] = None,
+                    workers: int = None, cancel: threading.Event = None) -> NestedResults:
+    """
+    Surrogate counterpart of `run_sweep`.
+
+    Cells are interpolated from a CEA surrogate table instead of being
+    evaluated one by one; station tables are not available. Exit pressure
+    and pressure ratio conditions are still converted to area ratios by CEA,
+    on the sweep process pool. The table is sized from the grid, see
+    `table_points`. Grids too small to be worth a table (with more than
+    `SURROGATE_MAX_FRACTION` of their cells), and optimized-MR sweeps, are
+    evaluated directly.
+    """
+    mr, pc, epsc, exit_value = grid
+    points = table_points(grid)
+    if mr.size < PARALLEL_MIN_CELLS or context.get("mr_optmode") \
+            or np.prod(list(points.values())) > SURROGATE_MAX_FRACTION * mr.size:
+        return run_sweep(context, grid, progress=progress, workers=workers, cancel=cancel)
+
+    if context["exit_mode"] == "eps":
+        eps = exit_value.astype(float)
+    else:
+        eps = run_sweep(
+            context, grid, progress=progress, workers=workers, cancel=cancel, evaluate=exit_area_ratio_cell
+        ).column("eps")
+
+    infinite = epsc.flat[0] is None
+    bounds = {
+        "mr": (mr.min(), mr.max()),
+        "pc": (pc.min(), pc.max()),
+        "epsc": (None, None) if infinite else (epsc.min(), epsc.max()),
+        "eps": (eps.min(), eps.max()),
+    }
+    surrogate = get_surrogate(context, bounds, points, workers=workers, progress=progress, cancel=cancel)
+
+    columns = surrogate.evaluate(mr, pc, epsc, eps)
+    columns["mr"] = mr.astype(float)
+    columns["pc"] = pc.astype(float)
+    columns["epsc"] = np.full(mr.shape, np.nan) if infinite else epsc.astype(float)
+    columns["eps"] = eps
+    axes = {
+        "mr": mr[:, 0, 0, 0],
+        "pc": pc[0, :, 0, 0],
+        "epsc": epsc[0, 0, :, 0],
+        "eps": exit_value[0, 0, 0, :],
+    }
+    if progress is not None:
+        progress(mr.size, mr.size)
+    return NestedResults(axes, columns)
@@ -0,0 +1,309 @@
+import os
+import atexit
+import multiprocessing
+import threading
+from itertools import groupby
+import numpy as np
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Callable, Union
+from rocketforge.performance.cea import get_cea
+from rocketforge.performance.design import DesignState
+from rocketforge.performance.mixtureratio import optimize_mr_batch
+from rocketforge.performance.theoreticalperf import evaluate_theoretical
+from rocketforge.nested.results import NestedResults
+from rocketforge.nested.checkpoint import Checkpoint
+from rocketforge.utils.logger import logger
+
+
+# Grids smaller than this are evaluated in-process
+PARALLEL_MIN_CELLS = 64
+# Target number of chunks handed to each worker
+CHUNKS_PER_WORKER = 4
+# Interval between cancel token checks while waiting for chunks, in s
+CANCEL_POLL_INTERVAL = 0.2
+# Start method of the sweep workers
+POOL_START_METHOD = "spawn"
+
+_executor = None
+_executor_workers = 0
+
+
+class SweepCancelled(Exception):
+    """Raised by `run_sweep` when its cancel token is set."""
+
+
+def get_executor(workers: int = None) -> ProcessPoolExecutor:
+    """
+    Returns the persistent pool of sweep workers, creating it on first use.
+    Workers outlive a single sweep, so their CEA objects and station memos
+    stay warm between runs. They are spawned on every platform: forking the
+    GUI process from the analysis thread would copy its Tk state and the
+    locks held by other threads.
+    """
+    global _executor, _executor_workers
+    workers = workers or os.cpu_count() or 1
+    if _executor is None or _executor_workers != workers:
+        shutdown_executor()
+        _executor = ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context(POOL_START_METHOD)
+        )
+        _executor_workers = workers
+        logger.info(f"Nested sweep pool started with {workers} workers.")
+    return _executor
+
+
+def shutdown_executor() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+atexit.register(shutdown_executor)
+
+
+def exit_area_ratio(context: dict, mr: float, pc: float, epsc: float, exit_value: float) -> float:
+    """
+    Converts a nozzle exit condition into an expansion area ratio,
+    according to `context["exit_mode"]` (see `run_sweep`).
+    """
+    if context["exit_mode"] == "eps":
+        return exit_value
+    if context["exit_mode"] == "ratio":
+        pe = pc / exit_value
+    else:  # Exit pressure
+        pe = exit_value * context["exit_factor"]
+    C = get_cea(context["ox"], context["fuel"], epsc)
+    return C.get_eps_at_PcOvPe(Pc=pc, MR=mr, PcOvPe=pc / pe)
+
+
+def batch_mr(context: dict, pc: np.ndarray, epsc: float, exit_value: np.ndarray, x0: float = None) -> np.ndarray:
+    """
+    Returns the optimal mixture ratios (`context["mr_optmode"]`) of cells
+    sharing the contraction ratio `epsc`, at constant area ratio or exit
+    pressure depending on the exit mode. See `mixtureratio.optimize_mr_batch`.
+    """
+    C = get_cea(context["ox"], context["fuel"], epsc)
+    optmode = context["mr_optmode"]
+    if context["exit_mode"] == "eps":
+        return optimize_mr_batch(C, pc, optmode, eps=exit_value, x0=x0)
+    if context["exit_mode"] == "ratio":
+        pe = pc / exit_value
+    else:  # Exit pressure
+        pe = exit_value * context["exit_factor"]
+    return optimize_mr_batch(C, pc, optmode, pe=pe, x0=x0)
+
+
+def evaluate_cell(context: dict, mr: float, pc: float, epsc: float, exit_value: float) -> dict:
+    """
+    Evaluates the base theoretical performance of a single nested analysis
+    cell: the variables every sweep provides. Further variables are computed
+    on demand by the providers in `rocketforge.nested.providers`.
+
+    Args:
+        context (dict): Sweep-wide settings, see `run_sweep`.
+        mr (float): Mixture ratio.
+        pc (float): Chamber pressure in Pa.
+        epsc (float): Contraction area ratio, None for an infinite area combustor.
+        exit_value (float): Nozzle exit condition, interpreted according to `context["exit_mode"]`.
+
+    Returns:
+        dict: The cell inputs and the base theoretical performance results.
+    """
+    eps = exit_area_ratio(context, mr, pc, epsc, exit_value)
+    C = get_cea(context["ox"], context["fuel"], epsc)
+    # Only gamma and M of the exit station are needed, the other property groups are not solved
+    exit_kw = dict(Pc=pc, MR=mr, eps=eps, frozen=0, frozenAtThroat=0)
+    return {
+        "mr": mr,
+        "pc": pc,
+        "epsc": epsc,
+        "eps": eps,
+        "cstar": C.get_Cstar(Pc=pc, MR=mr),
+        "Isp_vac": C.get_Isp(Pc=pc, MR=mr, eps=eps),
+        "Isp_sl": C.estimate_Ambient_Isp(Pc=pc, MR=mr, eps=eps, Pamb=101325)[0],
+        "Isp_opt": C.estimate_Ambient_Isp(Pc=pc, MR=mr, eps=eps, Pamb=context["pe"])[0],
+        "gammae": C.get_exit_MolWt_gamma(**exit_kw)[1],
+        "Me": C.get_MachNumber(**exit_kw)
+    }
+
+
+def evaluate_full_cell(context: dict, mr: float, pc: float, epsc: float, exit_value: float) -> dict:
+    """
+    Evaluates the complete theoretical performance of a single cell,
+    including the frozen flow properties and the `STATION_DTYPE` station
+    table under "stations". Arguments are the same as `evaluate_cell`.
+    """
+    eps = exit_area_ratio(context, mr, pc, epsc, exit_value)
+    state = DesignState(ox=context["ox"], fuel=context["fuel"], pc=pc, mr=mr, eps=eps, epsc=epsc, pe=context["pe"])
+    result = evaluate_theoretical(state)
+    return {
+        "mr": mr,
+        "pc": pc,
+        "epsc": epsc,
+        "eps": eps,
+        "cstar": result.cstar,
+        "Isp_vac": result.Isp_vac,
+        "Isp_vac_eq": result.Isp_vac_eq,
+        "Isp_vac_fr": result.Isp_vac_fr,
+        "Isp_sl": result.Isp_sl,
+        "Isp_opt": result.Isp_opt,
+        "gammae": result.gammae,
+        "Me": result.Me,
+        "cp_0": result.cp_0,
+        "mu_0": result.mu_0,
+        "Pr_0": result.Pr_0,
+        "Pr_t": result.Pr_t,
+        "Pr_e": result.Pr_e,
+        "T_c": result.T_c,
+        "stations": result.stations
+    }
+
+
+def iter_cells(context: dict, cells: list, evaluate: Callable = evaluate_cell):
+    """
+    Evaluates a list of (flat index, mr, pc, epsc, exit value) cells with
+    `evaluate`, yielding (flat index, result) pairs. In optimized-MR mode the
+    mixture ratios of each run of cells sharing a contraction ratio are
+    optimized together by `batch_mr`, warm-started from the previous run.
+    """
+    if not context.get("mr_optmode"):
+        for idx, *cell in cells:
+            yield idx, evaluate(context, *cell)
+        return
+
+    x0 = None
+    for epsc, run in groupby(cells, key=lambda cell: cell[3]):
+        run = list(run)
+        _, _, pc, _, exit_value = zip(*run)
+        mr = batch_mr(context, np.array(pc, dtype=float), epsc, np.array(exit_value, dtype=float), x0)
+        x0 = mr[-1]
+        for (idx, _, *cell), cell_mr in zip(run, mr):
+            yield idx, evaluate(context, float(cell_mr), *cell)
+
+
+def evaluate_chunk(context: dict, cells: list, evaluate: Callable = evaluate_cell) -> list:
+    """Evaluates a list of (flat index, mr, pc, epsc, exit value) cells."""
+    return list(iter_cells(context, cells, evaluate))
+
+
+def run_sweep(context: dict, grid: tuple, progress: Callable[[int, int], None] = None, workers: int = None,
+              results: NestedResults = None, mask: np.ndarray = None, cancel: threading.Event = None,
+              checkpoint: Union[bool, Checkpoint] = False, evaluate: Callable = evaluate_cell) -> NestedResults:
+    """
+    Evaluates every cell of a nested analysis grid.
+
+    The flattened grid is partitioned into contiguous chunks (so that cells
+    sharing propellants and contraction ratio land on the same worker) and
+    distributed over the persistent process pool. Small grids are evaluated
+    in-process. Cells are evaluated through the config-free performance
+    core, so the performance configuration is never modified.
+
+    The `context` dictionary is expected to have the following structure:
+    {
+        "ox": str,            # Oxidizer name
+        "fuel": str,          # Fuel name
+        "pe": float,          # Design exit pressure in Pa
+        "exit_mode": str,     # "eps", "ratio" (pc/pe) or "pressure"
+        "exit_factor": float, # Conversion factor to Pa for the "pressure" mode
+        "mr_optmode": int     # Optional, optimized-MR mode (see `mixtureratio.optimizemr`)
+    }
+
+    In optimized-MR mode the mixture ratio axis holds a single None value and
+    the "mr" column of the results holds the optimal mixture ratio of each cell.
+
+    Args:
+        context (dict): Sweep-wide settings.
+        grid (tuple): The (mr, pc, epsc, eps) arrays returned by `numpy.meshgrid`.
+        progress (Callable, optional): Called with (completed, total) as cells complete.
+        workers (int, optional): Number of worker processes, defaults to the CPU count.
+        results (NestedResults, optional): Existing results on the same grid to be completed.
+        mask (numpy.ndarray, optional): Boolean array with the grid shape, only the
+            cells where it is True are evaluated.
+        cancel (threading.Event, optional): Cancel token. When set, outstanding
+            chunks are cancelled and `SweepCancelled` is raised; the cells completed
+            so far are kept in `results`.
+        checkpoint (bool, optional): Periodically append completed cells to a
+            checkpoint file keyed by the sweep definition, and resume from it.
+            The file is removed once the sweep completes. A `Checkpoint` shared by
+            several sweeps (see `adaptive_sweep`) is used as is and never removed.
+        evaluate (Callable, optional): Module-level cell function with the signature
+            of `evaluate_cell`, whose result dictionary is stored in `results`.
+
+    Returns:
+        NestedResults: Columnar results with the grid shape.
+    """
+    if results is None:
+        results = NestedResults({
+            "mr": grid[0][:, 0, 0, 0],
+            "pc": grid[1][0, :, 0, 0],
+            "epsc": grid[2][0, 0, :, 0],
+            "eps": grid[3][0, 0, 0, :],
+        })
+    todo = np.ones(results.shape, dtype=bool) if mask is None else mask.copy()
+
+    if isinstance(checkpoint, Checkpoint):
+        store, owned = checkpoint, False
+    else:
+        store, owned = (Checkpoint(context, results.axes, evaluate.__name__) if checkpoint else None), True
+    if store is not None:
+        for idx, result in store.load(results.axes):
+            results.set_cell(idx, result)
+            todo.flat[idx] = False
+
+    cells = [(idx, *(axis.flat[idx] for axis in grid)) for idx in np.flatnonzero(todo)]
+    total = len(cells)
+    workers = workers or os.cpu_count() or 1
+    try:
+        if total < PARALLEL_MIN_CELLS or workers == 1:
+            _run_serial(context, cells, results, progress, cancel, store, evaluate)
+        else:
+            _run_parallel(context, cells, results, progress, cancel, store, workers, evaluate)
+    finally:
+        if store is not None:
+            store.flush()
+    if store is not None and owned:
+        store.remove()
+    return results
+
+
+def _run_serial(context, cells, results, progress, cancel, store, evaluate) -> None:
+    total = len(cells)
+    for done, (idx, result) in enumerate(iter_cells(context, cells, evaluate), 1):
+        results.set_cell(idx, result)
+        if store is not None:
+            store.add([(idx, result)], results.axes)
+        if progress is not None:
+            progress(done, total)
+        if cancel is not None and cancel.is_set():
+            raise SweepCancelled()
+
+
+def _run_parallel(context, cells, results, progress, cancel, store, workers, evaluate) -> None:
+    total = len(cells)
+    chunksize = max(1, -(-total // (workers * CHUNKS_PER_WORKER)))
+    executor = get_executor(workers)
+    futures = [
+        executor.submit(evaluate_chunk, context, cells[i:i + chunksize], evaluate)
+        for i in range(0, total, chunksize)
+    ]
+    done = 0
+    pending = set(futures)
+    try:
+        while pending:
+            completed, pending = wait(pending, timeout=CANCEL_POLL_INTERVAL, return_when=FIRST_COMPLETED)
+            for future in completed:
+                chunk = future.result()
+                for idx, result in chunk:
+                    results.set_cell(idx, result)
+                if store is not None:
+                    store.add(chunk, results.axes)
+                done += len(chunk)
+                if progress is not None:
+                    progress(min(done, total), total)
+            if cancel is not None and cancel.is_set():
+                raise SweepCancelled()
+    except BaseException:
+        for future in futures:
+            future.cancel()
+        raise
@@ -0,0 +1,347 @@
+import os
+import sys
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from functools import lru_cache
+from collections import Counter, defaultdict
+from tabulate import tabulate
+from typing import TYPE_CHECKING
+from rocketforge.utils.logger import logger
+from rocketforge.utils.tracing import span
+
+if TYPE_CHECKING:
+    from rocketcea.cea_obj_w_units import CEA_Obj
+
+
+# Units used by every CEA_Obj in Rocket Forge
+UNITS = dict(
+    cstar_units="m/s",
+    pressure_units="Pa",
+    temperature_units="K",
+    sonic_velocity_units="m/s",
+    enthalpy_units="kJ/kg",
+    density_units="kg/m^3",
+    specific_heat_units="J/kg-K",
+)
+
+CACHE_PATH = os.path.join(os.path.expanduser("~"), ".rocketforge", "cea_cache.sqlite")
+CACHE_MAX_ENTRIES = 500000
+CEA_OBJ_CACHE_SIZE = 64
+# Number of cache hits whose last use is written in a single transaction
+CACHE_TOUCH_BATCH = 1000
+# Number of call sites listed in the profiler report
+PROFILE_TOP_SITES = 15
+# Modules skipped when attributing a CEA query to its call site
+PROFILE_SKIP_FILES = ("cea.py", "stations.py", "mixtureratio.py")
+
+
+class CEACache:
+    """
+    Persistent, content-addressed store of CEA results.
+
+    Entries are keyed on a hash of the propellants, contraction ratio, units,
+    method name and call arguments, and live in a local SQLite database so
+    that they are shared across sessions and processes. When the number of
+    entries exceeds `max_entries`, the least recently used tenth is evicted.
+    Hits only take a read lock: their last use is written in batches of
+    `CACHE_TOUCH_BATCH`, so recency is approximate.
+    """
+
+    def __init__(self, path: str = CACHE_PATH, max_entries: int = CACHE_MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        self.enabled = os.environ.get("RF_CEA_CACHE", "1") != "0"
+        self.hits = 0
+        self.misses = 0
+        self._puts = 0
+        self._touched = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        con = getattr(self._local, "con", None)
+        if con is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            con = sqlite3.connect(self.path, timeout=30.0)
+            con.execute("PRAGMA journal_mode=WAL")
+            con.execute("PRAGMA synchronous=NORMAL")
+            con.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, last_used REAL NOT NULL)"
+            )
+            con.execute("CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used)")
+            self._local.con = con
+        return con
+
+    @staticmethod
+    def key(*parts) -> str:
+        """Returns the content address of a CEA query."""
+        desc = json.dumps(parts, default=float, separators=(",", ":"))
+        return hashlib.sha1(desc.encode()).hexdigest()
+
+    def get(self, key: str):
+        """Returns the cached value of `key`, or None on a miss."""
+        try:
+            con = self._connection()
+            row = con.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+        except sqlite3.Error as err:
+            logger.warning(f"CEA cache unavailable: {err}")
+            self.enabled = False
+            return None
+
+        with self._lock:
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._touched.append(key)
+            flush = len(self._touched) >= CACHE_TOUCH_BATCH
+        if flush:
+            self.touch()
+        value = json.loads(row[0])
+        return tuple(value) if isinstance(value, list) else value
+
+    def put(self, key: str, value) -> None:
+        """Stores `value` under `key`, evicting old entries if needed."""
+        try:
+            con = self._connection()
+            con.execute(
+                "INSERT OR REPLACE INTO results (key, value, last_used) VALUES (?, ?, ?)",
+                (key, json.dumps(value, default=float), time.time()),
+            )
+            con.commit()
+            with self._lock:
+                self._puts += 1
+                check = self._puts % 1000 == 0
+            if check:
+                self.evict()
+        except sqlite3.Error as err:
+            logger.warning(f"CEA cache unavailable: {err}")
+            self.enabled = False
+
+    def touch(self) -> None:
+        """Writes the last use of the pending cache hits."""
+        with self._lock:
+            keys, self._touched = self._touched, []
+        if not keys:
+            return
+        try:
+            con = self._connection()
+            now = time.time()
+            con.executemany("UPDATE results SET last_used = ? WHERE key = ?", [(now, k) for k in keys])
+            con.commit()
+        except sqlite3.Error as err:
+            logger.warning(f"CEA cache unavailable: {err}")
+            self.enabled = False
+
+    def evict(self) -> None:
+        """Drops the least recently used entries above `max_entries`."""
+        self.touch()
+        con = self._connection()
+        count = con.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        if count > self.max_entries:
+            excess = count - self.max_entries + self.max_entries // 10
+            con.execute(
+                "DELETE FROM results WHERE key IN "
+                "(SELECT key FROM results ORDER BY last_used ASC LIMIT ?)",
+                (excess,),
+            )
+            con.commit()
+            logger.info(f"CEA cache: evicted {excess} entries.")
+
+    def clear(self) -> None:
+        """Removes every entry and resets the statistics."""
+        con = self._connection()
+        con.execute("DELETE FROM results")
+        con.commit()
+        self._touched = []
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict:
+        """Returns hit/miss counters and the number of stored entries."""
+        try:
+            entries = self._connection().execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        except sqlite3.Error:
+            entries = 0
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "entries": entries,
+        }
+
+
+cache = CEACache()
+
+
+class CEAProfiler:
+    """
+    Call-count and latency profiler of the CEA queries made through
+    `CachedCEA`, enabled by the RF_CEA_PROFILE environment variable or by
+    `enable()`.
+
+    For every method it records the number of calls, of solver runs (calls
+    not answered by the persistent cache), of duplicate calls (arguments
+    already queried since the last reset) and the cumulative latency. Calls
+    are attributed to the file, line and function that made them, skipping
+    the CEA wrappers in `PROFILE_SKIP_FILES` (see `call_site`). Queries
+    made in the worker processes of a parallel sweep are not recorded.
+    """
+
+    def __init__(self):
+        self.enabled = os.environ.get("RF_CEA_PROFILE", "0") != "0"
+        self._lock = threading.Lock()
+        self.reset()
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def reset(self) -> None:
+        with self._lock:
+            self.calls = Counter()
+            self.solves = Counter()
+            self.duplicates = Counter()
+            self.latency = defaultdict(float)
+            self.solve_latency = defaultdict(float)
+            self.sites = Counter()
+            self.site_solves = Counter()
+            self._seen = set()
+
+    @staticmethod
+    def call_site(depth: int = 1) -> str:
+        """
+        Returns the first caller, `depth` frames up or more, outside the
+        performance modules in `PROFILE_SKIP_FILES`, so that queries made
+        through the station solver or the mixture ratio optimizer are
+        attributed to the action that ran them.
+        """
+        frame = sys._getframe(depth + 1)
+        while frame.f_back is not None:
+            path = frame.f_code.co_filename
+            if not (os.path.basename(path) in PROFILE_SKIP_FILES
+                    and os.path.basename(os.path.dirname(path)) == "performance"):
+                break
+            frame = frame.f_back
+        return f"{os.path.basename(frame.f_code.co_filename)}:{frame.f_lineno} ({frame.f_code.co_name})"
+
+    def record(self, method: str, key: str, solved: bool, elapsed: float, site: str) -> None:
+        with self._lock:
+            self.calls[method] += 1
+            self.latency[method] += elapsed
+            if solved:
+                self.solves[method] += 1
+                self.solve_latency[method] += elapsed
+                self.site_solves[(site, method)] += 1
+            if key in self._seen:
+                self.duplicates[method] += 1
+            else:
+                self._seen.add(key)
+            self.sites[(site, method)] += 1
+
+    def report(self) -> str:
+        """Tabulates the recorded calls per method and per call site."""
+        with self._lock:
+            methods = sorted(self.calls, key=lambda m: self.latency[m], reverse=True)
+            rows = [
+                [m, self.calls[m], self.solves[m], self.duplicates[m], self.latency[m] * 1e3,
+                 self.solve_latency[m] / self.solves[m] * 1e3 if self.solves[m] else 0.0]
+                for m in methods
+            ]
+            rows.append([
+                "Total", sum(self.calls.values()), sum(self.solves.values()), sum(self.duplicates.values()),
+                sum(self.latency.values()) * 1e3, None
+            ])
+            sites = [
+                [site, method, calls, self.site_solves[(site, method)]]
+                for (site, method), calls in self.sites.most_common(PROFILE_TOP_SITES)
+            ]
+        headers = ["Method", "Calls", "Solves", "Duplicates", "Total [ms]", "Mean solve [ms]"]
+        return (
+            tabulate(rows, headers, floatfmt=".3f", missingval="")
+            + "\n\n"
+            + tabulate(sites, ["Call site", "Method", "Calls", "Solves"])
+        )
+
+
+profiler = CEAProfiler()
+
+
+class CachedCEA:
+    """
+    Drop-in replacement for `CEA_Obj` that answers `get*` and `estimate*`
+    queries from the persistent CEA cache. The underlying `CEA_Obj` is only
+    built on the first cache miss.
+    """
+
+    def __init__(self, oxName: str, fuelName: str, fac_CR: float = None, **units):
+        self.oxName = oxName
+        self.fuelName = fuelName
+        self.fac_CR = fac_CR
+        self.units = units
+        self._prefix = (oxName, fuelName, fac_CR, sorted(units.items()))
+        self._C = None
+
+    @property
+    def cea_obj(self) -> "CEA_Obj":
+        if self._C is None:
+            # The Fortran extension is loaded on the first cache miss
+            from rocketcea.cea_obj_w_units import CEA_Obj
+            self._C = CEA_Obj(
+                oxName=self.oxName, fuelName=self.fuelName, fac_CR=self.fac_CR, **self.units
+            )
+        return self._C
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        if not name.startswith(("get", "estimate")):
+            return getattr(self.cea_obj, name)
+
+        def method(*args, **kwargs):
+            start = time.perf_counter()
+            key = None
+            with span(name, "cea") as s:
+                if cache.enabled:
+                    key = cache.key(*self._prefix, name, args, sorted(kwargs.items()))
+                    value = cache.get(key)
+                    s.set(hit=value is not None)
+                else:
+                    value = None
+                solved = value is None
+                if solved:
+                    value = getattr(self.cea_obj, name)(*args, **kwargs)
+                    if cache.enabled:
+                        cache.put(key, value)
+            if profiler.enabled:
+                site = profiler.call_site()
+                if key is None:
+                    key = cache.key(*self._prefix, name, args, sorted(kwargs.items()))
+                profiler.record(name, key, solved, time.perf_counter() - start, site)
+            return value
+
+        method.__name__ = name
+        return method
+
+
+@lru_cache(maxsize=CEA_OBJ_CACHE_SIZE)
+def _get_cea(oxName: str, fuelName: str, fac_CR: float, units: tuple) -> CachedCEA:
+    return CachedCEA(oxName, fuelName, fac_CR, **dict(units))
+
+
+def get_cea(oxName: str, fuelName: str, fac_CR: float = None, **units) -> CachedCEA:
+    """
+    #### Shared CEA object factory.
+    Returns the `CachedCEA` instance for the given propellants, contraction
+    ratio and unit set (Rocket Forge `UNITS` by default). Instances are kept
+    in a bounded LRU, so propellant cards and unit converters are loaded once
+    per unique key instead of once per call.
+    """
+    return _get_cea(oxName, fuelName, fac_CR, tuple(sorted((units or UNITS).items())))
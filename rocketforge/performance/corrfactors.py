@@ -1,15 +1,16 @@
 import rocketforge.performance.config as config
 from math import sqrt, log, atan, cos, pi
+from rocketforge.performance.design import DesignState, CorrectionFactors
 
 
-def correction_factors():
-    pc = config.pc
-    eps = config.eps
-    At = config.At
-    Le = config.Le
-    theta_ex = config.theta_e
-    Is_v = config.Isp_vac
-    Is_v_fr = config.Isp_vac_fr
+def evaluate_correction_factors(state: DesignState, Isp_vac: float, Isp_vac_fr: float) -> CorrectionFactors:
+    pc = state.pc
+    eps = state.eps
+    At = state.At
+    Le = state.Le
+    theta_ex = state.theta_e
+    Is_v = Isp_vac
+    Is_v_fr = Isp_vac_fr
 
     # Geometry
     Ae = At * eps
@@ -44,8 +45,14 @@ def correction_factors():
     # Overall correction factor
     z_overall = z_n * z_r
 
-    config.z_r = z_r
-    config.z_f = z_f
-    config.z_d = z_d
-    config.z_n = z_n
-    config.z_overall = z_overall
+    return CorrectionFactors(z_r=z_r, z_f=z_f, z_d=z_d, z_n=z_n, z_overall=z_overall)
+
+
+def correction_factors():
+    factors = evaluate_correction_factors(DesignState.from_config(), config.Isp_vac, config.Isp_vac_fr)
+
+    config.z_r = factors.z_r
+    config.z_f = factors.z_f
+    config.z_d = factors.z_d
+    config.z_n = factors.z_n
+    config.z_overall = factors.z_overall
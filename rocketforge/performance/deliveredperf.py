@@ -1,25 +1,23 @@
 import rocketforge.performance.config as config
-import rocketforge.thermal.config as tconf
 from tabulate import tabulate
+from rocketforge.performance.design import DesignState, CorrectionFactors, DeliveredResult
 
 
-def delivered():
-    pc = config.pc
-    eps = config.eps
-    pe = config.pe
-    MR = config.mr
-    At = config.At
-    cstar = config.cstar
-    Is_vac = config.Isp_vac
-    z_c = config.z_r
-    z_n = config.z_n
+def evaluate_delivered(state: DesignState, cstar: float, Isp_vac: float, factors: CorrectionFactors) -> DeliveredResult:
+    pc = state.pc
+    eps = state.eps
+    pe = state.pe
+    MR = state.mr
+    At = state.At
+    Is_vac = Isp_vac
+    z_c = factors.z_r
+    z_n = factors.z_n
 
     # Film cooling
-    if tconf.film:
-        k_film = (1 + (tconf.fuelfilm + config.mr*tconf.oxfilm)/100/(1 + config.mr))
+    if state.film:
+        k_film = (1 + (state.fuelfilm + MR*state.oxfilm)/100/(1 + MR))
     else:
         k_film = 1.0
-    config.k_film = k_film
 
     # Sea level pressure
     pSL = 101325
@@ -29,18 +27,15 @@ def delivered():
 
     # Characteristic velocity
     cstar_d = z_c * cstar
-    config.cstar_d = cstar_d
 
     # Mass flow
     m_d = pc * At / cstar_d
     m_d_core = m_d / k_film
     m_f_d = m_d_core / (MR + 1)
     m_ox_d = m_f_d * MR
-    if tconf.film:
-        m_f_d = m_f_d * (1 + tconf.fuelfilm/100)
-        m_ox_d = m_ox_d * (1 + tconf.oxfilm/100)
-    config.m_f_d = m_f_d
-    config.m_ox_d = m_ox_d
+    if state.film:
+        m_f_d = m_f_d * (1 + state.fuelfilm/100)
+        m_ox_d = m_ox_d * (1 + state.oxfilm/100)
 
     # Specific impulse
     Fe = Ae / m_d
@@ -59,20 +54,57 @@ def delivered():
     T_SL_d = CF_SL_d * At * pc / k_film
 
     # Target Thrust
-    config.CF_d = (Is_vac_d * 9.80655 - Fe * config.pamb) / cstar_d
-    config.thrust_d = config.CF_d * At * pc / k_film
+    if state.pamb is not None:
+        CF_d = (Is_vac_d * 9.80655 - Fe * state.pamb) / cstar_d
+        thrust_d = CF_d * At * pc / k_film
+    else:
+        CF_d = None
+        thrust_d = None
+
+    return DeliveredResult(
+        k_film=k_film,
+        cstar_d=cstar_d,
+        m_d=m_d,
+        m_f_d=m_f_d,
+        m_ox_d=m_ox_d,
+        Is_vac_d=Is_vac_d,
+        Is_opt_d=Is_opt_d,
+        Is_SL_d=Is_SL_d,
+        CF_vac_d=CF_vac_d,
+        CF_opt_d=CF_opt_d,
+        CF_SL_d=CF_SL_d,
+        T_vac_d=T_vac_d,
+        T_opt_d=T_opt_d,
+        T_SL_d=T_SL_d,
+        CF_d=CF_d,
+        thrust_d=thrust_d,
+    )
+
+
+def delivered():
+    factors = CorrectionFactors(
+        z_r=config.z_r, z_f=config.z_f, z_d=config.z_d, z_n=config.z_n, z_overall=config.z_overall
+    )
+    r = evaluate_delivered(DesignState.from_config(), config.cstar, config.Isp_vac, factors)
+
+    config.k_film = r.k_film
+    config.cstar_d = r.cstar_d
+    config.m_f_d = r.m_f_d
+    config.m_ox_d = r.m_ox_d
+    config.CF_d = r.CF_d
+    config.thrust_d = r.thrust_d
 
     # Output formatting
     headers = ["Parameter", "SL", "Opt", "Vac", "Unit"]
     results = [
-        ["Characteristic velocity", f"{cstar_d:.2f}", f"{cstar_d:.2f}", f"{cstar_d:.2f}", "m/s"],
-        ["Effective exhaust velocity", f"{Is_SL_d * 9.80655:.2f}", f"{Is_opt_d * 9.80655:.2f}", f"{Is_vac_d * 9.80655:.2f}", "m/s"],
-        ["Specific impulse", f"{Is_SL_d:.2f}", f"{Is_opt_d:.2f}", f"{Is_vac_d:.2f}", "s"],
-        ["Thrust coefficient", f"{CF_SL_d:.5f}", f"{CF_opt_d:.5f}", f"{CF_vac_d:.5f}", ""],
-        ["Chamber Thrust", f"{T_SL_d / 1000:.4f}", f"{T_opt_d / 1000:.4f}", f"{T_vac_d / 1000:.4f}", "kN"],
-        ["Mass flow rate", f"{m_d:.4f}", f"{m_d:.4f}", f"{m_d:.4f}", "kg/s"],
-        ["Fuel flow rate", f"{m_f_d:.4f}", f"{m_f_d:.4f}", f"{m_f_d:.4f}", "kg/s"],
-        ["Oxidizer flow rate", f"{m_ox_d:.4f}", f"{m_ox_d:.4f}", f"{m_ox_d:.4f}", "kg/s"],
+        ["Characteristic velocity", f"{r.cstar_d:.2f}", f"{r.cstar_d:.2f}", f"{r.cstar_d:.2f}", "m/s"],
+        ["Effective exhaust velocity", f"{r.Is_SL_d * 9.80655:.2f}", f"{r.Is_opt_d * 9.80655:.2f}", f"{r.Is_vac_d * 9.80655:.2f}", "m/s"],
+        ["Specific impulse", f"{r.Is_SL_d:.2f}", f"{r.Is_opt_d:.2f}", f"{r.Is_vac_d:.2f}", "s"],
+        ["Thrust coefficient", f"{r.CF_SL_d:.5f}", f"{r.CF_opt_d:.5f}", f"{r.CF_vac_d:.5f}", ""],
+        ["Chamber Thrust", f"{r.T_SL_d / 1000:.4f}", f"{r.T_opt_d / 1000:.4f}", f"{r.T_vac_d / 1000:.4f}", "kN"],
+        ["Mass flow rate", f"{r.m_d:.4f}", f"{r.m_d:.4f}", f"{r.m_d:.4f}", "kg/s"],
+        ["Fuel flow rate", f"{r.m_f_d:.4f}", f"{r.m_f_d:.4f}", f"{r.m_f_d:.4f}", "kg/s"],
+        ["Oxidizer flow rate", f"{r.m_ox_d:.4f}", f"{r.m_ox_d:.4f}", f"{r.m_ox_d:.4f}", "kg/s"],
     ]
     output = tabulate(results, headers, numalign="right")
 
@@ -0,0 +1,123 @@
+import numpy as np
+from dataclasses import dataclass
+import rocketforge.performance.config as config
+import rocketforge.thermal.config as tconf
+
+
+@dataclass(frozen=True)
+class DesignState:
+    """
+    Immutable set of inputs of the performance core.
+
+    Pressures are in Pa, areas in m^2, lengths in m and angles in radians.
+    Instances are hashable and can be used as cache keys; use
+    `dataclasses.replace` to derive variants.
+    """
+    # Propellants
+    ox: str
+    fuel: str
+
+    # Design parameters
+    pc: float
+    mr: float
+    eps: float
+    epsc: float = None
+    pe: float = None
+    pamb: float = None
+    thrust: float = None
+
+    # Geometry
+    At: float = None
+    Le: float = None
+    theta_e: float = None
+
+    # Film cooling
+    film: bool = False
+    fuelfilm: float = 0.0
+    oxfilm: float = 0.0
+
+    @classmethod
+    def from_config(cls) -> "DesignState":
+        """Builds the design state from the performance and thermal config modules."""
+        return cls(
+            ox=config.ox,
+            fuel=config.fuel,
+            pc=config.pc,
+            mr=config.mr,
+            eps=config.eps,
+            epsc=config.epsc,
+            pe=config.pe,
+            pamb=config.pamb,
+            thrust=config.thrust,
+            At=config.At,
+            Le=config.Le,
+            theta_e=config.theta_e,
+            film=bool(tconf.film),
+            fuelfilm=tconf.fuelfilm,
+            oxfilm=tconf.oxfilm,
+        )
+
+
+@dataclass(frozen=True, eq=False)
+class TheoreticalResult:
+    """Ideal performance and thermodynamic properties of a design."""
+    cstar: float
+    Isp_vac: float
+    Isp_vac_eq: float
+    Isp_vac_fr: float
+    Isp_sl: float
+    Isp_opt: float
+    stations: np.ndarray    # STATION_DTYPE array, chamber first
+
+    # Frozen flow properties used by the thermal analysis
+    cp_0: float
+    mu_0: float
+    Pr_0: float
+    Pr_t: float
+    Pr_e: float
+    T_c: float
+
+    @property
+    def gammae(self) -> float:
+        return self.stations["gamma"][-1]
+
+    @property
+    def Me(self) -> float:
+        return self.stations["M"][-1]
+
+    @property
+    def gammat(self) -> float:
+        return self.stations["gamma"][1]
+
+
+@dataclass(frozen=True)
+class CorrectionFactors:
+    """Efficiencies applied to the ideal performance."""
+    z_r: float          # Finite reaction rate combustion factor
+    z_f: float          # Friction loss factor
+    z_d: float          # Divergence loss factor
+    z_n: float          # Nozzle correction factor
+    z_overall: float    # Overall correction factor
+
+
+@dataclass(frozen=True)
+class DeliveredResult:
+    """Estimated delivered performance of a design."""
+    k_film: float
+    cstar_d: float
+    m_d: float
+    m_f_d: float
+    m_ox_d: float
+    Is_vac_d: float
+    Is_opt_d: float
+    Is_SL_d: float
+    CF_vac_d: float
+    CF_opt_d: float
+    CF_SL_d: float
+    T_vac_d: float
+    T_opt_d: float
+    T_SL_d: float
+
+    # At the design ambient pressure
+    CF_d: float
+    thrust_d: float
@@ -0,0 +1,84 @@
+import rocketforge.performance.config as config
+import rocketforge.thermal.config as tconf
+from rocketforge.performance.cea import CachedCEA, get_cea
+from rocketforge.performance.mixtureratio import optimizemr, optimizermr_at_pe
+
+
+# Nozzle exit conditions, as numbered in the engine definition tab
+EXIT_EPS = 0        # Expansion area ratio
+EXIT_RATIO = 1      # Expansion pressure ratio pc/pe
+EXIT_PRESSURE = 2   # Exit pressure
+
+
+def design_point(ox: str, fuel: str, pc: float, epsc: float, optmode: int, exit_condition: int, exit_value: float,
+                 mr: float = None, mr_uom: str = "O/F") -> CachedCEA:
+    """
+    #### Design point.
+    Sets the propellants, pressures, mixture ratio and area ratios of the
+    performance config, used by the engine definition tab and the batch runner.
+
+    Parameters:
+        ox, fuel (str): Propellant names.
+        pc (float): Chamber pressure in Pa.
+        epsc (float): Contraction area ratio, None for an infinite area combustor.
+        optmode (int): Mixture ratio optimization mode (0: given mixture ratio), see `mixtureratio.optimizemr`.
+        exit_condition (int): One of `EXIT_EPS`, `EXIT_RATIO` and `EXIT_PRESSURE`.
+        exit_value (float): Area ratio, pressure ratio or exit pressure in Pa, according to `exit_condition`.
+        mr (float, optional): Mixture ratio, required if `optmode` is 0.
+        mr_uom (str, optional): "O/F" or "alpha" (oxidizer excess coefficient).
+
+    Returns:
+        CachedCEA: The CEA object of the design point.
+    """
+    config.ox = ox
+    config.fuel = fuel
+    config.pc = pc
+    config.epsc = epsc
+
+    C = get_cea(ox, fuel, epsc)
+    config.mr_s = C.getMRforER(ERphi=1)
+
+    if optmode == 0:
+        if mr_uom == "alpha":
+            config.alpha = mr
+            config.mr = config.alpha * config.mr_s
+        else:
+            config.mr = mr
+            config.alpha = config.mr / config.mr_s
+
+        if exit_condition == EXIT_EPS:
+            config.eps = exit_value
+            config.pe = config.pc / C.get_PcOvPe(Pc=config.pc, MR=config.mr, eps=config.eps)
+        else:
+            config.pe = config.pc / exit_value if exit_condition == EXIT_RATIO else exit_value
+            config.eps = C.get_eps_at_PcOvPe(Pc=config.pc, MR=config.mr, PcOvPe=config.pc / config.pe)
+
+    elif exit_condition == EXIT_EPS:
+        config.eps = exit_value
+        config.mr = optimizemr(C, config.pc, config.eps, optmode)
+        config.alpha = config.mr / config.mr_s
+        config.pe = config.pc / C.get_PcOvPe(Pc=config.pc, MR=config.mr, eps=config.eps)
+
+    else:
+        config.pe = config.pc / exit_value if exit_condition == EXIT_RATIO else exit_value
+        config.mr = optimizermr_at_pe(C, config.pc, config.pe, optmode)
+        config.eps = C.get_eps_at_PcOvPe(Pc=config.pc, MR=config.mr, PcOvPe=config.pc / config.pe)
+        config.alpha = config.mr / config.mr_s
+
+    return C
+
+
+def design_throat(C: CachedCEA, thrust: float, pamb: float) -> None:
+    """
+    #### First estimate of the throat area.
+    Sizes the throat for the design thrust at the ambient pressure `pamb`
+    from the theoretical performance (see `theoretical`), enlarged by the
+    film coolant flow. The throat is then refined on the delivered
+    performance, see `sizing.size_throat`.
+    """
+    config.thrust = thrust
+    config.pamb = pamb
+    config.c = C.estimate_Ambient_Isp(Pc=config.pc, MR=config.mr, eps=config.eps, Pamb=config.pamb)[0] * 9.80655
+    config.At = config.thrust * config.cstar / config.c / config.pc
+    if tconf.film:
+        config.At *= 1 + (tconf.fuelfilm + config.mr * tconf.oxfilm) / 100 / (1 + config.mr)
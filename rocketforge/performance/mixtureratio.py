@@ -1,52 +1,126 @@
-from scipy.optimize import fminbound
-from rocketcea.cea_obj_w_units import CEA_Obj
+import numpy as np
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
+if TYPE_CHECKING:
+    from rocketcea.cea_obj_w_units import CEA_Obj
 
-def optimizemr(C: CEA_Obj, pc: float, eps: float, optmode: int) -> float:
+
+# Global mixture ratio bracket
+MR_MIN = 0.5
+MR_MAX = 15
+# Batch optimization bracket, as fractions of the stoichiometric mixture ratio
+MR_BRACKET = (0.25, 1.5)
+# Half width of the warm-started bracket, as a fraction of the batch bracket width
+MR_WARM_WIDTH = 0.1
+# Mixture ratio tolerance (same as the fminbound default)
+MR_XTOL = 1e-5
+
+
+def _objective(C: "CEA_Obj", pc: float, optmode: int, eps: float = None, pe: float = None):
     """
-    #### Optimize Mixture Ratio at defined expansion area ratio.
-    `optmode == 1`: Maximize vacuum specific impulse
-    `optmode == 2`: Maximize specific impulse at optimum expansion
-    `optmode == 3`: Maximize sea level specific impulse
+    #### Negative specific impulse as a function of the mixture ratio.
+    The nozzle is defined by `eps` or, if `eps` is None, by the exit pressure `pe`.
     """
+    if eps is None:
+        area_ratio = lambda x: C.get_eps_at_PcOvPe(Pc=pc, MR=x, PcOvPe=pc / pe)
+    else:
+        area_ratio = lambda x: eps
+
     if optmode == 1:
-        f = lambda x: -C.get_Isp(Pc=pc, MR=x, eps=eps)
-        
+        f = lambda x: -C.get_Isp(Pc=pc, MR=x, eps=area_ratio(x))
+
     elif optmode == 2:
 
         def f(x: float) -> float:
-            pe = pc / C.get_PcOvPe(Pc=pc, MR=x, eps=eps)
-            return -C.estimate_Ambient_Isp(Pc=pc, MR=x, eps=eps, Pamb=pe)[0]
+            if pe is None:
+                pamb = pc / C.get_PcOvPe(Pc=pc, MR=x, eps=eps)
+            else:
+                pamb = pe
+            return -C.estimate_Ambient_Isp(Pc=pc, MR=x, eps=area_ratio(x), Pamb=pamb)[0]
 
     elif optmode == 3:
-        f = lambda x: -C.estimate_Ambient_Isp(Pc=pc, MR=x, eps=eps, Pamb=101325)[0]
+        f = lambda x: -C.estimate_Ambient_Isp(Pc=pc, MR=x, eps=area_ratio(x), Pamb=101325)[0]
 
-    return fminbound(f, 0.5, 15)
+    return f
+
+
+def optimizemr(C: "CEA_Obj", pc: float, eps: float, optmode: int) -> float:
+    """
+    #### Optimize Mixture Ratio at defined expansion area ratio.
+    `optmode == 1`: Maximize vacuum specific impulse
+    `optmode == 2`: Maximize specific impulse at optimum expansion
+    `optmode == 3`: Maximize sea level specific impulse
+    """
+    from scipy.optimize import fminbound
+    return fminbound(_objective(C, pc, optmode, eps=eps), MR_MIN, MR_MAX)
 
 
-def optimizermr_at_pe(C: CEA_Obj, pc: float, pe: float, optmode: int) -> float:
+def optimizermr_at_pe(C: "CEA_Obj", pc: float, pe: float, optmode: int) -> float:
     """
     #### Optimize Mixture Ratio at constant exit pressure.
     `optmode == 1`: Maximize vacuum specific impulse
     `optmode == 2`: Maximize specific impulse at optimum expansion
     `optmode == 3`: Maximize sea level specific impulse
     """
-    if optmode == 1:
+    from scipy.optimize import fminbound
+    return fminbound(_objective(C, pc, optmode, pe=pe), MR_MIN, MR_MAX)
 
-        def f(x: float) -> float:
-            eps = C.get_eps_at_PcOvPe(Pc=pc, MR=x, PcOvPe=pc / pe)
-            return -C.get_Isp(Pc=pc, MR=x, eps=eps)
 
-    elif optmode == 2:
+def mr_bracket(C: "CEA_Obj") -> tuple:
+    """
+    #### Mixture ratio search bracket.
+    Bracket around the stoichiometric mixture ratio, clipped to [`MR_MIN`, `MR_MAX`].
+    """
+    mr_s = C.getMRforER(ERphi=1)
+    return max(MR_MIN, MR_BRACKET[0] * mr_s), min(MR_MAX, MR_BRACKET[1] * mr_s)
 
-        def f(x: float) -> float:
-            eps = C.get_eps_at_PcOvPe(Pc=pc, MR=x, PcOvPe=pc / pe)
-            return -C.estimate_Ambient_Isp(Pc=pc, MR=x, eps=eps, Pamb=pe)[0]
 
-    elif optmode == 3:
+def optimal_mr(C: "CEA_Obj", pc: float, optmode: int, eps: float = None, pe: float = None,
+               x0: float = None, bracket: tuple = None) -> float:
+    """
+    #### Optimize Mixture Ratio, optionally warm-started.
+    With a starting point `x0` (e.g. the optimum of a neighbouring design),
+    the search is restricted to a narrow bracket around it and only widened
+    to the full `bracket` if the optimum lands on its edge.
+    """
+    from scipy.optimize import minimize_scalar
 
-        def f(x: float) -> float:
-            eps = C.get_eps_at_PcOvPe(Pc=pc, MR=x, PcOvPe=pc / pe)
-            return -C.estimate_Ambient_Isp(Pc=pc, MR=x, eps=eps, Pamb=101325)[0]
+    bracket = bracket or mr_bracket(C)
+    f = lru_cache(maxsize=None)(_objective(C, pc, optmode, eps, pe))
+
+    if x0 is not None:
+        width = MR_WARM_WIDTH * (bracket[1] - bracket[0])
+        lo, hi = max(bracket[0], x0 - width), min(bracket[1], x0 + width)
+        x = minimize_scalar(f, bounds=(lo, hi), method="bounded", options={"xatol": MR_XTOL}).x
+        edge = (x - lo < 10 * MR_XTOL and lo > bracket[0]) or (hi - x < 10 * MR_XTOL and hi < bracket[1])
+        if not edge:
+            return x
+
+    return minimize_scalar(f, bounds=bracket, method="bounded", options={"xatol": MR_XTOL}).x
+
+
+def optimize_mr_batch(C: "CEA_Obj", pc, optmode: int, eps=None, pe=None, x0: float = None) -> np.ndarray:
+    """
+    #### Optimal Mixture Ratio map.
+    Optimizes the mixture ratio over arrays of (`pc`, `eps`) or (`pc`, `pe`)
+    targets, broadcast together. Points are visited in C order and each one
+    is warm-started from the optimum of the previous one (the first one from
+    `x0`, if given); repeated targets are only optimized once.
+    """
+    target = eps if pe is None else pe
+    pc, target = np.broadcast_arrays(np.asarray(pc, dtype=float), np.asarray(target, dtype=float))
+    bracket = mr_bracket(C)
 
-    return fminbound(f, 0.5, 15)
\ No newline at end of file
+    mr = np.empty(pc.shape)
+    optima = {}
+    for idx in np.ndindex(pc.shape):
+        point = (pc[idx], target[idx])
+        if point not in optima:
+            if pe is None:
+                x0 = optimal_mr(C, point[0], optmode, eps=point[1], x0=x0, bracket=bracket)
+            else:
+                x0 = optimal_mr(C, point[0], optmode, pe=point[1], x0=x0, bracket=bracket)
+            optima[point] = x0
+        mr[idx] = optima[point]
+    return mr
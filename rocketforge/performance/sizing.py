@@ -0,0 +1,76 @@
+from dataclasses import replace
+from typing import Callable
+from rocketforge.performance.corrfactors import evaluate_correction_factors
+from rocketforge.performance.deliveredperf import evaluate_delivered
+from rocketforge.performance.design import DesignState, DeliveredResult
+
+
+# Relative thrust tolerance of the throat area (same as the former GUI loop)
+SIZING_RTOL = 1.0e-5
+# Factor by which the throat area bracket is widened until it encloses the root
+SIZING_BRACKET_FACTOR = 2.0
+# Maximum number of bracket widenings
+SIZING_MAX_EXPANSIONS = 20
+
+
+def delivered_at(state: DesignState, At: float, cstar: float, Isp_vac: float, Isp_vac_fr: float,
+                 geometry: Callable[[float], tuple] = None) -> DeliveredResult:
+    """
+    #### Delivered performance of a design with throat area `At`.
+    `geometry` maps the throat area to the divergent (Le, theta_e); if None,
+    the divergent geometry of `state` is kept.
+    """
+    if geometry is None:
+        state = replace(state, At=At)
+    else:
+        Le, theta_e = geometry(At)
+        state = replace(state, At=At, Le=Le, theta_e=theta_e)
+    factors = evaluate_correction_factors(state, Isp_vac, Isp_vac_fr)
+    return evaluate_delivered(state, cstar, Isp_vac, factors)
+
+
+def size_throat(state: DesignState, cstar: float, Isp_vac: float, Isp_vac_fr: float,
+                geometry: Callable[[float], tuple] = None, rtol: float = SIZING_RTOL) -> float:
+    """
+    #### Throat area delivering the design thrust at the design ambient pressure.
+    The theoretical performance (`cstar`, `Isp_vac`, `Isp_vac_fr`) does not
+    depend on the throat area, so only the correction factors and the
+    delivered performance are iterated. The root is bracketed around the
+    estimate At = F k_film / (CF pc) and refined with Brent's method.
+
+    Args:
+        state (DesignState): Design inputs; `thrust`, `pamb` and the divergent geometry are required.
+        cstar, Isp_vac, Isp_vac_fr (float): Theoretical performance of the design.
+        geometry (Callable, optional): Maps the throat area to the divergent (Le, theta_e).
+        rtol (float, optional): Relative tolerance on the thrust.
+
+    Returns:
+        float: The throat area in m^2.
+
+    Raises:
+        ValueError: If the design has no target thrust or ambient pressure, or
+            if no throat area delivers the design thrust.
+    """
+    if state.thrust is None or state.pamb is None:
+        raise ValueError("Throat sizing requires the design thrust and ambient pressure.")
+
+    def residual(At: float) -> float:
+        return delivered_at(state, At, cstar, Isp_vac, Isp_vac_fr, geometry).thrust_d / state.thrust - 1
+
+    delivered = delivered_at(state, state.At, cstar, Isp_vac, Isp_vac_fr, geometry)
+    At = state.thrust * delivered.k_film / (delivered.CF_d * state.pc)
+    if abs(residual(At)) < rtol:
+        return At
+
+    lo, hi = At / SIZING_BRACKET_FACTOR, At * SIZING_BRACKET_FACTOR
+    f_lo, f_hi = residual(lo), residual(hi)
+    for _ in range(SIZING_MAX_EXPANSIONS):
+        if f_lo * f_hi <= 0:
+            break
+        lo, hi = lo / SIZING_BRACKET_FACTOR, hi * SIZING_BRACKET_FACTOR
+        f_lo, f_hi = residual(lo), residual(hi)
+    else:
+        raise ValueError("No throat area delivers the design thrust.")
+
+    from scipy.optimize import brentq
+    return brentq(residual, lo, hi, rtol=rtol * 1e-2)
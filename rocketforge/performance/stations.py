@@ -0,0 +1,87 @@
+import numpy as np
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from rocketcea.cea_obj_w_units import CEA_Obj
+
+
+# Thermodynamic properties of a single station
+STATION_DTYPE = np.dtype([
+    ("eps", "f8"),      # Area ratio [-]
+    ("p", "f8"),        # Pressure [Pa]
+    ("T", "f8"),        # Temperature [K]
+    ("rho", "f8"),      # Density [kg/m^3]
+    ("cp", "f8"),       # Heat capacity [J/kg-K]
+    ("mu", "f8"),       # Viscosity [Pa-s]
+    ("l", "f8"),        # Thermal conductivity [mcal/cm-K-s]
+    ("Pr", "f8"),       # Prandtl number [-]
+    ("gamma", "f8"),    # Isentropic exponent [-]
+    ("M", "f8"),        # Mach number [-]
+    ("a", "f8"),        # Sonic velocity [m/s]
+    ("H", "f8"),        # Enthalpy [kJ/kg]
+])
+
+
+@lru_cache(maxsize=1024)
+def _solve(C: "CEA_Obj", pc: float, mr: float, eps: float, frozen: int = 0, frozenAtThroat: int = 0) -> tuple:
+    """
+    Queries every property group of a (pc, MR, eps, frozen, frozenAtThroat)
+    point exactly once. RocketCEA has no query returning all of them, so a
+    station costs 8 CEA calls, one per group; they are only deduplicated by
+    this memo (stations shared by several callers, e.g. throat and exit in
+    frozen flow, are not solved twice) and by the persistent CEA cache.
+    """
+    kw = dict(Pc=pc, MR=mr, eps=eps, frozen=frozen, frozenAtThroat=frozenAtThroat)
+    return (
+        C.get_PcOvPe(**kw),
+        C.get_Temperatures(**kw),
+        C.get_Densities(**kw),
+        C.get_Exit_Transport(**kw),
+        C.get_exit_MolWt_gamma(**kw),
+        C.get_MachNumber(**kw),
+        C.get_SonicVelocities(**kw),
+        C.get_Enthalpies(**kw),
+    )
+
+
+def station(C: "CEA_Obj", pc: float, mr: float, eps: float, frozen: int = 0, frozenAtThroat: int = 0) -> np.record:
+    """
+    #### Thermodynamic state at a nozzle station of area ratio `eps`.
+    Returns a `STATION_DTYPE` record holding p, T, rho, transport
+    properties, gamma, M, a and H.
+    """
+    PcOvPe, T, rho, transport, MolWt_gamma, M, a, H = _solve(C, pc, mr, eps, frozen, frozenAtThroat)
+    cp, mu, l, Pr = transport
+    return np.array(
+        (eps, pc / PcOvPe, T[2], rho[2], cp, mu / 1.0e4, l, Pr, MolWt_gamma[1], M, a[2], H[2]),
+        dtype=STATION_DTYPE,
+    )[()]
+
+
+def chamber(C: "CEA_Obj", pc: float, mr: float, eps: float, frozen: int = 0, frozenAtThroat: int = 0) -> np.record:
+    """
+    #### Thermodynamic state in the combustion chamber.
+    Temperature, density, sonic velocity and enthalpy are taken from the
+    same solution as the station at `eps`, transport properties come from
+    the chamber transport query. Gamma and Mach number are reported as zero.
+    """
+    _, T, rho, _, _, _, a, H = _solve(C, pc, mr, eps, frozen, frozenAtThroat)
+    cp, mu, l, Pr = C.get_Chamber_Transport(Pc=pc, MR=mr, eps=eps, frozen=frozen)
+    return np.array(
+        (0.0, pc, T[0], rho[0], cp, mu / 1.0e4, l, Pr, 0.0, 0.0, a[0], H[0]),
+        dtype=STATION_DTYPE,
+    )[()]
+
+
+def stations(C: "CEA_Obj", pc: float, mr: float, eps: float, i: int = 2, frozen: int = 0, frozenAtThroat: int = 0) -> np.ndarray:
+    """
+    #### Thermodynamic properties along the nozzle.
+    Returns a `STATION_DTYPE` array of `i + 1` rows: the chamber followed by
+    `i` stations equally spaced in area ratio from the throat to the exit.
+    """
+    table = np.empty(i + 1, dtype=STATION_DTYPE)
+    table[0] = chamber(C, pc, mr, eps, frozen, frozenAtThroat)
+    for x in range(i):
+        table[x + 1] = station(C, pc, mr, 1 + x * (eps - 1) / (i - 1), frozen, frozenAtThroat)
+    return table
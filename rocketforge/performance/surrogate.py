@@ -0,0 +1,92 @@
+import numpy as np
+from collections.abc import Mapping
+
+
+# Variables tabulated by the surrogate
+SURROGATE_VARIABLES = (
+    "cstar", "Isp_vac", "Isp_vac_eq", "Isp_vac_fr", "Isp_sl", "Isp_opt",
+    "gammae", "Me", "cp_0", "mu_0", "Pr_0", "Pr_t", "Pr_e", "T_c",
+)
+# Axes tabulated on a logarithmic scale
+LOG_AXES = ("pc", "eps")
+
+
+class Surrogate:
+    """
+    Interpolation table of the theoretical performance of a propellant pair.
+
+    The table holds the variables of a regular (mr, pc, epsc, eps) grid,
+    with pc and eps spaced logarithmically, and is queried through one
+    `RegularGridInterpolator` per variable. Axes with a single value (e.g.
+    an infinite area combustor) are held fixed. Cubic interpolation is used
+    when every tabulated axis has at least four points, linear otherwise.
+    Tables are built and validated with CEA by `rocketforge.nested.surrogate`.
+    """
+
+    def __init__(self, context: dict, axes: dict, columns: Mapping, method: str = "cubic"):
+        """
+        Args:
+            context (dict): Propellants and design exit pressure ("ox", "fuel", "pe").
+            axes (dict): Table axis values, keyed by axis name in (mr, pc, epsc, eps) order.
+            columns (Mapping): Arrays of every variable in `SURROGATE_VARIABLES`, with the grid shape.
+            method (str, optional): Preferred interpolation method.
+        """
+        self.context = {key: context[key] for key in ("ox", "fuel", "pe")}
+        self.axes = dict(axes)
+        # Maximum relative error of every variable, set by the validation
+        self.errors = None
+
+        self._dims = [name for name, values in self.axes.items() if len(values) > 1]
+        if method == "cubic" and any(len(self.axes[name]) < 4 for name in self._dims):
+            method = "linear"
+        self.method = method
+
+        from scipy.interpolate import RegularGridInterpolator
+
+        shape = [len(self.axes[name]) for name in self._dims]
+        points = tuple(self.coords(name, self.axes[name].astype(float)) for name in self._dims)
+        self._interp = {
+            key: RegularGridInterpolator(points, np.asarray(columns[key]).reshape(shape), method=method)
+            for key in SURROGATE_VARIABLES
+        }
+
+    @staticmethod
+    def coords(name: str, values: np.ndarray) -> np.ndarray:
+        """Returns the interpolation coordinates of axis values."""
+        return np.log(values) if name in LOG_AXES else values
+
+    def covers(self, context: dict, bounds: dict) -> bool:
+        """Returns True if the table can answer queries within `bounds`."""
+        if any(self.context[key] != context[key] for key in self.context):
+            return False
+        for name, values in self.axes.items():
+            lo, hi = bounds[name]
+            if len(values) == 1:
+                if lo != values[0] or hi != values[0]:
+                    return False
+            elif lo is None or lo < values[0] or hi > values[-1]:
+                return False
+        return True
+
+    def evaluate(self, mr, pc, epsc, eps) -> dict:
+        """
+        Vectorized query of the table. Arguments are broadcast together.
+
+        Returns:
+            dict: Arrays of every variable in `SURROGATE_VARIABLES`.
+
+        Raises:
+            ValueError: If a point lies outside the table.
+        """
+        query = dict(zip(self.axes, np.broadcast_arrays(mr, pc, epsc, eps)))
+        for name, values in self.axes.items():
+            fixed = values[0]
+            if name not in self._dims and fixed is not None:
+                if not np.allclose(query[name].astype(float), fixed):
+                    raise ValueError(f"'{name}' differs from the surrogate table value {fixed}.")
+
+        shape = query["mr"].shape
+        xi = np.stack(
+            [self.coords(name, query[name].astype(float)).ravel() for name in self._dims], axis=-1
+        )
+        return {key: interp(xi).reshape(shape) for key, interp in self._interp.items()}
@@ -1,30 +1,24 @@
+import numpy as np
 import rocketforge.performance.config as config
 import rocketforge.thermal.config as tconf
 from tabulate import tabulate
-from rocketcea.cea_obj_w_units import CEA_Obj
+from rocketforge.performance.cea import get_cea
+from rocketforge.performance.design import DesignState, TheoreticalResult
+from rocketforge.performance.stations import stations
 
 
-def theoretical(i=2, fr=0, fat=0):
-    ox = config.ox
-    fuel = config.fuel
-    pc = config.pc
-    mr = config.mr
-    eps = config.eps
-    epsc = config.epsc
+def evaluate_theoretical(state: DesignState, i: int = 2, fr: int = 0, fat: int = 0) -> TheoreticalResult:
+    """
+    #### Ideal performance of a design.
+    `i`: number of nozzle stations between throat and exit (included)
+    `fr`, `fat`: frozen flow and frozen at throat flags
+    """
+    pc = state.pc
+    mr = state.mr
+    eps = state.eps
 
     # CEA_Obj
-    C = CEA_Obj(
-        oxName=ox,
-        fuelName=fuel,
-        fac_CR=epsc,
-        cstar_units="m/s",
-        pressure_units="Pa",
-        temperature_units="K",
-        sonic_velocity_units="m/s",
-        enthalpy_units="kJ/kg",
-        density_units="kg/m^3",
-        specific_heat_units="J/kg-K",
-    )
+    C = get_cea(state.ox, state.fuel, state.epsc)
 
     # Characteristic velocity
     cstar = C.get_Cstar(Pc=pc, MR=mr)
@@ -34,7 +28,7 @@ def theoretical(i=2, fr=0, fat=0):
 
     # Ambient specific impulse
     Isp_sl = C.estimate_Ambient_Isp(Pc=pc, MR=mr, eps=eps, Pamb=101325, frozen=fr, frozenAtThroat=fat)[0]
-    Isp_opt = C.estimate_Ambient_Isp(Pc=pc, MR=mr, eps=eps, Pamb=config.pe, frozen=fr, frozenAtThroat=fat)[0]
+    Isp_opt = C.estimate_Ambient_Isp(Pc=pc, MR=mr, eps=eps, Pamb=state.pe, frozen=fr, frozenAtThroat=fat)[0]
 
     # Vacuum specific impulse (equilibrium)
     Isp_vac_eq = C.get_Isp(Pc=pc, MR=mr, eps=eps)
@@ -42,61 +36,52 @@ def theoretical(i=2, fr=0, fat=0):
     # Vacuum specific impulse (frozen)
     Isp_vac_fr = C.get_Isp(Pc=pc, MR=mr, eps=eps, frozen=1)
 
-    # Temperature
-    Tc, Tt, Te = C.get_Temperatures(Pc=pc, MR=mr, eps=eps, frozen=fr, frozenAtThroat=fat)
-
-    # Density
-    rhoc, rhot, rhoe = C.get_Densities(Pc=pc, MR=mr, eps=eps, frozen=fr, frozenAtThroat=fat)
+    # Thermodynamic properties calculations
+    table = stations(C, pc, mr, eps, i, fr, fat)
 
-    # Chamber transport properties
-    cpc, muc, lc, Prc = C.get_Chamber_Transport(Pc=pc, MR=mr, eps=eps, frozen=fr)
+    # Frozen chamber transport properties
+    cp_0, mu_0, _, Pr_0 = C.get_Chamber_Transport(Pc=pc, MR=mr, eps=eps, frozen=1)
+
+    return TheoreticalResult(
+        cstar=cstar,
+        Isp_vac=Isp_vac,
+        Isp_vac_eq=Isp_vac_eq,
+        Isp_vac_fr=Isp_vac_fr,
+        Isp_sl=Isp_sl,
+        Isp_opt=Isp_opt,
+        stations=table,
+        cp_0=cp_0,
+        mu_0=mu_0 / 1.0e4,
+        Pr_0=Pr_0,
+        Pr_t=C.get_Exit_Transport(Pc=pc, MR=mr, eps=1.0, frozen=1)[3],
+        Pr_e=C.get_Exit_Transport(Pc=pc, MR=mr, eps=eps, frozen=1)[3],
+        T_c=C.get_Temperatures(Pc=pc, MR=mr, eps=eps, frozen=1)[0],
+    )
 
-    # Sonic velocity
-    ac, at, ae = C.get_SonicVelocities(Pc=pc, MR=mr, eps=eps, frozen=fr, frozenAtThroat=fat)
 
-    # Enthalpy
-    Hc, Ht, He = C.get_Enthalpies(Pc=pc, MR=mr, eps=eps, frozen=fr, frozenAtThroat=fat)
+def td_props(table: np.ndarray) -> list:
+    """
+    #### Thermodynamic properties table.
+    Converts a `STATION_DTYPE` array into rows of
+    [name, chamber, stations..., unit].
+    """
+    return [
+        ["Pressure", *(table["p"] / 100000), "bar"],
+        ["Temperature", *table["T"], "K"],
+        ["Density", *table["rho"], "kg/m^3"],
+        ["Heat capacity", *table["cp"], "J/kg-K"],
+        ["Viscosity", *table["mu"], "Pa-s"],
+        ["Thermal conductivity", *table["l"], "mcal/cm-K-s"],
+        ["Prandtl", *table["Pr"], ""],
+        ["Gamma", *table["gamma"], ""],
+        ["Mach number", *table["M"], ""],
+        ["Sonic velocity", *table["a"], "m/s"],
+        ["Enthalpy", *table["H"], "kJ/kg"],
+    ]
 
-    # Thermodynamic properties initialization
-    p = ["Pressure", pc / 100000]
-    T = ["Temperature", Tc]
-    rho = ["Density", rhoc]
-    cp = ["Heat capacity", cpc]
-    mu = ["Viscosity", muc / 1.0e4]
-    l = ["Thermal conductivity", lc]
-    Pr = ["Prandtl", Prc]
-    gamma = ["Gamma", 0]
-    M = ["Mach number", 0]
-    a = ["Sonic velocity", ac]
-    H = ["Enthalpy", Hc]
 
-    # Thermodynamic properties calculations
-    for x in range(i):
-        x = 1 + x * (eps - 1) / (i - 1)
-        p.append(pc / 100000 / C.get_PcOvPe(Pc=pc, MR=mr, eps=x, frozen=fr, frozenAtThroat=fat))
-        T.append(C.get_Temperatures(Pc=pc, MR=mr, eps=x, frozen=fr, frozenAtThroat=fat)[2])
-        rho.append(C.get_Densities(Pc=pc, MR=mr, eps=x, frozen=fr, frozenAtThroat=fat)[2])
-        cp.append(C.get_Exit_Transport(Pc=pc, MR=mr, eps=x, frozen=fr, frozenAtThroat=fat)[0])
-        mu.append(C.get_Exit_Transport(Pc=pc, MR=mr, eps=x, frozen=fr, frozenAtThroat=fat)[1] / 1.0e4)
-        l.append(C.get_Exit_Transport(Pc=pc, MR=mr, eps=x, frozen=fr, frozenAtThroat=fat)[2])
-        Pr.append(C.get_Exit_Transport(Pc=pc, MR=mr, eps=x, frozen=fr, frozenAtThroat=fat)[3])
-        gamma.append(C.get_exit_MolWt_gamma(Pc=pc, MR=mr, eps=x, frozen=fr, frozenAtThroat=fat)[1])
-        M.append(C.get_MachNumber(Pc=pc, MR=mr, eps=x, frozen=fr, frozenAtThroat=fat))
-        a.append(C.get_SonicVelocities(Pc=pc, MR=mr, eps=x, frozen=fr, frozenAtThroat=fat)[2])
-        H.append(C.get_Enthalpies(Pc=pc, MR=mr, eps=x, frozen=fr, frozenAtThroat=fat)[2])
-
-    # Thermodynamic properties units of measure
-    p.append("bar")
-    T.append("K")
-    rho.append("kg/m^3")
-    cp.append("J/kg-K")
-    mu.append("Pa-s")
-    l.append("mcal/cm-K-s")
-    Pr.append("")
-    gamma.append("")
-    M.append("")
-    a.append("m/s")
-    H.append("kJ/kg")
+def theoretical(i=2, fr=0, fat=0):
+    result = evaluate_theoretical(DesignState.from_config(), i, fr, fat)
 
     # Output formatting (thermodynamic properties)
     headers = ["Parameter", "Chamber"]
@@ -105,31 +90,28 @@ def theoretical(i=2, fr=0, fat=0):
     headers[2] = "Throat"
     headers[-1] = "Exit"
     headers.append("Unit")
-    results = [p, T, rho, cp, mu, l, Pr, gamma, M, a, H]
+    results = td_props(result.stations)
     output = tabulate(results, headers, numalign="right")
 
-    config.cstar = cstar
-    config.Isp_vac = Isp_vac
-    config.Isp_vac_eq = Isp_vac_eq
-    config.Isp_vac_fr = Isp_vac_fr
-    config.Isp_sl = Isp_sl
-    config.Isp_opt = Isp_opt
+    config.cstar = result.cstar
+    config.Isp_vac = result.Isp_vac
+    config.Isp_vac_eq = result.Isp_vac_eq
+    config.Isp_vac_fr = result.Isp_vac_fr
+    config.Isp_sl = result.Isp_sl
+    config.Isp_opt = result.Isp_opt
     config.td_props = results
-    config.gammae = results[7][-2]
-    config.Me = results[8][-2]
+    config.gammae = result.gammae
+    config.Me = result.Me
 
     # Thermal global variables
-    tconf.gamma = results[7][2]
-    tconf.gamma_e = results[7][-2]
-    tconf.M_e = results[8][-2]
-
-    # Frozen chamber transport properties
-    cp0, mu0, l0, Pr0 = C.get_Chamber_Transport(Pc=pc, MR=mr, eps=eps, frozen=1)
-    tconf.cp_0 = cp0
-    tconf.mu_0 = mu0 / 1.0e4
-    tconf.Pr_0 = Pr0
-    tconf.Pr_t = C.get_Exit_Transport(Pc=pc, MR=mr, eps=1.0, frozen=1)[3]
-    tconf.Pr_e = C.get_Exit_Transport(Pc=pc, MR=mr, eps=eps, frozen=1)[3]
-    tconf.T_c = C.get_Temperatures(Pc=pc, MR=mr, eps=eps, frozen=1)[0]
-
-    return output
\ No newline at end of file
+    tconf.gamma = result.gammat
+    tconf.gamma_e = result.gammae
+    tconf.M_e = result.Me
+    tconf.cp_0 = result.cp_0
+    tconf.mu_0 = result.mu_0
+    tconf.Pr_0 = result.Pr_0
+    tconf.Pr_t = result.Pr_t
+    tconf.Pr_e = result.Pr_e
+    tconf.T_c = result.T_c
+
+    return output
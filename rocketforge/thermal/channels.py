@@ -1,12 +1,13 @@
 from numpy import *
 import pyvista as pv
 from rocketforge.utils.logger import logger
+from rocketforge.utils.tracing import span
 
-def plot_3D(x, R, a, b, delta, NC, t_w, t_eOvt_w = 4.0, radius_resolution=1):
-    plotter = pv.Plotter(title="Regenerative cooling channels")
-    global export_stl
-    export_stl = False
-
+def build_meshes(x, R, a, b, delta, NC, t_w, t_eOvt_w = 4.0):
+    """
+    Returns the points of the cooling jacket and its inner wall, ribs, outer
+    wall and channels meshes.
+    """
     global channel_resolution, rib_resolution
     channel_resolution = max([1, int(180/NC * max(a / (a + delta)))])
     rib_resolution = max([1, int(channel_resolution * max(delta/a))])
@@ -48,29 +49,29 @@ def plot_3D(x, R, a, b, delta, NC, t_w, t_eOvt_w = 4.0, radius_resolution=1):
     x_offset = len(radii) * r_offset # Index offset along the axial direction
     last_face_offset = (len_phi - 1) * x_offset
 
-    # Inner wall
-    inner_wall_faces = generate_inner_wall_mesh()
-    inner_wall_pd = pv.PolyData(points, inner_wall_faces)
-    if not inner_wall_pd.is_manifold: logger.warning("Inner wall mesh is not watertight.")
-    inner_wall = plotter.add_mesh(inner_wall_pd, color="#727472", opacity=1, show_edges=False, line_width=2, backface_culling=True)
+    meshes = {}
+    for name, generate in (
+        ("Inner wall", generate_inner_wall_mesh),
+        ("Ribs", generate_ribs_mesh),
+        ("Outer wall", generate_outer_wall_mesh),
+        ("Channels", generate_channels_mesh),
+    ):
+        with span(name, "mesh", NC=NC):
+            meshes[name] = pv.PolyData(points, generate())
+        if not meshes[name].is_manifold: logger.warning(f"{name} mesh is not watertight.")
+    return points, meshes
 
-    # Ribs
-    ribs_faces = generate_ribs_mesh()
-    ribs_pd = pv.PolyData(points, ribs_faces)
-    if not ribs_pd.is_manifold: logger.warning("Ribs mesh is not watertight.")
-    ribs = plotter.add_mesh(ribs_pd, color="#727472", opacity=1, show_edges=False, line_width=2, backface_culling=True)
 
-    # Outer wall
-    outer_wall_faces = generate_outer_wall_mesh()
-    outer_wall_pd = pv.PolyData(points, outer_wall_faces)
-    if not outer_wall_pd.is_manifold: logger.warning("Outer wall mesh is not watertight.")
-    outer_wall = plotter.add_mesh(outer_wall_pd, color="#727472", opacity=1, show_edges=False, line_width=2, backface_culling=True)
+def plot_3D(x, R, a, b, delta, NC, t_w, t_eOvt_w = 4.0, radius_resolution=1):
+    plotter = pv.Plotter(title="Regenerative cooling channels")
+    global export_stl
+    export_stl = False
 
-    # Channels
-    channels_faces = generate_channels_mesh()
-    channels_pd = pv.PolyData(points, channels_faces)
-    if not channels_pd.is_manifold: logger.warning("Channels mesh is not watertight.")
-    channels = plotter.add_mesh(channels_pd, color="#D95319", opacity=0.7, show_edges=False, line_width=2, backface_culling=True)
+    points, meshes = build_meshes(x, R, a, b, delta, NC, t_w, t_eOvt_w)
+    inner_wall = plotter.add_mesh(meshes["Inner wall"], color="#727472", opacity=1, show_edges=False, line_width=2, backface_culling=True)
+    ribs = plotter.add_mesh(meshes["Ribs"], color="#727472", opacity=1, show_edges=False, line_width=2, backface_culling=True)
+    outer_wall = plotter.add_mesh(meshes["Outer wall"], color="#727472", opacity=1, show_edges=False, line_width=2, backface_culling=True)
+    channels = plotter.add_mesh(meshes["Channels"], color="#D95319", opacity=0.7, show_edges=False, line_width=2, backface_culling=True)
 
     plotter.add_checkbox_button_widget(
         lambda flag: outer_wall.SetVisibility(flag),
@@ -0,0 +1,43 @@
+import rocketforge.thermal.config as config
+import rocketforge.performance.config as pconf
+
+
+def set_regen_cooling(enabled: bool, coolant: str, m_dot_c: float, T_ci: float, enable_dp: bool, p_ci: float,
+                      t_w: float, lambda_w: float) -> None:
+    """
+    #### Regenerative cooling settings.
+    Stores the settings in the thermal config, used by the thermal tab and
+    the batch runner. With pressure drops enabled, the coolant inlet pressure
+    follows from the chamber pressure and `pcoOvpc`, and `p_ci` is ignored.
+
+    Parameters:
+        enabled (bool): Enables the regenerative cooling analysis.
+        coolant (str): Coolant name.
+        m_dot_c (float): Coolant mass flow rate in kg/s.
+        T_ci (float): Coolant inlet temperature in K.
+        enable_dp (bool): Enables the pressure drop computation.
+        p_ci (float): Coolant inlet pressure in Pa.
+        t_w (float): Inner wall thickness in m.
+        lambda_w (float): Wall thermal conductivity in W/m-K.
+    """
+    config.regen = enabled
+    config.coolant = coolant
+    config.m_dot_c = m_dot_c
+    config.T_ci = T_ci
+    config.enable_dp = enable_dp
+    config.p_ci = pconf.pc * config.pcoOvpc if enable_dp else p_ci
+    config.t_w = t_w
+    config.lambda_w = lambda_w
+
+
+def set_rad_cooling(enabled: bool, eps_w: float) -> None:
+    """Radiation cooling settings: `eps_w` is the wall emissivity."""
+    config.rad = enabled
+    config.eps_w = eps_w
+
+
+def set_film_cooling(enabled: bool, fuelfilm: float = 0.0, oxfilm: float = 0.0) -> None:
+    """Film cooling settings: film flow rates in percent of the fuel and oxidizer flow rates."""
+    config.film = enabled
+    config.fuelfilm = fuelfilm
+    config.oxfilm = oxfilm
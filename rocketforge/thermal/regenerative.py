@@ -8,11 +8,13 @@ import rocketforge.geometry.conical as conical
 import rocketforge.thermal.channels as channels
 from rocketforge.thermal.friction_factor import moody, tkachenko, colebrook_white
 from rocketforge.thermal.heat_flux import bartz, rad
+from rocketforge.utils.tracing import span, traced
 from rocketprops.rocket_prop import get_prop
 from tkinter.filedialog import asksaveasfilename
 
 
 class Regen():
+    @traced("Regen.run", "thermal")
     def run(self):
         P = get_prop(config.coolant)
         X, Y = get_geometry()
@@ -62,80 +64,81 @@ class Regen():
         while True:
             iter += 1
 
-            h = bartz(M, A, gamma, T_wg)
-            q = h * (T_aw - T_wg)
+            with span("Regen iteration", "thermal", iteration=iter):
+                h = bartz(M, A, gamma, T_wg)
+                q = h * (T_aw - T_wg)
             
-            if config.rad:
-                q_rad = full(config.n_stations, 0.0) # TODO
-                q_rc = rad(config.eps_w, T_wc)
-                q += q_rad - q_rc
-
-            dT_c = q * A_w / config.m_dot_c / cp_c
-            for i in reversed(range(config.n_stations)):
-                if i != config.n_stations - 1:
-                    T_c[i] = T_c[i + 1] + dT_c[i]
+                if config.rad:
+                    q_rad = full(config.n_stations, 0.0) # TODO
+                    q_rc = rad(config.eps_w, T_wc)
+                    q += q_rad - q_rc
+
+                dT_c = q * A_w / config.m_dot_c / cp_c
+                for i in reversed(range(config.n_stations)):
+                    if i != config.n_stations - 1:
+                        T_c[i] = T_c[i + 1] + dT_c[i]
             
-            for i in range(config.n_stations):
-                cp_c[i] = P.CpAtTdegR(T_c[i] * 1.8) * 4186.8
-                mu_c[i] = P.ViscAtTdegR(T_c[i] * 1.8) / 10.0
-                lambda_c[i] = P.CondAtTdegR(T_c[i] * 1.8) * 1.72958
-
-            Re_c = config.m_dot_c / a / b / NC * d_e / mu_c
-            Pr_c = mu_c * cp_c / lambda_c
-            Nu = 0.023 * Re_c**0.8 * Pr_c**0.4
-            h_c = Nu * lambda_c / d_e
-            h_c0 = h_c
-
-            for i in range(config.max_iter):
-                xi = sqrt(2.0 * h_c / delta / config.lambda_w) * b
-                eta_f = a / (a + delta) + 2.0 * b / (a + delta) * tanh(xi) / xi
-                hc_old = h_c
-                h_c = h_c0 * eta_f
-                if all(abs((hc_old - h_c)/hc_old) < 0.01):
-                    break
-
-            T_wc = T_c + q / h_c
-            T_wg_new = T_wc + q * config.t_w / config.lambda_w
-
-            if config.enable_dp:
                 for i in range(config.n_stations):
-                    rho_c[i] = P.SG_compressed(T_c[i] * 1.8, p[i] / 6894.75728) * 1000.0
-                u_c = Re_c * mu_c / d_e / rho_c
-                roughness = config.absolute_roughness / d_e
-
-                if config.dp_method == 0:
-                    f = tkachenko(Re_c, roughness)
-                elif config.dp_method == 1:
-                    f = moody(Re_c, roughness)
-                elif config.dp_method == 2:
-                    f = colebrook_white(Re_c, roughness)
-
-                dp1 = 0.5 * rho_c * u_c**2 * f * L_tot / config.n_stations / d_e
-
-                for i in range(config.n_stations - 1):
-                    ratio = d_e[i] / d_e[i + 1]
-                    if ratio > 1.0:
-                        _K = (ratio**2 - 1.0)**2
-                    else:
-                        _K = 0.5 - 0.167 * ratio - 0.125 * ratio**2 - 0.208 * ratio**3
-                    dp2[i] = 0.5 * rho_c[i] * u_c[i]**2 * _K
-                    dp3[i] = (
-                        (2.0/(a[i]*b[i] + a[i+1]*b[i+1]))
-                        * (1.0/(a[i+1]*b[i+1]) - 1.0/(a[i]*b[i]))
-                        / rho_c[i] / NC[i]**2 * config.m_dot_c**2
-                    )
-
-                dp = dp1 + dp2 + dp3
-
-                for i in range(config.n_stations):
-                    if i != 0:
-                        p[i] = p[i - 1] + dp[i]
-
-            if all(abs((T_wg - T_wg_new) / T_wg) < 0.05) or iter == config.max_iter:
-                T_wg = T_wg_new
-                break
+                    cp_c[i] = P.CpAtTdegR(T_c[i] * 1.8) * 4186.8
+                    mu_c[i] = P.ViscAtTdegR(T_c[i] * 1.8) / 10.0
+                    lambda_c[i] = P.CondAtTdegR(T_c[i] * 1.8) * 1.72958
+
+                Re_c = config.m_dot_c / a / b / NC * d_e / mu_c
+                Pr_c = mu_c * cp_c / lambda_c
+                Nu = 0.023 * Re_c**0.8 * Pr_c**0.4
+                h_c = Nu * lambda_c / d_e
+                h_c0 = h_c
+
+                for i in range(config.max_iter):
+                    xi = sqrt(2.0 * h_c / delta / config.lambda_w) * b
+                    eta_f = a / (a + delta) + 2.0 * b / (a + delta) * tanh(xi) / xi
+                    hc_old = h_c
+                    h_c = h_c0 * eta_f
+                    if all(abs((hc_old - h_c)/hc_old) < 0.01):
+                        break
+
+                T_wc = T_c + q / h_c
+                T_wg_new = T_wc + q * config.t_w / config.lambda_w
+
+                if config.enable_dp:
+                    for i in range(config.n_stations):
+                        rho_c[i] = P.SG_compressed(T_c[i] * 1.8, p[i] / 6894.75728) * 1000.0
+                    u_c = Re_c * mu_c / d_e / rho_c
+                    roughness = config.absolute_roughness / d_e
+
+                    if config.dp_method == 0:
+                        f = tkachenko(Re_c, roughness)
+                    elif config.dp_method == 1:
+                        f = moody(Re_c, roughness)
+                    elif config.dp_method == 2:
+                        f = colebrook_white(Re_c, roughness)
+
+                    dp1 = 0.5 * rho_c * u_c**2 * f * L_tot / config.n_stations / d_e
+
+                    for i in range(config.n_stations - 1):
+                        ratio = d_e[i] / d_e[i + 1]
+                        if ratio > 1.0:
+                            _K = (ratio**2 - 1.0)**2
+                        else:
+                            _K = 0.5 - 0.167 * ratio - 0.125 * ratio**2 - 0.208 * ratio**3
+                        dp2[i] = 0.5 * rho_c[i] * u_c[i]**2 * _K
+                        dp3[i] = (
+                            (2.0/(a[i]*b[i] + a[i+1]*b[i+1]))
+                            * (1.0/(a[i+1]*b[i+1]) - 1.0/(a[i]*b[i]))
+                            / rho_c[i] / NC[i]**2 * config.m_dot_c**2
+                        )
+
+                    dp = dp1 + dp2 + dp3
+
+                    for i in range(config.n_stations):
+                        if i != 0:
+                            p[i] = p[i - 1] + dp[i]
+
+                if all(abs((T_wg - T_wg_new) / T_wg) < 0.05) or iter == config.max_iter:
+                    T_wg = T_wg_new
+                    break
 
-            T_wg = (1.0 - config.stability) * T_wg + config.stability * T_wg_new
+                T_wg = (1.0 - config.stability) * T_wg + config.stability * T_wg_new
         
         if config.enable_dp:
             Dp = sum(dp)
@@ -133,129 +133,150 @@ def save_config(self: RocketForge):
     self.statuslabel.update()
 
 
-def load_config(self: RocketForge):
-    self.statuslabel.configure(text="Status: loading configuration file...")
-    self.statuslabel.update()
+def load_initial(idf, config: ConfigParser):
+    update_entry(idf.enginenameentry, config.get("InitialData", "name"))
+    update_entry(idf.pcentry, config.get("InitialData", "chamber_pressure"))
+    idf.pcuom.set(config.get("InitialData", "chamber_pressure_uom"))
+    idf.oxvar.set(config.get("InitialData", "oxidizer"))
+    idf.fuelvar.set(config.get("InitialData", "fuel"))
+    update_entry(idf.mrentry, config.get("InitialData", "mixture_ratio"))
+    idf.mruom.set(config.get("InitialData", "mixture_ratio_uom"))
+    update_entry(idf.epsentry, config.get("InitialData", "expansion_area_ratio"))
+    update_entry(idf.peratioentry, config.get("InitialData", "expansion_pressure_ratio"))
+    update_entry(idf.peentry, config.get("InitialData", "exit_pressure"))
+    idf.peuom.set(config.get("InitialData", "exit_pressure_uom"))
+    idf.exitcondition.set(config.get("InitialData", "exit_condition"))
+    idf.optimizationmode.set(config.get("InitialData", "mixture_ratio_optimization"))
+    idf.inletcondition.set(config.get("InitialData", "inlet_conditions"))
+    update_entry(idf.epscentry, config.get("InitialData", "contraction_ratio"))
+    update_entry(idf.thrustentry, config.get("InitialData", "thrust"))
+    idf.thrustuom.set(config.get("InitialData", "thrust_uom"))
+    update_entry(idf.thrustentry2, config.get("InitialData", "ambient_pressure"))
+    idf.thrustuom2.set(config.get("InitialData", "ambient_pressure_uom"))
 
-    try:
-        config = ConfigParser()
-        config.read(filedialog.askopenfilename(title="Load configuration file", filetypes=(("Rocket Forge files", "*.rf"), ("all files", "*.*"))))
 
-        idf = self.initialframe
+def load_performance(pf, config: ConfigParser):
+    tf = pf.thermodynamicframe
 
-        update_entry(idf.enginenameentry, config.get("InitialData", "name"))
-        update_entry(idf.pcentry, config.get("InitialData", "chamber_pressure"))
-        idf.pcuom.set(config.get("InitialData", "chamber_pressure_uom"))
-        idf.oxvar.set(config.get("InitialData", "oxidizer"))
-        idf.fuelvar.set(config.get("InitialData", "fuel"))
-        update_entry(idf.mrentry, config.get("InitialData", "mixture_ratio"))
-        idf.mruom.set(config.get("InitialData", "mixture_ratio_uom"))
-        update_entry(idf.epsentry, config.get("InitialData", "expansion_area_ratio"))
-        update_entry(idf.peratioentry, config.get("InitialData", "expansion_pressure_ratio"))
-        update_entry(idf.peentry, config.get("InitialData", "exit_pressure"))
-        idf.peuom.set(config.get("InitialData", "exit_pressure_uom"))
-        idf.exitcondition.set(config.get("InitialData", "exit_condition"))
-        idf.optimizationmode.set(config.get("InitialData", "mixture_ratio_optimization"))
-        idf.inletcondition.set(config.get("InitialData", "inlet_conditions"))
-        update_entry(idf.epscentry, config.get("InitialData", "contraction_ratio"))
-        update_entry(idf.thrustentry, config.get("InitialData", "thrust"))
-        idf.thrustuom.set(config.get("InitialData", "thrust_uom"))
-        update_entry(idf.thrustentry2, config.get("InitialData", "ambient_pressure"))
-        idf.thrustuom2.set(config.get("InitialData", "ambient_pressure_uom"))
+    tf.frozenflow.set(config.get("Performance", "flow_model"))
+    update_entry(tf.stationsentry, config.get("Performance", "number_of_stations"))
 
-        tf = self.performanceframe.thermodynamicframe
 
-        tf.frozenflow.set(config.get("Performance", "flow_model"))
-        update_entry(tf.stationsentry, config.get("Performance", "number_of_stations"))
+def load_geometry(gf, config: ConfigParser):
+    gf.shape.set(config.get("Geometry", "shape"))
+    gf.change_shape(config.get("Geometry", "shape"))
 
-        gf = self.geometryframe
+    update_entry(gf.throatareaentry, config.get("Geometry", "throat_area"))
+    gf.throatareauom.set(config.get("Geometry", "throat_area_uom"))
+    update_entry(gf.divergentlengthentry, config.get("Geometry", "divergent_length"))
+    gf.divergentlengthuom.set(config.get("Geometry", "divergent_length_uom"))
+    update_entry(gf.thetaexentry, config.get("Geometry", "theta_e"))
+    gf.thetaexuom.set(config.get("Geometry", "theta_e_uom"))
+    update_entry(gf.thetanentry, config.get("Geometry", "theta_n"))
+    gf.thetanuom.set(config.get("Geometry", "theta_n_uom"))
+    update_entry(gf.rnovrtentry, config.get("Geometry", "rnovrt"))
+    update_entry(gf.r1ovrtentry, config.get("Geometry", "r1ovrt"))
+    update_entry(gf.r2ovr2maxentry, config.get("Geometry", "r2ovr2max"))
+    update_entry(gf.chamberlengthentry, config.get("Geometry", "chamber_length"))
+    gf.chamberlengthuom.set(config.get("Geometry", "chamber_length_uom"))
+    update_entry(gf.bentry, config.get("Geometry", "contraction_angle"))
+    gf.buom.set(config.get("Geometry", "contraction_angle_uom"))
+    gf.cselected.set(config.get("Geometry", "cselected"))
+    update_entry(gf.cleentry, config.get("Geometry", "cle"))
+    gf.cleuom.set(config.get("Geometry", "cle_uom"))
+    update_entry(gf.clfentry, config.get("Geometry", "clf"))
+    update_entry(gf.cthetaentry, config.get("Geometry", "ctheta"))
+    gf.cthetauom.set(config.get("Geometry", "ctheta_uom"))
 
-        gf.shape.set(config.get("Geometry", "shape"))
-        gf.change_shape(config.get("Geometry", "shape"))
 
-        update_entry(gf.throatareaentry, config.get("Geometry", "throat_area"))
-        gf.throatareauom.set(config.get("Geometry", "throat_area_uom"))
-        update_entry(gf.divergentlengthentry, config.get("Geometry", "divergent_length"))
-        gf.divergentlengthuom.set(config.get("Geometry", "divergent_length_uom"))
-        update_entry(gf.thetaexentry, config.get("Geometry", "theta_e"))
-        gf.thetaexuom.set(config.get("Geometry", "theta_e_uom"))
-        update_entry(gf.thetanentry, config.get("Geometry", "theta_n"))
-        gf.thetanuom.set(config.get("Geometry", "theta_n_uom"))
-        update_entry(gf.rnovrtentry, config.get("Geometry", "rnovrt"))
-        update_entry(gf.r1ovrtentry, config.get("Geometry", "r1ovrt"))
-        update_entry(gf.r2ovr2maxentry, config.get("Geometry", "r2ovr2max"))
-        update_entry(gf.chamberlengthentry, config.get("Geometry", "chamber_length"))
-        gf.chamberlengthuom.set(config.get("Geometry", "chamber_length_uom"))
-        update_entry(gf.bentry, config.get("Geometry", "contraction_angle"))
-        gf.buom.set(config.get("Geometry", "contraction_angle_uom"))
-        gf.cselected.set(config.get("Geometry", "cselected"))
-        update_entry(gf.cleentry, config.get("Geometry", "cle"))
-        gf.cleuom.set(config.get("Geometry", "cle_uom"))
-        update_entry(gf.clfentry, config.get("Geometry", "clf"))
-        update_entry(gf.cthetaentry, config.get("Geometry", "ctheta"))
-        gf.cthetauom.set(config.get("Geometry", "ctheta_uom"))
+def load_thermal(thf, config: ConfigParser):
+    thf.regenvar.set(config.get("Thermal", "enable_regen"))
+    thf.coolant.set(config.get("Thermal", "coolant"))
+    update_entry(thf.mdotcentry, config.get("Thermal", "coolant_flow_rate"))
+    thf.mdotcuom.set(config.get("Thermal", "coolant_flow_rate_uom"))
+    update_entry(thf.tcientry, config.get("Thermal", "coolant_Ti"))
+    thf.tciuom.set(config.get("Thermal", "coolant_Ti_uom"))
+    update_entry(thf.pcientry, config.get("Thermal", "coolant_pi"))
+    thf.pciuom.set(config.get("Thermal", "coolant_pi_uom"))
+    thf.dp.set(config.get("Thermal", "pressure_drops"))
+    update_entry(thf.tentry, config.get("Thermal", "inner_wall"))
+    thf.tuom.set(config.get("Thermal", "inner_wall_uom"))
+    update_entry(thf.kentry, config.get("Thermal", "wall_conductivity"))
+    thf.radvar.set(config.get("Thermal", "enable_rad"))
+    update_entry(thf.radepsentry, config.get("Thermal", "eps_w"))
+    thf.filmvar.set(config.get("Thermal", "enable_film"))
+    update_entry(thf.fuelfilm, config.get("Thermal", "fuel_film"))
+    update_entry(thf.oxfilm, config.get("Thermal", "ox_film"))
 
-        thf = self.thermalframe
-        thf.regenvar.set(config.get("Thermal", "enable_regen"))
-        thf.coolant.set(config.get("Thermal", "coolant"))
-        update_entry(thf.mdotcentry, config.get("Thermal", "coolant_flow_rate"))
-        thf.mdotcuom.set(config.get("Thermal", "coolant_flow_rate_uom"))
-        update_entry(thf.tcientry, config.get("Thermal", "coolant_Ti"))
-        thf.tciuom.set(config.get("Thermal", "coolant_Ti_uom"))
-        update_entry(thf.pcientry, config.get("Thermal", "coolant_pi"))
-        thf.pciuom.set(config.get("Thermal", "coolant_pi_uom"))
-        thf.dp.set(config.get("Thermal", "pressure_drops"))
-        update_entry(thf.tentry, config.get("Thermal", "inner_wall"))
-        thf.tuom.set(config.get("Thermal", "inner_wall_uom"))
-        update_entry(thf.kentry, config.get("Thermal", "wall_conductivity"))
-        tconf.NC = int(float(config.get("Thermal", "number_of_channels")))
-        tconf.a1 = float(config.get("Thermal", "channels_ac"))
-        tconf.a2 = float(config.get("Thermal", "channels_at"))
-        tconf.a3 = float(config.get("Thermal", "channels_ae"))
-        tconf.b1 = float(config.get("Thermal", "channels_bc"))
-        tconf.b2 = float(config.get("Thermal", "channels_bt"))
-        tconf.b3 = float(config.get("Thermal", "channels_be"))
-        tconf.pcoOvpc = float(config.get("Thermal", "adv_pinj/pc"))
-        tconf.n_stations = int(float(config.get("Thermal", "adv_stations")))
-        tconf.max_iter = int(float(config.get("Thermal", "adv_max_iter")))
-        tconf.tuning_factor = float(config.get("Thermal", "adv_tuning"))
-        tconf.stability = float(config.get("Thermal", "adv_stability"))
-        tconf.absolute_roughness = float(config.get("Thermal", "adv_abs_roughness"))
-        tconf.dp_method = int(float(config.get("Thermal", "adv_friction_method")))
-        tconf.t_eOvt_w = float(config.get("Thermal", "t_eOvt_w"))
-        thf.radvar.set(config.get("Thermal", "enable_rad"))
-        update_entry(thf.radepsentry, config.get("Thermal", "eps_w"))
-        thf.filmvar.set(config.get("Thermal", "enable_film"))
-        update_entry(thf.fuelfilm, config.get("Thermal", "fuel_film"))
-        update_entry(thf.oxfilm, config.get("Thermal", "ox_film"))
 
-        ttf = self.tanksframe
+def load_thermal_config(config: ConfigParser):
+    """Loads the thermal settings that are not held by widgets."""
+    tconf.NC = int(float(config.get("Thermal", "number_of_channels")))
+    tconf.a1 = float(config.get("Thermal", "channels_ac"))
+    tconf.a2 = float(config.get("Thermal", "channels_at"))
+    tconf.a3 = float(config.get("Thermal", "channels_ae"))
+    tconf.b1 = float(config.get("Thermal", "channels_bc"))
+    tconf.b2 = float(config.get("Thermal", "channels_bt"))
+    tconf.b3 = float(config.get("Thermal", "channels_be"))
+    tconf.pcoOvpc = float(config.get("Thermal", "adv_pinj/pc"))
+    tconf.n_stations = int(float(config.get("Thermal", "adv_stations")))
+    tconf.max_iter = int(float(config.get("Thermal", "adv_max_iter")))
+    tconf.tuning_factor = float(config.get("Thermal", "adv_tuning"))
+    tconf.stability = float(config.get("Thermal", "adv_stability"))
+    tconf.absolute_roughness = float(config.get("Thermal", "adv_abs_roughness"))
+    tconf.dp_method = int(float(config.get("Thermal", "adv_friction_method")))
+    tconf.t_eOvt_w = float(config.get("Thermal", "t_eOvt_w"))
+
+
+def load_tanks(ttf, config: ConfigParser):
+    update_entry(ttf.mdotentry, config.get("Tanks", "mass_flow_rate"))
+    ttf.mdotuom.set(config.get("Tanks", "mass_flow_rate_uom"))
+    update_entry(ttf.mpentry, config.get("Tanks", "prop_mass"))
+    ttf.mpuom.set(config.get("Tanks", "prop_mass_uom"))
+    update_entry(ttf.mrentry, config.get("Tanks", "mixture_ratio"))
+    update_entry(ttf.k0entry, config.get("Tanks", "k0"))
+    ttf.k0uom.set(config.get("Tanks", "k0_uom"))
+    update_entry(ttf.ktentry, config.get("Tanks", "kt"))
+    update_entry(ttf.oxrhoentry, config.get("Tanks", "rho_ox"))
+    ttf.oxrhouom.set(config.get("Tanks", "rho_ox_uom"))
+    update_entry(ttf.oxrentry, config.get("Tanks", "r_ox"))
+    ttf.oxruom.set(config.get("Tanks", "r_ox_uom"))
+    update_entry(ttf.oxexcentry, config.get("Tanks", "exc_ox"))
+    update_entry(ttf.oxxentry, config.get("Tanks", "pos_ox"))
+    ttf.oxxuom.set(config.get("Tanks", "pos_ox_uom"))
+    update_entry(ttf.fuelrhoentry, config.get("Tanks", "rho_fuel"))
+    ttf.fuelrhouom.set(config.get("Tanks", "rho_fuel_uom"))
+    update_entry(ttf.fuelrentry, config.get("Tanks", "r_fuel"))
+    ttf.fuelruom.set(config.get("Tanks", "r_fuel_uom"))
+    update_entry(ttf.fuelexcentry, config.get("Tanks", "exc_fuel"))
+    update_entry(ttf.fuelxentry, config.get("Tanks", "pos_fuel"))
+    ttf.fuelxuom.set(config.get("Tanks", "pos_fuel_uom"))
 
-        update_entry(ttf.mdotentry, config.get("Tanks", "mass_flow_rate"))
-        ttf.mdotuom.set(config.get("Tanks", "mass_flow_rate_uom"))
-        update_entry(ttf.mpentry, config.get("Tanks", "prop_mass"))
-        ttf.mpuom.set(config.get("Tanks", "prop_mass_uom"))
-        update_entry(ttf.mrentry, config.get("Tanks", "mixture_ratio"))
-        update_entry(ttf.k0entry, config.get("Tanks", "k0"))
-        ttf.k0uom.set(config.get("Tanks", "k0_uom"))
-        update_entry(ttf.ktentry, config.get("Tanks", "kt"))
-        update_entry(ttf.oxrhoentry, config.get("Tanks", "rho_ox"))
-        ttf.oxrhouom.set(config.get("Tanks", "rho_ox_uom"))
-        update_entry(ttf.oxrentry, config.get("Tanks", "r_ox"))
-        ttf.oxruom.set(config.get("Tanks", "r_ox_uom"))
-        update_entry(ttf.oxexcentry, config.get("Tanks", "exc_ox"))
-        update_entry(ttf.oxxentry, config.get("Tanks", "pos_ox"))
-        ttf.oxxuom.set(config.get("Tanks", "pos_ox_uom"))
-        update_entry(ttf.fuelrhoentry, config.get("Tanks", "rho_fuel"))
-        ttf.fuelrhouom.set(config.get("Tanks", "rho_fuel_uom"))
-        update_entry(ttf.fuelrentry, config.get("Tanks", "r_fuel"))
-        ttf.fuelruom.set(config.get("Tanks", "r_fuel_uom"))
-        update_entry(ttf.fuelexcentry, config.get("Tanks", "exc_fuel"))
-        update_entry(ttf.fuelxentry, config.get("Tanks", "pos_fuel"))
-        ttf.fuelxuom.set(config.get("Tanks", "pos_fuel_uom"))
+
+# Tab frames and the functions loading a project file into them
+FRAME_LOADERS = {
+    "initialframe": load_initial,
+    "performanceframe": load_performance,
+    "geometryframe": load_geometry,
+    "thermalframe": load_thermal,
+    "tanksframe": load_tanks,
+}
+
+
+def load_config(self: RocketForge):
+    self.statuslabel.configure(text="Status: loading configuration file...")
+    self.statuslabel.update()
+
+    try:
+        config = ConfigParser()
+        if config.read(filedialog.askopenfilename(title="Load configuration file", filetypes=(("Rocket Forge files", "*.rf"), ("all files", "*.*")))):
+            # Tabs that were not opened yet are loaded when they are built
+            for name, loader in FRAME_LOADERS.items():
+                self.when_built(name, lambda frame, loader=loader: loader(frame, config))
+            load_thermal_config(config)
 
     except Exception:
         pass
 
     self.statuslabel.configure(text="Status: idle")
-    self.statuslabel.update()
\ No newline at end of file
+    self.statuslabel.update()
@@ -0,0 +1,170 @@
+import re
+import operator
+import tkinter.font
+import numpy as np
+from typing import Optional, Tuple
+from customtkinter import CTkEntry, CTkFrame, CTkLabel, CTkOptionMenu, CTkScrollbar, CTkTextbox
+
+
+# Comparison operators accepted in filters
+FILTER_OPERATORS = {
+    "<=": operator.le,
+    ">=": operator.ge,
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    ">": operator.gt,
+}
+FILTER_CLAUSE = re.compile(r"^\s*(\w+)\s*(<=|>=|==|!=|<|>)\s*(\S+)\s*$")
+FILTER_SEPARATOR = re.compile(r"\s+and\s+|\s*&\s*|\s*,\s*")
+
+
+class CTkVirtualTable(CTkFrame):
+    """
+    Read-only table of numeric columns that only formats the visible rows.
+
+    Rows are held as 1-D NumPy arrays; scrolling, sorting and filtering move
+    an index array over them, and each redraw formats one screen of rows.
+    Filters are "and"-separated clauses of the form `<column> <op> <value>`,
+    e.g. `Isp_vac > 300 and pc <= 5e6`.
+    """
+
+    def __init__(self,
+                 master: any,
+                 height: int = 200,
+                 font: Optional[Tuple[str, int]] = None,
+                 column_width: int = 14,
+                 **kwargs):
+        super().__init__(master, height=height, **kwargs)
+        self.grid_propagate(False)
+        self.grid_columnconfigure(4, weight=1)
+        self.grid_rowconfigure(1, weight=1)
+
+        self._font = font
+        self._column_width = column_width
+        self._columns = {}
+        self._headers = {}
+        self._order = np.arange(0)
+        self._offset = 0
+        self._visible = 10
+
+        # Toolbar
+        CTkLabel(self, text="Sort:").grid(row=0, column=0, padx=(5, 2), pady=(5, 0))
+        self.sortmenu = CTkOptionMenu(self, values=["-"], command=lambda _: self.refresh(), width=120)
+        self.sortmenu.grid(row=0, column=1, padx=2, pady=(5, 0))
+        self.ordermenu = CTkOptionMenu(
+            self, values=["Ascending", "Descending"], command=lambda _: self.refresh(), width=110
+        )
+        self.ordermenu.grid(row=0, column=2, padx=2, pady=(5, 0))
+        CTkLabel(self, text="Filter:").grid(row=0, column=3, padx=(5, 2), pady=(5, 0))
+        self.filterentry = CTkEntry(self, placeholder_text="e.g. Isp_vac > 300 and pc <= 5e6")
+        self.filterentry.grid(row=0, column=4, padx=2, pady=(5, 0), sticky="ew")
+        self.filterentry.bind("<Return>", lambda _: self.refresh())
+        self.countlabel = CTkLabel(self, text="", width=110, anchor="e")
+        self.countlabel.grid(row=0, column=5, columnspan=2, padx=(2, 5), pady=(5, 0))
+
+        # Visible rows
+        self.textbox = CTkTextbox(self, state="disabled", wrap="none", font=font)
+        self.textbox.grid(row=1, column=0, columnspan=6, padx=(5, 0), pady=5, sticky="nsew")
+        self.scrollbar = CTkScrollbar(self, orientation="vertical", command=self._on_scroll)
+        self.scrollbar.grid(row=1, column=6, padx=(0, 5), pady=5, sticky="ns")
+
+        self.textbox.bind("<MouseWheel>", self._on_wheel)
+        self.textbox.bind("<Button-4>", lambda _: self.scroll_to(self._offset - 3))
+        self.textbox.bind("<Button-5>", lambda _: self.scroll_to(self._offset + 3))
+        self.textbox.bind("<Configure>", self._on_resize)
+
+    def set_data(self, columns: dict, headers: dict = None) -> None:
+        """
+        Displays new data.
+
+        Args:
+            columns (dict): 1-D arrays of equal length, keyed by column name.
+            headers (dict, optional): Column titles, keyed by column name.
+        """
+        self._columns = {key: np.asarray(values).ravel() for key, values in columns.items()}
+        self._headers = {key: (headers or {}).get(key, key) for key in self._columns}
+        self.sortmenu.configure(values=["-", *self._columns])
+        if self.sortmenu.get() not in self._columns:
+            self.sortmenu.set("-")
+        self.refresh()
+
+    def show_text(self, text: str) -> None:
+        """Displays plain text instead of data."""
+        self._columns, self._headers = {}, {}
+        self._order = np.arange(0)
+        self.countlabel.configure(text="")
+        self._write(text)
+        self.scrollbar.set(0, 1)
+
+    def refresh(self) -> None:
+        """Applies the filter and the sort order, then redraws from the top."""
+        rows = len(next(iter(self._columns.values()))) if self._columns else 0
+        try:
+            mask = self._filter_mask(rows)
+        except ValueError:
+            self.countlabel.configure(text="Invalid filter")
+            return
+        order = np.flatnonzero(mask)
+
+        key = self.sortmenu.get()
+        if key in self._columns:
+            order = order[np.argsort(self._columns[key][order], kind="stable")]
+            if self.ordermenu.get() == "Descending":
+                order = order[::-1]
+
+        self._order = order
+        self.countlabel.configure(text=f"{len(order)} / {rows} rows")
+        self.scroll_to(0)
+
+    def scroll_to(self, offset: int) -> None:
+        """Redraws the table starting at the given row."""
+        self._offset = int(max(0, min(offset, len(self._order) - self._visible)))
+        if not self._columns:
+            return
+        width = self._column_width
+        lines = ["".join(f"{self._headers[key]:>{width}}" for key in self._columns)]
+        for i in self._order[self._offset:self._offset + self._visible]:
+            lines.append("".join(f"{self._columns[key][i]:>{width}.6g}" for key in self._columns))
+        self._write("\n".join(lines))
+
+        total = max(len(self._order), 1)
+        self.scrollbar.set(self._offset / total, min(1, (self._offset + self._visible) / total))
+
+    def _filter_mask(self, rows: int) -> np.ndarray:
+        mask = np.ones(rows, dtype=bool)
+        text = self.filterentry.get().strip()
+        if not text:
+            return mask
+        for clause in FILTER_SEPARATOR.split(text):
+            match = FILTER_CLAUSE.match(clause)
+            if match is None or match.group(1) not in self._columns:
+                raise ValueError(f"Invalid filter clause '{clause}'")
+            key, op, value = match.groups()
+            mask &= FILTER_OPERATORS[op](self._columns[key], float(value))
+        return mask
+
+    def _write(self, text: str) -> None:
+        self.textbox.configure(state="normal")
+        self.textbox.delete("1.0", "end")
+        self.textbox.insert("1.0", text)
+        self.textbox.configure(state="disabled")
+
+    def _on_scroll(self, action: str, value: str, unit: str = None) -> None:
+        if action == "moveto":
+            self.scroll_to(round(float(value) * len(self._order)))
+        elif action == "scroll":
+            step = self._visible if unit == "pages" else 1
+            self.scroll_to(self._offset + int(value) * step)
+
+    def _on_wheel(self, event) -> str:
+        self.scroll_to(self._offset - int(np.sign(event.delta)) * 3)
+        return "break"
+
+    def _on_resize(self, event) -> None:
+        linespace = tkinter.font.Font(font=self._font).metrics("linespace") if self._font else 16
+        # One line is taken by the header
+        visible = max(1, event.height // linespace - 1)
+        if visible != self._visible:
+            self._visible = visible
+            self.scroll_to(self._offset)
@@ -0,0 +1,89 @@
+"""
+Import-time report of the Rocket Forge entry points.
+
+Each module is imported in a fresh interpreter with `-X importtime`, and the
+slowest imports are tabulated, together with the time spent in each
+top-level package.
+
+Usage (from the repository root):
+    python -m rocketforge.utils.importreport
+    python -m rocketforge.utils.importreport rocketforge.batch --top 40
+"""
+import os
+import sys
+import argparse
+import subprocess
+from collections import defaultdict
+from tabulate import tabulate
+
+
+# Modules reported by default: the GUI and the headless tools
+DEFAULT_MODULES = ("main", "rocketforge.batch")
+# Number of modules listed per report
+DEFAULT_TOP = 25
+
+
+def import_times(module: str) -> list:
+    """
+    Imports a module in a fresh interpreter.
+
+    Returns:
+        list: (name, self time, cumulative time) of every imported module, in seconds.
+
+    Raises:
+        RuntimeError: If the import fails.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, cwd=os.getcwd()
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"Cannot import {module}:\n{proc.stderr.strip().splitlines()[-1]}")
+
+    times = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        times.append((name.strip(), int(self_us) / 1e6, int(cumulative_us) / 1e6))
+    return times
+
+
+def report(module: str, top: int = DEFAULT_TOP) -> str:
+    times = import_times(module)
+    total = max(cumulative for _, _, cumulative in times)
+
+    packages = defaultdict(float)
+    for name, self_time, _ in times:
+        packages[name.split(".")[0]] += self_time
+    package_rows = sorted(packages.items(), key=lambda row: row[1], reverse=True)[:top]
+
+    slowest = sorted(times, key=lambda row: row[2], reverse=True)[:top]
+    return (
+        f"import {module}: {total:.3f} s\n\n"
+        + tabulate(package_rows, ["Package", "Self [s]"], floatfmt=".3f")
+        + "\n\n"
+        + tabulate(slowest, ["Module", "Self [s]", "Cumulative [s]"], floatfmt=".3f")
+    )
+
+
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m rocketforge.utils.importreport", description="Report the import time of Rocket Forge modules."
+    )
+    parser.add_argument("modules", nargs="*", default=list(DEFAULT_MODULES), help="modules to import")
+    parser.add_argument("--top", type=int, default=DEFAULT_TOP, help="number of rows per table")
+    args = parser.parse_args(argv)
+
+    status = 0
+    for module in args.modules:
+        try:
+            print(report(module, args.top), end="\n\n")
+        except RuntimeError as err:
+            print(err, file=sys.stderr)
+            status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,28 @@
+import sys
+import importlib.util
+from types import ModuleType
+
+
+def lazy_import(name: str) -> ModuleType:
+    """
+    Returns a module whose code runs on its first attribute access rather
+    than now. Used for the modules that pull in heavy dependencies (rocketpy,
+    pyvista, rocketprops) from frames that are built at startup.
+
+    Parameters:
+        name (str): Absolute module name.
+
+    Returns:
+        ModuleType: The module, loaded or pending.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
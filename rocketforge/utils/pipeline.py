@@ -0,0 +1,182 @@
+import time
+import hashlib
+import tkinter as tk
+import numpy as np
+import rocketforge.performance.config as pconf
+import rocketforge.thermal.config as tconf
+import rocketforge.mission.config as mconf
+from dataclasses import dataclass, field
+from typing import Callable
+from customtkinter import CTkCheckBox, CTkComboBox, CTkEntry, CTkOptionMenu, CTkSegmentedButton, CTkSwitch
+from rocketforge.utils.logger import logger
+from rocketforge.utils.tracing import span
+
+
+# Config modules addressed by the "<module>.<field>" names of stage reads and writes
+CONFIG_MODULES = {
+    "performance": pconf,
+    "thermal": tconf,
+    "mission": mconf,
+}
+# Widgets whose value is a user input
+INPUT_WIDGETS = (CTkEntry, CTkOptionMenu, CTkComboBox, CTkCheckBox, CTkSwitch, CTkSegmentedButton)
+
+
+def fingerprint(value):
+    """
+    Returns a hashable summary of a config value. Arrays are summarized by a
+    digest of their data, objects that are not plain data (e.g. rocketpy
+    objects) by their identity.
+    """
+    if value is None or isinstance(value, (bool, int, float, complex, str)):
+        return value
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return ("ndarray", value.shape, str(value.dtype), hashlib.sha1(np.ascontiguousarray(value).tobytes()).hexdigest())
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__, tuple(fingerprint(v) for v in value))
+    if isinstance(value, dict):
+        return ("dict", tuple(sorted((str(k), fingerprint(v)) for k, v in value.items())))
+    return (type(value).__name__, id(value))
+
+
+def widget_state(*frames, exclude: tuple = ()) -> tuple:
+    """
+    Returns the values of the input widgets and Tk variables of frames and
+    their descendants, in a stable order. Widgets in `exclude` are skipped
+    together with their descendants.
+    """
+    state = []
+
+    def visit(widget, path):
+        if widget in exclude:
+            return
+        if isinstance(widget, INPUT_WIDGETS):
+            state.append((path, widget.get()))
+        for name, value in sorted(vars(widget).items()):
+            if isinstance(value, tk.Variable):
+                try:
+                    state.append((f"{path}.{name}", value.get()))
+                except tk.TclError:
+                    pass
+        for child in widget.winfo_children():
+            visit(child, f"{path}/{child.winfo_name()}")
+
+    for frame in frames:
+        visit(frame, frame.winfo_name())
+    return tuple(state)
+
+
+@dataclass
+class Stage:
+    """
+    Step of the analysis pipeline.
+
+    A stage reads the config fields listed in `reads` and the user inputs
+    returned by `inputs`, and writes the config fields listed in `writes`.
+    Fields are named "<module>.<field>", with the modules of `CONFIG_MODULES`.
+    A stage whose `enabled` returns False is skipped without restoring its
+    outputs (e.g. the stages of a tab that was never opened).
+    """
+    name: str
+    run: Callable[[], None]
+    reads: tuple = ()
+    writes: tuple = ()
+    inputs: Callable[[], tuple] = None
+    status: str = None
+    on_error: Callable[[], None] = None
+    enabled: Callable[[], bool] = None
+
+    # Cache of the last successful run
+    read_key: str = field(default=None, repr=False)
+    input_key: str = field(default=None, repr=False)
+    outputs: dict = field(default=None, repr=False)
+
+
+def _get(name: str):
+    module, attribute = name.split(".", 1)
+    return getattr(CONFIG_MODULES[module], attribute, None)
+
+
+def _set(name: str, value) -> None:
+    module, attribute = name.split(".", 1)
+    setattr(CONFIG_MODULES[module], attribute, value)
+
+
+def _key(values) -> str:
+    return hashlib.sha1(repr(fingerprint(values)).encode()).hexdigest()
+
+
+class Pipeline:
+    """
+    Incremental runner of a sequence of stages.
+
+    A stage runs only if it is dirty: if the config fields it reads differ
+    from those it read on its last run (because an upstream stage produced
+    different outputs), or if its user inputs were edited since the end of
+    the last pipeline run. A clean stage is skipped and its cached outputs
+    are written back, so that stages writing the same fields (e.g. the
+    throat area, refined by a later stage) see the values of the last run.
+    Stages must be listed in dependency order.
+    """
+
+    def __init__(self, stages: list, status: Callable[[str], None] = None):
+        self.stages = stages
+        self.status = status
+
+    def invalidate(self, name: str = None) -> None:
+        """Forces a stage (or every stage, if None) to run on the next call."""
+        for stage in self.stages:
+            if name is None or stage.name == name:
+                stage.read_key = stage.input_key = stage.outputs = None
+
+    def run(self, force: bool = False) -> list:
+        """
+        Runs the dirty stages.
+
+        Args:
+            force (bool, optional): Run every stage.
+
+        Returns:
+            list: Names of the stages that were run.
+        """
+        executed = []
+        for stage in self.stages:
+            if stage.enabled is not None and not stage.enabled():
+                continue
+            read_key = _key([_get(name) for name in stage.reads])
+            input_key = _key(stage.inputs()) if stage.inputs is not None else None
+            clean = (
+                not force and stage.outputs is not None
+                and read_key == stage.read_key and input_key == stage.input_key
+            )
+            if clean:
+                for name, value in stage.outputs.items():
+                    _set(name, value)
+                continue
+
+            if self.status is not None and stage.status is not None:
+                self.status(stage.status)
+            start = time.perf_counter()
+            try:
+                with span(stage.name, "stage"):
+                    stage.run()
+            except Exception:
+                stage.outputs = None
+                if stage.on_error is not None:
+                    stage.on_error()
+            else:
+                stage.read_key = read_key
+                stage.outputs = {name: _get(name) for name in stage.writes}
+            executed.append(stage.name)
+            logger.debug(f"Stage '{stage.name}' ran in {time.perf_counter() - start:.3f} s.")
+
+        # User inputs are compared with their state after this run, which
+        # includes the values the stages wrote into their own widgets
+        for stage in self.stages:
+            if stage.outputs is not None and stage.inputs is not None:
+                stage.input_key = _key(stage.inputs())
+        skipped = len(self.stages) - len(executed)
+        logger.info(f"Pipeline: {len(executed)} stages run, {skipped} skipped.")
+        return executed
@@ -0,0 +1,196 @@
+import os
+import json
+import time
+import functools
+import threading
+from collections import defaultdict
+from tabulate import tabulate
+from rocketforge.utils.logger import logger
+
+
+# Enables tracing: "1" writes the trace to `TRACE_PATH`, any other value is used as the output path
+TRACE_ENV = "RF_TRACE"
+TRACE_PATH = "rocketforge_trace.json"
+# Number of rows of the per-run summary table
+SUMMARY_ROWS = 20
+
+
+class _NullSpan:
+    """Span returned while tracing is disabled."""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def set(self, **args) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Span:
+    """Timed region, recorded as a complete ("X") trace event when it exits."""
+    __slots__ = ("tracer", "name", "category", "args", "start")
+
+    def __init__(self, tracer, name: str, category: str, args: dict):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+        self.start = None
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter()
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        self.tracer.record(self.name, self.category, self.start, end - self.start, self.args)
+        return False
+
+    def set(self, **args) -> None:
+        """Attaches arguments known only inside the span (e.g. a cache hit)."""
+        self.args.update(args)
+
+
+class Tracer:
+    """
+    Collector of timed spans.
+
+    While disabled, `span` returns a shared no-op context manager, so
+    instrumented code only pays for a function call. While enabled, spans are
+    buffered as Chrome trace events (viewable in chrome://tracing or
+    https://ui.perfetto.dev). Each `run` writes the trace file and logs a
+    summary table of the spans it contains.
+    """
+
+    def __init__(self):
+        value = os.environ.get(TRACE_ENV, "")
+        self.enabled = value not in ("", "0")
+        self.path = TRACE_PATH if value in ("", "0", "1") else value
+        self.events = []
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def enable(self, path: str = None) -> None:
+        self.enabled = True
+        if path is not None:
+            self.path = path
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def span(self, name: str, category: str = "", **args):
+        """Returns a context manager timing the enclosed block."""
+        if not self.enabled:
+            return _NULL_SPAN
+        return Span(self, name, category, args)
+
+    def record(self, name: str, category: str, start: float, duration: float, args: dict = None) -> None:
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": (start - self._origin) * 1e6,
+            "dur": duration * 1e6,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+        }
+        if args:
+            event["args"] = {key: _jsonable(value) for key, value in args.items()}
+        with self._lock:
+            self.events.append(event)
+
+    def run(self, name: str = "Run"):
+        """
+        Returns a context manager enclosing one run of the analysis. On exit,
+        the spans recorded since its start are summarized and exported.
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Run(self, name)
+
+    def summary(self, events: list = None) -> str:
+        """Tabulates the number of calls and the total, mean and maximum time of each span."""
+        events = self.events if events is None else events
+        totals = defaultdict(list)
+        for event in events:
+            totals[(event["cat"], event["name"])].append(event["dur"] / 1e3)
+        rows = [
+            [category, name, len(durations), sum(durations), sum(durations) / len(durations), max(durations)]
+            for (category, name), durations in totals.items()
+        ]
+        rows.sort(key=lambda row: row[3], reverse=True)
+        headers = ["Category", "Span", "Calls", "Total [ms]", "Mean [ms]", "Max [ms]"]
+        return tabulate(rows[:SUMMARY_ROWS], headers, floatfmt=".3f")
+
+    def export(self, path: str = None, events: list = None) -> str:
+        """Writes events (all recorded events by default) as a Chrome trace-event JSON file."""
+        path = path or self.path
+        with self._lock:
+            events = list(self.events if events is None else events)
+        with open(path, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+        return path
+
+    def clear(self) -> None:
+        with self._lock:
+            self.events = []
+
+
+class _Run:
+    def __init__(self, tracer: Tracer, name: str):
+        self.tracer = tracer
+        self.span = Span(tracer, name, "run", {})
+
+    def __enter__(self):
+        self.tracer.clear()
+        self.span.__enter__()
+        return self.span
+
+    def __exit__(self, *exc):
+        self.span.__exit__(*exc)
+        try:
+            path = self.tracer.export()
+            logger.info(f"Trace of '{self.span.name}' written to {path}:\n{self.tracer.summary()}")
+        except OSError as err:
+            logger.warning(f"Cannot write the trace file: {err}")
+        return False
+
+
+def _jsonable(value):
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return str(value)
+
+
+# Process-wide tracer
+tracer = Tracer()
+
+
+def span(name: str, category: str = "", **args):
+    """Times the enclosed block with the process-wide tracer."""
+    if not tracer.enabled:
+        return _NULL_SPAN
+    return Span(tracer, name, category, args)
+
+
+def traced(name: str = None, category: str = ""):
+    """Decorator timing every call of a function with the process-wide tracer."""
+    def decorator(func):
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            with Span(tracer, label, category, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator